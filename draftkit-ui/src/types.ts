@@ -16,9 +16,26 @@ export type Player = {
   p10_share?: number;
   p15_share?: number;
   p20_share?: number;
+  sim_p10?: number;
+  sim_p50?: number;
+  sim_p90?: number;
+  sim_rank_p10?: number;
+  sim_rank_p50?: number;
+  sim_rank_p90?: number;
+  sos?: number;
+  sos_rank?: number;
   round_est?: number;
   pick_in_round?: number;
+  avail?: number[];
+  latest_pick?: number | null;
   source?: 'blend' | 'override';
+  override_note?: string;
+  adp?: number | null;
+  adp_std?: number | null;
+  adp_spread?: number | null;
+  adp_gap?: number | null;
+  consensus_stdev?: number;
+  consensus_sources?: number;
 }
 
 export type Meta = {
@@ -26,9 +43,24 @@ export type Meta = {
   target_year?: number;
   lookback_years?: number[];
   blend?: number[];
+  decay?: number | null;
+  tuned?: Record<string, { blend: number[]; min_games: number }>;
   per_game?: boolean;
   min_games?: number;
   schema_version?: string;
+  slot?: number;
+  my_picks?: number[];
+  overrides?: string;
+  adp_sources?: string[];
+  projection_sources?: string[];
+  projection_weights?: Record<string, Record<string, number>>;
+  explain?: string;
+  consistency?: string[];
+  sim_seasons?: number;
+  sos?: { schedule: number; seasons: number[] };
+  weekly?: string;
+  weekly_matchups?: boolean;
+  correlations?: string;
 }
 
 // Table column meta types
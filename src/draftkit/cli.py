@@ -1,23 +1,57 @@
 from __future__ import annotations
+import hashlib
 import json
+import time
+from typing import List
 from pathlib import Path
 import typer
 from rich import print
+import numpy as np
 import pandas as pd
 
-from .connectors.nflverse import load_weekly, load_rosters
-from .connectors.schedule import load_bye_weeks, get_2025_bye_weeks
+from .connectors.nflverse import load_weekly, load_rosters, summarize_weekly
+from .connectors.schedule import OpponentMatrix, get_bye_weeks, load_schedule, opponent_matrix
 from .connectors.dst import load_dst_weekly, load_dst_rosters
 from .connectors.kicker import load_kicker_weekly, load_kicker_rosters
-from .transforms.scoring import (apply_scoring, apply_blended_scoring, ScoringConfig)
+from .connectors.adp import load_adp
+from .connectors.tensor import load_tensor_with_cache
+from .transforms.scoring import (apply_scoring, apply_blended_scoring, ScoringConfig,
+                                 blend_stat_lines, season_stat_lines, decay_weights, changed_scoring_groups,
+                                 add_weekly_points, scoring_groups)
 from .transforms.scoring_dst import apply_dst_scoring, apply_dst_blended_scoring
 from .transforms.scoring_kicker import apply_kicker_scoring, apply_kicker_blended_scoring
 from .transforms.tiers import compute_replacement_and_vorp, add_tiers_kmeans
+from .transforms.snake import snake_pick_numbers, draft_rounds
+from .transforms.availability import add_availability, adp_parameters, availability_matrix
+from .transforms.planner import plan_draft
+from .transforms.simulate import simulate_availability, position_caps, starter_needs
+from .transforms.auction import add_auction_values
+from .transforms.overrides import apply_overrides, validate_overrides
+from .transforms.names import NameIndex
+from .transforms.adp import add_adp
+from .transforms.consensus import apply_consensus, load_projection_file
+from .exports.explain import contribution_table, write_explain
+from .exports.weekly import weekly_projection_table, write_weekly
+from .transforms.backtest import run_backtest, summarize
+from .transforms.tune import load_tuned, tune_blend, tuned_stat_lines, write_tuned
+from .transforms.sweep import rank_changes, run_sweep, variant_grid
+from .transforms.consistency import CONSISTENCY_FIELDS, add_consistency, consistency_metrics
+from .transforms.correlation import team_season_correlations, teammate_pairs, write_correlations
+from .transforms.outcomes import add_outcomes, outcome_table, simulate_seasons
+from .transforms.sos import add_sos, dvp_table
 
 app = typer.Typer(help="DraftKit builder (nfl_data_py-first)")
 
-def load_with_cache(data_years: list[int], cache_dir: Path = None) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    """Load data with optional parquet caching for speed."""
+def load_with_cache(data_years: list[int], cache_dir: Path = None,
+                    summary: bool = False) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Load data with optional parquet caching for speed.
+
+    With summary=True the first frame is the player-season summary table
+    (summarize_weekly) instead of the weekly rows. It is cached as
+    summary_<year>.parquet next to weekly_<year>.parquet and rebuilt when the
+    weekly cache is newer, so warm builds never read week-level rows.
+    """
     if cache_dir:
         cache_dir.mkdir(parents=True, exist_ok=True)
     
@@ -39,14 +73,22 @@ def load_with_cache(data_years: list[int], cache_dir: Path = None) -> tuple[pd.D
             kicker_weekly_cache = cache_dir / f"kicker_weekly_{year}.parquet"
             kicker_roster_cache = cache_dir / f"kicker_rosters_{year}.parquet"
             
-            # Load weekly data
-            if weekly_cache.exists():
+            # Load weekly data (or its player-season summary)
+            summary_cache = cache_dir / f"summary_{year}.parquet"
+            if summary and summary_cache.exists() and (
+                    not weekly_cache.exists() or summary_cache.stat().st_mtime >= weekly_cache.stat().st_mtime):
+                print(f"[dim]Loading player-season summary {year} from cache...[/]")
+                weekly_year = pd.read_parquet(summary_cache)
+            elif weekly_cache.exists():
                 print(f"[dim]Loading weekly {year} from cache...[/]")
                 weekly_year = pd.read_parquet(weekly_cache)
             else:
                 print(f"[bold]Loading weekly {year} from nflverse...[/]")
                 weekly_year = load_weekly([year])
                 weekly_year.to_parquet(weekly_cache)
+            if summary and 'games' not in weekly_year.columns:  # stale or missing summary
+                weekly_year = summarize_weekly(weekly_year)
+                weekly_year.to_parquet(summary_cache)
             
             # Load roster data
             if roster_cache.exists():
@@ -94,6 +136,8 @@ def load_with_cache(data_years: list[int], cache_dir: Path = None) -> tuple[pd.D
             # No caching - load directly
             print(f"[bold]Loading weekly {year} from nflverse...[/]")
             weekly_year = load_weekly([year])
+            if summary:
+                weekly_year = summarize_weekly(weekly_year)
             print(f"[bold]Loading rosters {year} from nflverse...[/]")
             roster_year = load_rosters([year])
             print(f"[bold]Loading DST weekly {year} from nflverse...[/]")
@@ -122,8 +166,83 @@ def load_with_cache(data_years: list[int], cache_dir: Path = None) -> tuple[pd.D
     
     return weekly, rosters, dst_weekly, dst_rosters, kicker_weekly, kicker_rosters
 
-def add_snake_draft_helpers(players: list[dict], teams: int = 12) -> list[dict]:
-    """Add round_est and pick_in_round to each player based on overall_rank."""
+def load_weekly_with_cache(data_years: list[int], cache_dir: Path = None) -> pd.DataFrame:
+    """Offensive weekly stats only, through the same parquet cache as load_with_cache."""
+    frames = []
+    for year in data_years:
+        weekly_cache = cache_dir / f"weekly_{year}.parquet" if cache_dir else None
+        if weekly_cache and weekly_cache.exists():
+            frames.append(pd.read_parquet(weekly_cache))
+            continue
+        print(f"[bold]Loading weekly {year} from nflverse...[/]")
+        weekly_year = load_weekly([year])
+        if weekly_cache:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            weekly_year.to_parquet(weekly_cache)
+        frames.append(weekly_year)
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+def load_schedule_with_cache(years: list[int], cache_dir: Path = None) -> pd.DataFrame:
+    """Regular-season games for years, cached as schedule_<year>.parquet (unpublished years aren't cached)."""
+    frames = []
+    for year in years:
+        schedule_cache = cache_dir / f"schedule_{year}.parquet" if cache_dir else None
+        if schedule_cache and schedule_cache.exists():
+            frames.append(pd.read_parquet(schedule_cache))
+            continue
+        print(f"[bold]Loading schedule {year} from nflverse...[/]")
+        try:
+            schedule_year = load_schedule([year])
+        except Exception:
+            schedule_year = pd.DataFrame()
+        if schedule_cache and len(schedule_year):
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            schedule_year.to_parquet(schedule_cache)
+        frames.append(schedule_year)
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+def load_opponent_matrix(year: int, cache_dir: Path = None) -> OpponentMatrix:
+    """Team x week opponents for year, falling back to the previous season like get_bye_weeks."""
+    for season in (year, year - 1):
+        schedule = load_schedule_with_cache([season], cache_dir)
+        if len(schedule):
+            return opponent_matrix(schedule, season)
+    raise ValueError(f"No schedule for {year} or {year - 1}")
+
+POINTS_COLUMNS = ['season', 'week', 'player_id', 'position', 'recent_team', 'weekly_points']
+
+def load_weekly_points(data_years: list[int], cache_dir: Path, cfg: ScoringConfig) -> pd.DataFrame:
+    """
+    Scored player-weeks (POINTS_COLUMNS) for the offense scoring in cfg.
+
+    Cached as weekly_points_<year>_<scoring key>.parquet, so a warm build with
+    unchanged offense scoring reads six columns instead of the weekly rows.
+    """
+    key = hashlib.sha1(repr(scoring_groups(cfg)['offense']).encode()).hexdigest()[:8]
+    frames = []
+    for year in data_years:
+        points_cache = cache_dir / f"weekly_points_{year}_{key}.parquet" if cache_dir else None
+        weekly_cache = cache_dir / f"weekly_{year}.parquet" if cache_dir else None
+        if points_cache and points_cache.exists() and (
+                not weekly_cache.exists() or points_cache.stat().st_mtime >= weekly_cache.stat().st_mtime):
+            points = pd.read_parquet(points_cache)
+            if set(POINTS_COLUMNS) <= set(points.columns):
+                frames.append(points)
+                continue
+        weekly = add_weekly_points(load_weekly_with_cache([year], cache_dir), cfg)
+        points = weekly.reindex(columns=POINTS_COLUMNS).reset_index(drop=True)
+        if points_cache:
+            points.to_parquet(points_cache)
+        frames.append(points)
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+def add_snake_draft_helpers(players: list[dict], teams: int = 12, slot: int = None, rounds: int = 16) -> list[dict]:
+    """
+    Add round_est and pick_in_round to each player based on overall_rank.
+
+    With a draft slot, also add closed-form availability at each of our picks
+    (`avail`, `latest_pick`).
+    """
     for player in players:
         overall_rank = player.get('overall_rank', 0)
         if overall_rank > 0:
@@ -132,8 +251,77 @@ def add_snake_draft_helpers(players: list[dict], teams: int = 12) -> list[dict]:
         else:
             player['round_est'] = None
             player['pick_in_round'] = None
+    if slot:
+        players = add_availability(players, teams, slot, rounds)
     return players
 
+def add_draft_position_fields(players: list[dict], cfg: ScoringConfig, slot: int = None,
+                              adp_data: pd.DataFrame = None) -> list[dict]:
+    """
+    Join ADP (when given) and then add the snake-draft helpers.
+
+    The order matters: availability at our picks is modelled on `adp`/`adp_std`
+    when present, so ADP has to be on the board before add_availability runs.
+    """
+    if adp_data is not None:
+        players = add_adp(players, adp_data)
+    return add_snake_draft_helpers(players, teams=cfg.teams, slot=slot, rounds=draft_rounds(cfg))
+
+def bad_slot(slot: int, teams: int) -> bool:
+    """Print an error and return True when --slot is given but outside 1..teams."""
+    if slot is not None and not 1 <= slot <= teams:
+        print(f"[red]Error: --slot must be from 1 to {teams}, got {slot}[/]")
+        return True
+    return False
+
+def parse_onesie_discounts(text: str) -> dict[str, float]:
+    """Parse 'qb=0.90,te=1.00' into {'QB': 0.9, 'TE': 1.0}."""
+    discounts = {}
+    for pair in (text or '').split(','):
+        if '=' in pair:
+            pos_str, discount_str = pair.split('=', 1)
+            discounts[pos_str.strip().upper()] = float(discount_str.strip())
+    return discounts
+
+def resolve_blend_weights(blend: str, decay: float, lookback: int) -> list[float]:
+    """
+    Season weights (most recent first, summing to 1) from --blend or --decay;
+    defaults to 0.6/0.3/0.1 for 3 seasons, decay 0.5 otherwise. Raises ValueError.
+    """
+    if blend:
+        weights = [float(w.strip()) for w in blend.split(',')]
+        if len(weights) != lookback:
+            raise ValueError(f"blend weights ({len(weights)}) must match lookback ({lookback})")
+    elif decay is not None:
+        if not 0 < decay <= 1:
+            raise ValueError(f"--decay must be in (0, 1], got {decay}")
+        weights = decay_weights(lookback, decay)
+    elif lookback == 3:
+        weights = [0.6, 0.3, 0.1]
+    else:
+        weights = decay_weights(lookback, 0.5)
+    total = sum(weights)
+    return [w / total for w in weights]
+
+def parse_source_weights(text: str) -> dict[str, dict[str, float]]:
+    """Parse 'nflverse=1,fp=0.5,fp:qb=0.8' into {'nflverse': {'*': 1.0}, 'fp': {'*': 0.5, 'QB': 0.8}}."""
+    weights: dict[str, dict[str, float]] = {}
+    for pair in (text or '').split(','):
+        if '=' in pair:
+            key, value = pair.split('=', 1)
+            source, _, pos = key.strip().partition(':')
+            weights.setdefault(source, {})[pos.upper() or '*'] = float(value.strip())
+    return weights
+
+def file_mtimes(paths: list[Path]) -> dict[Path, float]:
+    """Modification time per path (None when the file is missing)."""
+    return {p: (p.stat().st_mtime_ns if p.exists() else None) for p in paths}
+
+def changed_files(paths: list[Path], mtimes: dict[Path, float]) -> tuple[list[Path], dict[Path, float]]:
+    """Paths whose modification time differs from `mtimes`, plus the new mtimes."""
+    current = file_mtimes(paths)
+    return [p for p in paths if current[p] != mtimes.get(p)], current
+
 def print_diagnostics(players: list[dict], cfg: ScoringConfig):
     """Print per-position replacement baselines and top-12 preview."""
     from rich.table import Table
@@ -204,45 +392,73 @@ def print_diagnostics(players: list[dict], cfg: ScoringConfig):
 def build(year: int = typer.Option(..., "--year", "-y"),
           config: Path = typer.Option(..., "--config", "-c"),
           outdir: Path = typer.Option(Path("public"), "--outdir", "-o"),
-          lookback: int = typer.Option(3, "--lookback", help="Number of historical years to use for projections"),
-          blend: str = typer.Option("0.6,0.3,0.1", "--blend", help="Comma-separated weights for blending years (most recent first)"),
+          lookback: int = typer.Option(3, "--lookback", help="Number of completed seasons before --year to project from"),
+          blend: str = typer.Option(None, "--blend", help="Comma-separated weights for blending years, most recent first (default: 0.6,0.3,0.1 for 3 seasons)"),
+          decay: float = typer.Option(None, "--decay", help="Exponential season weights instead of --blend: decay**k for the season k years back"),
+          tuned: Path = typer.Option(None, "--tuned", help="Per-position blend weights and min-games from 'draftkit tune' (overrides --lookback/--blend/--decay/--min-games)"),
+          actual: bool = typer.Option(False, "--actual", help="Score the --year season's own totals instead of projecting it"),
           per_game: bool = typer.Option(True, "--per-game/--total", help="Use per-game projections multiplied by 17 games"),
           min_games: int = typer.Option(8, "--min-games", help="Minimum games played in a season to include in projections"),
           onesie_discount: str = typer.Option("qb=0.90,te=1.00", "--onesie-discount", help="Position discount factors for single-starter positions (e.g., 'qb=0.90,te=1.00')"),
-          cache: Path = typer.Option(None, "--cache", help="Cache directory for parquet files (speeds up rebuilds)")):
+          include_bench: bool = typer.Option(False, "--include-bench", help="Fill bench slots too when setting replacement levels"),
+          cache: Path = typer.Option(None, "--cache", help="Cache directory for parquet files (speeds up rebuilds)"),
+          slot: int = typer.Option(None, "--slot", help="Your draft slot; adds availability at each of your picks"),
+          auction_budget: float = typer.Option(None, "--auction-budget", help="Per-team auction budget; adds auction_value (default: YAML auction.budget)"),
+          overrides: Path = typer.Option(None, "--overrides", help="CSV of player overrides (points or projected stat lines)"),
+          adp: List[Path] = typer.Option(None, "--adp", help="Local ADP snapshot (CSV/JSON); repeat for several sources"),
+          projections: List[Path] = typer.Option(None, "--projections", help="Season stat projections CSV to blend into a consensus; repeat for several sources"),
+          projection_weights: str = typer.Option("", "--projection-weights", help="Source weights, optionally per position (e.g. 'nflverse=1,fp=0.5,fp:qb=0.8'); sources are file stems"),
+          consistency: bool = typer.Option(False, "--consistency", help="Score player-weeks and export gp, ppg, stdev and p10/p15/p20 shares (blended like the projections)"),
+          sim_seasons: int = typer.Option(0, "--sim-seasons", help="Bootstrap this many seasons per player from past weeks; adds p10/p50/p90 points and position-rank ranges"),
+          sim_workers: int = typer.Option(1, "--sim-workers", help="Worker processes for --sim-seasons"),
+          sos: bool = typer.Option(False, "--sos", help="Strength of schedule: sos and sos_rank from prior seasons' points allowed to each position by the target year's opponents"),
+          weekly: str = typer.Option(None, "--weekly", help="Also write players x weeks projections (points per game, 0 on byes) as 'parquet' (weekly.parquet) or 'json' (weekly.json)"),
+          weekly_matchups: bool = typer.Option(False, "--weekly-matchups", help="Scale --weekly projections by defense-vs-position matchup multipliers"),
+          correlations: int = typer.Option(0, "--correlations", help="Write correlations.json with each player's N most correlated current teammates (weekly points, same-team seasons)"),
+          explain: str = typer.Option(None, "--explain", help="Also write the per-stat points breakdown as 'parquet' (explain.parquet) or 'json' (explain.json)"),
+          watch: bool = typer.Option(False, "--watch", help="Keep data loaded and rebuild when the config or overrides file changes"),
+          poll_interval: float = typer.Option(0.25, "--poll-interval", help="Seconds between file checks in --watch mode")):
     """Build players.json for the given season/year."""
     outdir.mkdir(parents=True, exist_ok=True)
+    if explain and explain not in ('parquet', 'json'):
+        print(f"[red]Error: --explain must be 'parquet' or 'json', got '{explain}'[/]")
+        return
+    if weekly and weekly not in ('parquet', 'json'):
+        print(f"[red]Error: --weekly must be 'parquet' or 'json', got '{weekly}'[/]")
+        return
+    # League settings up front, so a bad --slot fails before any data loads
+    cfg = ScoringConfig.from_yaml(config)
+    if bad_slot(slot, cfg.teams):
+        return
 
-    # Parse blend weights
-    blend_weights = [float(w.strip()) for w in blend.split(',')]
-    if len(blend_weights) != lookback:
-        print(f"[red]Error: blend weights ({len(blend_weights)}) must match lookback ({lookback})[/]")
+    # Season weights: tuned file, explicit --blend, --decay, or the default 0.6/0.3/0.1
+    tuned_params = None
+    try:
+        if tuned:
+            tuned_params = load_tuned(tuned)
+            lookback = tuned_params['lookback']
+            blend_weights = tuned_params['default']['blend']
+            min_games = int(tuned_params['default']['min_games'])
+            print(f"[bold]Tuned blend from {tuned} (lookback {lookback}, default min games {min_games})[/]")
+        else:
+            blend_weights = resolve_blend_weights(blend, decay, lookback)
+    except ValueError as e:
+        print(f"[red]Error: {e}[/]")
         return
-    
-    # Normalize weights to sum to 1.0
-    total_weight = sum(blend_weights)
-    blend_weights = [w / total_weight for w in blend_weights]
 
     # Parse onesie discount
-    onesie_discounts = {}
-    if onesie_discount:
-        for pair in onesie_discount.split(','):
-            if '=' in pair:
-                pos_str, discount_str = pair.split('=', 1)
-                pos = pos_str.strip().upper()
-                discount = float(discount_str.strip())
-                onesie_discounts[pos] = discount
-        if onesie_discounts:
-            print(f"[bold]Onesie discounts: {onesie_discounts}[/]")
+    onesie_discounts = parse_onesie_discounts(onesie_discount)
+    if onesie_discounts:
+        print(f"[bold]Onesie discounts: {onesie_discounts}[/]")
 
     # Determine which years to pull data from
-    if year == 2025:
-        # For 2025 draft prep, use recent historical data
-        data_years = list(range(2024, 2024 - lookback, -1))  # [2024, 2023, 2022] for lookback=3
+    if not actual:
+        # Draft prep: project from the previous `lookback` completed seasons
+        data_years = list(range(year - 1, year - 1 - lookback, -1))  # [2024, 2023, 2022] for 2025, lookback=3
         print(f"[bold]Preparing for {year} draft using historical data from {data_years}[/]")
-        print(f"[bold]Blend weights: {dict(zip(data_years, blend_weights))}[/]")
+        print(f"[bold]Blend weights: { {y: round(w, 4) for y, w in zip(data_years, blend_weights)} }[/]")
     else:
-        # For other years, use the requested year (ignore blending parameters)
+        # Season review: score the requested year itself (ignore blending parameters)
         data_years = [year]
         print(f"[bold]Loading data for {year} (no blending)[/]")
         per_game = False  # Don't use per-game for historical years
@@ -250,86 +466,635 @@ def build(year: int = typer.Option(..., "--year", "-y"),
     # 1) Load data (with caching if specified)
     if cache:
         print(f"[bold]Using cache directory: {cache}[/]")
-        weekly, rosters, dst_weekly, dst_rosters, kicker_weekly, kicker_rosters = load_with_cache(data_years, cache)
+        summary, rosters, dst_weekly, dst_rosters, kicker_weekly, kicker_rosters = load_with_cache(data_years, cache, summary=True)
     else:
         print(f"[bold]Loading nflverse data for {data_years} (no caching)...[/]")
-        weekly, rosters, dst_weekly, dst_rosters, kicker_weekly, kicker_rosters = load_with_cache(data_years, None)
+        summary, rosters, dst_weekly, dst_rosters, kicker_weekly, kicker_rosters = load_with_cache(data_years, None, summary=True)
     
-    print(f"[dim]Data loaded: {len(weekly)} weekly rows, {len(rosters)} roster rows, {len(dst_weekly)} DST weekly, {len(kicker_weekly)} kicker weekly[/]")
+    print(f"[dim]Data loaded: {len(summary)} player-seasons, {len(rosters)} roster rows, {len(dst_weekly)} DST weekly, {len(kicker_weekly)} kicker weekly[/]")
 
     # Load bye weeks
     print(f"[bold]Loading bye weeks for {year}...[/]")
-    if year == 2025:
-        bye_weeks = get_2025_bye_weeks()
-    else:
-        bye_weeks = load_bye_weeks(year)
+    bye_weeks = get_bye_weeks(year)
     print(f"Bye weeks loaded for {len(bye_weeks)} teams")
 
-    # 2) Load scoring config
-    cfg = ScoringConfig.from_yaml(config)
+    # Target-year opponents for strength of schedule and weekly projections
+    opponents = None
+    if sos or weekly:
+        opponents = load_opponent_matrix(year, cache)
+        print(f"Opponent matrix: {len(opponents.teams)} teams x {opponents.opponents.shape[1]} weeks ({opponents.season} schedule)")
 
-    # 3) Score players (offense + DST)
-    print("[bold]Scoring offensive players...[/]")
-    if year == 2025 and per_game:
-        players = apply_blended_scoring(weekly, rosters, cfg, data_years, blend_weights, min_games, bye_weeks)
+    # 2) Scoring inputs
+    blended = not actual and per_game
+    # Stat lines don't depend on scoring weights: aggregate once (blended per-game or season totals)
+    # from the player-season summary table
+    if blended and tuned_params:
+        positions = rosters.drop_duplicates('player_id').set_index('player_id')['position']
+        stat_lines = tuned_stat_lines(summary, data_years, tuned_params, positions)
+    elif blended:
+        stat_lines = blend_stat_lines(summary, data_years, blend_weights, min_games)
     else:
-        players = apply_scoring(weekly, rosters, cfg, bye_weeks)
+        stat_lines = season_stat_lines(summary)
 
-    print("[bold]Scoring DST units...[/]")
-    if year == 2025 and per_game:
-        dst_players = apply_dst_blended_scoring(dst_weekly, dst_rosters, cfg, data_years, blend_weights, min_games, bye_weeks)
-    else:
-        dst_players = apply_dst_scoring(dst_weekly, dst_rosters, cfg, bye_weeks)
+    # Name-only override and ADP rows are resolved against the rosters
+    name_index = NameIndex.from_rosters(rosters, kicker_rosters) if overrides or adp or projections else None
+    adp_data = None
 
-    print("[bold]Scoring kickers...[/]")
-    if year == 2025 and per_game:
-        kicker_players = apply_kicker_blended_scoring(kicker_weekly, kicker_rosters, cfg, data_years, blend_weights, min_games, bye_weeks)
-    else:
-        kicker_players = apply_kicker_scoring(kicker_weekly, kicker_rosters, cfg, bye_weeks)
+    def read_adp():
+        snapshots = [load_adp(path, cache, name_index) for path in adp]
+        data = pd.concat(snapshots, ignore_index=True)
+        for snap in snapshots:
+            unresolved = snap[snap['match_status'].isin(['ambiguous', 'missing'])]
+            print(f"[dim]ADP {snap['source'].iat[0]} ({snap['date'].iat[0]}): {len(snap)} rows, "
+                  f"{len(unresolved)} unresolved[/]")
+            for row in unresolved[unresolved['match_status'] == 'ambiguous'].itertuples():
+                print(f"[yellow]ADP name '{row.name}' is ambiguous; add a player_id[/]")
+        return data
+
+    if adp:
+        adp_data = read_adp()
 
-    # Combine offensive players, DST, and kickers
-    all_players = players + dst_players + kicker_players
-    print(f"Total players (offense + DST + K): {len(all_players)}")
+    # External projections for the consensus stage (blended builds only)
+    source_weights = parse_source_weights(projection_weights)
+    projection_data = {}
 
-    # 4) Replacement + VORP + tiers
-    print("[bold]Computing replacement, VORP, tiers...[/]")
-    all_players = compute_replacement_and_vorp(all_players, cfg, onesie_discounts)
-    all_players = add_tiers_kmeans(all_players)
+    def read_projections():
+        data = {path.stem: load_projection_file(path, name_index) for path in projections}
+        for source, df in data.items():
+            print(f"[dim]Projections {source}: {len(df)} players[/]")
+        return data
 
-    # 5) Add snake-draft helpers
-    print("[bold]Adding snake-draft helpers (round estimates)...[/]")
-    all_players = add_snake_draft_helpers(all_players, teams=cfg.teams)
+    if projections:
+        if blended:
+            projection_data = read_projections()
+        else:
+            print("[yellow]--projections only applies to blended target-year builds; ignoring[/]")
 
-    # 6) Print diagnostics
-    if year == 2025 and per_game:
-        print_diagnostics(all_players, cfg)
+    # 3) Score players (offense + DST + K); only the scorers in `groups` are rerun
+    scored = {}
 
-    # 7) Export players.json
-    outpath = outdir / "players.json"
+    def score(cfg: ScoringConfig, groups: set):
+        if 'offense' in groups:
+            print("[bold]Scoring offensive players...[/]")
+            if blended:
+                scored['offense'] = apply_blended_scoring(summary, rosters, cfg, data_years, blend_weights, min_games, bye_weeks, stat_lines)
+                scored['lines'], scored['games'] = stat_lines, 17
+                if projection_data:
+                    print(f"[bold]Blending {len(projection_data) + 1} projection sources into a consensus...[/]")
+                    scored['offense'], scored['lines'] = apply_consensus(scored['offense'], stat_lines, projection_data, cfg,
+                                                                         source_weights, bye_weeks, return_lines=True)
+                    scored['games'] = 1
+            else:
+                scored['offense'] = apply_scoring(summary, rosters, cfg, bye_weeks, stat_lines)
+                scored['lines'], scored['games'] = stat_lines, 1
+            if consistency:
+                print("[bold]Scoring player-weeks for consistency metrics...[/]")
+                points = load_weekly_points(data_years, cache, cfg)
+                scored['consistency'] = (consistency_metrics(points, data_years, blend_weights, min_games) if blended
+                                         else consistency_metrics(points, data_years, [1.0]))
+            if sim_seasons and blended:
+                print(f"[bold]Simulating {sim_seasons} seasons per player from past weeks...[/]")
+                started = time.perf_counter()
+                tensor = load_tensor_with_cache(data_years, cache, load_weekly_with_cache)
+                board = [p for p in scored['offense'] if p.get('player_id')]
+                codes = tensor.codes([p['player_id'] for p in board])
+                board = [p for p, c in zip(board, codes) if c >= 0]
+                rows, seasons = codes[codes >= 0], tensor.season_index(data_years)
+                played = tensor.played[rows][:, seasons] & tensor.regular_season(data_years)[None]
+                sims = simulate_seasons(tensor.points(cfg)[rows][:, seasons], played,
+                                        blend_weights, min_games, n_sims=sim_seasons, workers=sim_workers)
+                scored['outcomes'] = outcome_table(sims, [p['player_id'] for p in board], [p['pos'] for p in board])
+                print(f"[dim]{len(scored['outcomes'])} players simulated in {time.perf_counter() - started:.1f}s[/]")
+            if sos or (weekly and weekly_matchups):
+                print("[bold]Tabulating points allowed by defense and position...[/]")
+                weights = dict(zip(data_years, blend_weights)) if blended else {y: 1.0 for y in data_years}
+                scored['dvp'] = dvp_table(load_weekly_points(data_years, cache, cfg),
+                                          load_schedule_with_cache(data_years, cache), weights)
+            if correlations:
+                print("[bold]Correlating teammates' weekly points...[/]")
+                scored['pairs'] = team_season_correlations(load_weekly_points(data_years, cache, cfg))
+        if 'dst' in groups:
+            print("[bold]Scoring DST units...[/]")
+            if blended:
+                scored['dst'] = apply_dst_blended_scoring(dst_weekly, dst_rosters, cfg, data_years, blend_weights, min_games, bye_weeks)
+            else:
+                scored['dst'] = apply_dst_scoring(dst_weekly, dst_rosters, cfg, bye_weeks)
+        if 'kicker' in groups:
+            print("[bold]Scoring kickers...[/]")
+            if blended:
+                scored['kicker'] = apply_kicker_blended_scoring(kicker_weekly, kicker_rosters, cfg, data_years, blend_weights, min_games, bye_weeks)
+            else:
+                scored['kicker'] = apply_kicker_scoring(kicker_weekly, kicker_rosters, cfg, bye_weeks)
+
+    def export(cfg: ScoringConfig, verbose: bool = True):
+        say = print if verbose else (lambda *args, **kwargs: None)
+
+        # Combine offensive players, DST, and kickers (copies: later stages mutate)
+        all_players = [dict(p) for group in ('offense', 'dst', 'kicker') for p in scored[group]]
+        say(f"Total players (offense + DST + K): {len(all_players)}")
+        if consistency:
+            all_players = add_consistency(all_players, scored['consistency'])
+        if 'outcomes' in scored:
+            all_players = add_outcomes(all_players, scored['outcomes'])
+
+        # Manual overrides (rookies, role changes) before replacement levels
+        if overrides:
+            report = validate_overrides(overrides, all_players, name_index)
+            for warning in report.get('warnings', []):
+                say(f"[yellow]Override warning: {warning}[/]")
+            for error in report.get('errors', []):
+                print(f"[red]Override error: {error}[/]")
+        all_players = apply_overrides(all_players, overrides, cfg, bye_weeks, name_index)
+        if overrides:
+            say(f"[bold]Overrides applied to {sum(p['source'] == 'override' for p in all_players)} players[/]")
+
+        if sos:
+            all_players = add_sos(all_players, opponents, scored['dvp'])
+
+        # 4) Replacement + VORP + tiers
+        say("[bold]Computing replacement, VORP, tiers...[/]")
+        all_players = compute_replacement_and_vorp(all_players, cfg, onesie_discounts, include_bench)
+        all_players = add_tiers_kmeans(all_players)
+
+        # 5) ADP, then snake-draft helpers (availability uses ADP where the market has it)
+        if adp_data is not None:
+            say("[bold]Joining ADP (value gap vs overall rank, spread)...[/]")
+        say("[bold]Adding snake-draft helpers (round estimates)...[/]")
+        all_players = add_draft_position_fields(all_players, cfg, slot, adp_data)
+
+        budget = auction_budget or cfg.auction_budget
+        if budget:
+            say(f"[bold]Adding auction values (${budget:g} budget, ${cfg.min_bid:g} min bid)...[/]")
+            all_players = add_auction_values(all_players, cfg, budget, cfg.min_bid)
+
+        # 6) Print diagnostics
+        if blended and verbose:
+            print_diagnostics(all_players, cfg)
+
+        # 7) Export players.json
+        outpath = outdir / "players.json"
+        with outpath.open("w") as f:
+            json.dump(all_players, f, indent=2)
+        say(f"[green]Wrote {outpath}[/]")
+
+        # Per-stat contributions from the same stat lines and weights as the scoring kernel
+        if explain:
+            table = contribution_table(scored['lines'], all_players, cfg, scored['games'])
+            explain_path = write_explain(table, outdir / f"explain.{'json' if explain == 'json' else 'parquet'}")
+            say(f"[green]Wrote {explain_path} ({len(table)} players x {len(table.columns) - 2} stats)[/]")
+
+        # Weekly projections for lineup tools (bye weeks and optional matchups from the schedule)
+        if weekly:
+            weekly_table = weekly_projection_table(all_players, opponents, scored['dvp'] if weekly_matchups else None)
+            weekly_path = write_weekly(weekly_table, outdir / f"weekly.{'json' if weekly == 'json' else 'parquet'}")
+            say(f"[green]Wrote {weekly_path} ({len(weekly_table)} players x {len(weekly_table.columns) - 4} weeks)[/]")
+
+        # Teammate stacks/handcuffs, keyed by player_id
+        if correlations:
+            pairs = teammate_pairs(scored['pairs'], all_players, top=correlations)
+            corr_path = write_correlations(pairs, outdir / "correlations.json")
+            say(f"[green]Wrote {corr_path} ({len(pairs)} players with correlated teammates)[/]")
+
+        # 8) Export meta.json
+        from datetime import datetime
+        meta = {
+            "generated_at": datetime.utcnow().isoformat() + "Z",
+            "target_year": year,
+            "schema_version": "0.1.0"
+        }
+
+        if blended:
+            meta.update({
+                "lookback_years": data_years,
+                "blend": blend_weights,
+                "decay": decay,
+                "per_game": per_game,
+                "min_games": min_games
+            })
+            if tuned_params:
+                meta["tuned"] = {pos: {"blend": p["blend"], "min_games": p["min_games"]}
+                                 for pos, p in (tuned_params.get("positions") or {}).items()}
+        if budget:
+            meta.update({"auction_budget": budget, "min_bid": cfg.min_bid})
+        if overrides:
+            meta["overrides"] = str(overrides)
+        if explain:
+            meta["explain"] = explain_path.name
+        if consistency:
+            meta["consistency"] = list(CONSISTENCY_FIELDS)
+        if 'outcomes' in scored:
+            meta["sim_seasons"] = sim_seasons
+        if sos:
+            meta["sos"] = {"schedule": opponents.season, "seasons": data_years}
+        if weekly:
+            meta.update({"weekly": weekly_path.name, "weekly_matchups": weekly_matchups})
+        if correlations:
+            meta["correlations"] = corr_path.name
+        if projection_data:
+            meta["projection_sources"] = ["nflverse", *projection_data]
+            if source_weights:
+                meta["projection_weights"] = source_weights
+        if adp_data is not None:
+            meta["adp_sources"] = sorted({f"{s}@{d}" for s, d in zip(adp_data['source'], adp_data['date'])})
+        if slot:
+            meta.update({
+                "slot": slot,
+                "my_picks": snake_pick_numbers(cfg.teams, slot, draft_rounds(cfg))
+            })
+
+        meta_path = outdir / "meta.json"
+        with meta_path.open("w") as f:
+            json.dump(meta, f, indent=2)
+        say(f"[green]Wrote {meta_path}[/]")
+
+    score(cfg, {'offense', 'dst', 'kicker'})
+    export(cfg)
+    if not watch:
+        return
+
+    # 9) Watch mode: data stays loaded; rerun only the stages a change affects
+    watched = [p for p in (config, overrides, *(adp or []), *(projections if projection_data else [])) if p]
+    print(f"[bold cyan]Watching {', '.join(str(p) for p in watched)} for changes (Ctrl-C to stop)...[/]")
+    mtimes = file_mtimes(watched)
+    try:
+        while True:
+            time.sleep(poll_interval)
+            changed, mtimes = changed_files(watched, mtimes)
+            if not changed:
+                continue
+            start = time.perf_counter()
+            stages = "overrides, VORP, tiers, export"
+            groups = set()
+            if config in changed:
+                try:
+                    new_cfg = ScoringConfig.from_yaml(config)
+                except Exception as e:
+                    print(f"[red]Could not reload {config}: {e}[/]")
+                    continue
+                if bad_slot(slot, new_cfg.teams):
+                    continue
+                groups = changed_scoring_groups(cfg, new_cfg)
+                cfg = new_cfg
+                if groups:
+                    score(cfg, groups)
+                    stages = f"scoring ({', '.join(sorted(groups))}), " + stages
+            if projection_data and set(projections) & set(changed):
+                projection_data = read_projections()
+                if 'offense' not in groups:
+                    score(cfg, {'offense'})
+                    stages = "scoring (offense), " + stages
+            if adp and set(adp) & set(changed):
+                adp_data = read_adp()
+                stages = "ADP, " + stages
+            export(cfg, verbose=False)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"[green]{', '.join(p.name for p in changed)} changed: rebuilt {outdir / 'players.json'} in {elapsed:.0f} ms ({stages})[/]")
+    except KeyboardInterrupt:
+        print("[dim]Stopped watching[/]")
+
+@app.command()
+def simulate(slot: int = typer.Option(..., "--slot", help="Your draft slot (1-based)"),
+             players_path: Path = typer.Option(Path("public/players.json"), "--players", help="Exported board"),
+             config: Path = typer.Option(None, "--config", "-c", help="League YAML (teams, roster caps, rounds)"),
+             teams: int = typer.Option(12, "--teams", help="League size when no config is given"),
+             rounds: int = typer.Option(None, "--rounds", help="Draft rounds (default: from --config, else 16)"),
+             sims: int = typer.Option(2000, "--sims", help="Number of simulated drafts"),
+             adp: Path = typer.Option(None, "--adp", help="CSV with player_id,adp[,adp_std] columns"),
+             noise: float = typer.Option(0.15, "--noise", help="ADP spread as a fraction of ADP"),
+             workers: int = typer.Option(1, "--workers", help="Worker processes"),
+             seed: int = typer.Option(42, "--seed"),
+             out: Path = typer.Option(None, "--out", "-o", help="Output JSON (default: availability.json next to the board)")):
+    """Simulate mock drafts and estimate availability at each of your picks."""
+    with players_path.open() as f:
+        players = json.load(f)
+
+    caps = needs = None
+    if config:
+        cfg = ScoringConfig.from_yaml(config)
+        teams = cfg.teams
+        caps = position_caps(cfg)
+        needs = starter_needs(cfg)
+        if rounds is None:
+            rounds = draft_rounds(cfg)
+    rounds = rounds or 16
+    if bad_slot(slot, teams):
+        return
+
+    adp_map = None
+    if adp:
+        adp_df = pd.read_csv(adp)
+        adp_map = dict(zip(adp_df['player_id'], adp_df['adp']))
+        if 'adp_std' in adp_df.columns:
+            std_map = dict(zip(adp_df['player_id'], adp_df['adp_std']))
+            for p in players:
+                if p.get('player_id') in std_map:
+                    p['adp_std'] = float(std_map[p['player_id']])
+
+    print(f"[bold]Simulating {sims} drafts ({teams} teams, {rounds} rounds, slot {slot}, {workers} worker(s))...[/]")
+    probs = simulate_availability(players, teams=teams, slot=slot, rounds=rounds, n_sims=sims,
+                                  adp=adp_map, noise=noise, caps=caps, needs=needs,
+                                  workers=workers, seed=seed)
+    picks = snake_pick_numbers(teams, slot, rounds)
+
+    result = {
+        "teams": teams,
+        "slot": slot,
+        "sims": sims,
+        "picks": picks,
+        "players": [
+            {
+                "player_id": p.get('player_id'),
+                "name": p.get('name'),
+                "pos": p.get('pos'),
+                "overall_rank": p.get('overall_rank'),
+                "avail": [round(float(x), 3) for x in row],
+            }
+            for p, row in zip(players, probs)
+        ],
+    }
+    outpath = out or players_path.parent / "availability.json"
     with outpath.open("w") as f:
-        json.dump(all_players, f, indent=2)
+        json.dump(result, f)
     print(f"[green]Wrote {outpath}[/]")
-    
-    # 8) Export meta.json
-    from datetime import datetime
-    meta = {
-        "generated_at": datetime.utcnow().isoformat() + "Z",
-        "target_year": year,
-        "schema_version": "0.1.0"
-    }
-    
-    if year == 2025 and per_game:
-        meta.update({
-            "lookback_years": data_years,
-            "blend": blend_weights,
-            "per_game": per_game,
-            "min_games": min_games
-        })
-    
-    meta_path = outdir / "meta.json"
-    with meta_path.open("w") as f:
-        json.dump(meta, f, indent=2)
-    print(f"[green]Wrote {meta_path}[/]")
+
+    # Preview: likely-available targets at the first few picks
+    from rich.table import Table
+    from rich.console import Console
+    table = Table(title="Likely available (>= 50%) at your first picks")
+    table.add_column("Pick", justify="right")
+    table.add_column("Players")
+    ranked = sorted(range(len(players)), key=lambda i: players[i].get('overall_rank') or 10**6)
+    for k, pick in enumerate(picks[:4]):
+        names = [f"{players[i].get('name')} ({players[i].get('pos')} {probs[i, k]:.0%})"
+                 for i in ranked if probs[i, k] >= 0.5][:5]
+        table.add_row(str(pick), ", ".join(names))
+    Console().print(table)
+
+@app.command()
+def plan(slot: int = typer.Option(..., "--slot", help="Your draft slot (1-based)"),
+         config: Path = typer.Option(..., "--config", "-c", help="League YAML (roster slots)"),
+         players_path: Path = typer.Option(Path("public/players.json"), "--players", help="Exported board"),
+         availability: Path = typer.Option(None, "--availability", help="availability.json from 'simulate' (default: closed-form estimate)"),
+         top: int = typer.Option(5, "--top", help="Number of plans to show"),
+         beam_width: int = typer.Option(2000, "--beam-width", help="Max search states kept per round")):
+    """Search position-by-round draft plans for your slot."""
+    from rich.table import Table
+    from rich.console import Console
+
+    with players_path.open() as f:
+        players = json.load(f)
+    cfg = ScoringConfig.from_yaml(config)
+    if bad_slot(slot, cfg.teams):
+        return
+    rounds = draft_rounds(cfg)
+    picks = snake_pick_numbers(cfg.teams, slot, rounds)
+
+    if availability:
+        with availability.open() as f:
+            avail = json.load(f)
+        by_id = {row['player_id']: row['avail'] for row in avail['players']}
+        probs = np.array([by_id.get(p.get('player_id'), [1.0] * rounds) for p in players], dtype=float)
+        picks = avail['picks']
+        rounds = min(rounds, probs.shape[1])
+    else:
+        mean, sd = adp_parameters(players)
+        probs = availability_matrix(mean, sd, picks)
+
+    plans = plan_draft(players, probs, cfg, rounds=rounds, beam_width=beam_width, top_n=top)
+
+    table = Table(title=f"Best draft plans (slot {slot}, {cfg.teams} teams)")
+    table.add_column("#", style="dim", width=3)
+    table.add_column("Exp. pts", style="green", justify="right")
+    table.add_column("Plan", style="bold")
+    for i, result in enumerate(plans, start=1):
+        table.add_row(str(i), f"{result['expected_points']:.1f}", "-".join(result['plan']))
+    console = Console()
+    console.print(table)
+
+    if plans:
+        detail = Table(title="Plan #1 by pick")
+        detail.add_column("Round", justify="right")
+        detail.add_column("Pick", justify="right")
+        detail.add_column("Pos", style="cyan")
+        detail.add_column("Exp. pts", justify="right")
+        for r, (pos, value) in enumerate(zip(plans[0]['plan'], plans[0]['pick_values']), start=1):
+            detail.add_row(str(r), str(picks[r - 1]), pos, f"{value:.1f}")
+        console.print(detail)
+
+@app.command()
+def backtest(start: int = typer.Option(..., "--start", help="First target season to backtest"),
+             end: int = typer.Option(..., "--end", help="Last target season to backtest"),
+             config: Path = typer.Option(..., "--config", "-c", help="League YAML (scoring)"),
+             lookback: int = typer.Option(3, "--lookback", help="Seasons before each target to project from"),
+             blend: str = typer.Option(None, "--blend", help="Comma-separated season weights, most recent first"),
+             decay: float = typer.Option(None, "--decay", help="Exponential season weights instead of --blend"),
+             min_games: int = typer.Option(8, "--min-games", help="Minimum games for a season to count"),
+             top: int = typer.Option(24, "--top", help="Top-N projected players per position that are scored"),
+             workers: int = typer.Option(1, "--workers", help="Worker processes (one season per task)"),
+             cache: Path = typer.Option(None, "--cache", help="Cache directory for parquet files"),
+             out: Path = typer.Option(None, "--out", "-o", help="CSV with per-season, per-position results")):
+    """Project past seasons from their prior seasons and score the projections against actuals."""
+    from rich.table import Table
+    from rich.console import Console
+
+    try:
+        blend_weights = resolve_blend_weights(blend, decay, lookback)
+    except ValueError as e:
+        print(f"[red]Error: {e}[/]")
+        return
+    if end < start:
+        print(f"[red]Error: --end ({end}) is before --start ({start})[/]")
+        return
+    seasons = list(range(start, end + 1))
+    cfg = ScoringConfig.from_yaml(config)
+    weekly = load_weekly_with_cache(list(range(start - lookback, end + 1)), cache)
+
+    print(f"[bold]Backtesting {start}-{end} (lookback {lookback}, weights "
+          f"{[round(w, 3) for w in blend_weights]}, min games {min_games}, {workers} worker(s))...[/]")
+    started = time.perf_counter()
+    results = run_backtest(weekly, seasons, lookback, blend_weights, min_games, cfg, top=top, workers=workers)
+    print(f"[dim]{len(seasons)} seasons in {time.perf_counter() - started:.1f}s[/]")
+
+    if out:
+        results.to_csv(out, index=False)
+        print(f"[green]Wrote {out}[/]")
+
+    table = Table(title=f"Backtest {start}-{end}: projected top {top} per position")
+    table.add_column("Pos", style="cyan")
+    table.add_column("MAE", justify="right")
+    table.add_column("Rank corr", justify="right", style="green")
+    table.add_column(f"Top-{top} hit rate", justify="right")
+    for pos, row in summarize(results).iterrows():
+        table.add_row(pos, f"{row['mae']:.1f}", f"{row['spearman']:.3f}", f"{row['hit_rate']:.0%}")
+    Console().print(table)
+
+@app.command()
+def tune(start: int = typer.Option(..., "--start", help="First target season to fit on"),
+         end: int = typer.Option(..., "--end", help="Last target season to fit on"),
+         config: Path = typer.Option(..., "--config", "-c", help="League YAML (scoring)"),
+         lookback: int = typer.Option(3, "--lookback", help="Seasons blended per projection"),
+         min_games: str = typer.Option("4,6,8,10", "--min-games", help="Comma-separated min-games candidates"),
+         decays: str = typer.Option("0.2,0.35,0.5,0.65,0.8,1.0", "--decays", help="Comma-separated decay rates tried alongside the least-squares fit"),
+         eval_games: int = typer.Option(8, "--eval-games", help="Regular-season games a target season needs to count"),
+         cache: Path = typer.Option(None, "--cache", help="Cache directory for parquet files"),
+         out: Path = typer.Option(Path("config/tuned-blend.yml"), "--out", "-o", help="YAML for build --tuned")):
+    """Fit per-position blend weights and min-games to past seasons and write them for build."""
+    from rich.table import Table
+    from rich.console import Console
+
+    if end < start:
+        print(f"[red]Error: --end ({end}) is before --start ({start})[/]")
+        return
+    try:
+        grid = [int(x) for x in min_games.split(',') if x.strip()]
+        decay_grid = [float(x) for x in decays.split(',') if x.strip()]
+    except ValueError as e:
+        print(f"[red]Error: {e}[/]")
+        return
+    cfg = ScoringConfig.from_yaml(config)
+    weekly = load_weekly_with_cache(list(range(start - lookback, end + 1)), cache)
+    baseline = {'blend': resolve_blend_weights(None, None, lookback), 'min_games': 8}
+
+    started = time.perf_counter()
+    result = tune_blend(weekly, list(range(start, end + 1)), lookback, cfg, grid, decay_grid,
+                        eval_games=eval_games, baseline=baseline)
+    print(f"[dim]Fitted in {time.perf_counter() - started:.2f}s[/]")
+    write_tuned(result, out)
+    print(f"[green]Wrote {out}[/]")
+
+    table = Table(title=f"Tuned blend {start}-{end} (RMSE of points per game)")
+    table.add_column("Pos", style="cyan")
+    table.add_column("Weights (recent first)")
+    table.add_column("Min games", justify="right")
+    table.add_column("Method")
+    table.add_column("RMSE", justify="right", style="green")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Rows", justify="right")
+    entries = {**result['positions'], 'default': result['default']}
+    for pos, p in entries.items():
+        if not p:
+            continue
+        table.add_row(pos, ", ".join(f"{w:.2f}" for w in p['blend']), str(p['min_games']), p['method'],
+                      f"{p['rmse']:.3f}", f"{p.get('baseline_rmse', float('nan')):.3f}", str(p['n']))
+    Console().print(table)
+
+@app.command()
+def sweep(year: int = typer.Option(..., "--year", "-y", help="Target draft year (blends the seasons before it)"),
+          config: Path = typer.Option(..., "--config", "-c", help="League YAML (scoring, roster)"),
+          blend: str = typer.Option("0.6,0.3,0.1", "--blend", help="Blend weight sets separated by ';' (e.g. '0.6,0.3,0.1;0.5,0.3,0.2')"),
+          min_games: str = typer.Option("8", "--min-games", help="Comma-separated min-games values"),
+          onesie_discount: str = typer.Option("qb=0.90,te=1.00", "--onesie-discount", help="Onesie discount sets separated by ';'"),
+          teams: str = typer.Option(None, "--teams", help="Comma-separated league sizes (default: the YAML's teams)"),
+          top: int = typer.Option(100, "--top", help="Overall ranks compared against the base variant"),
+          show: int = typer.Option(20, "--show", help="Variants printed (largest rank changes first)"),
+          include_bench: bool = typer.Option(False, "--include-bench", help="Fill bench slots too when setting replacement levels"),
+          cache: Path = typer.Option(None, "--cache", help="Cache directory for parquet files"),
+          out: Path = typer.Option(None, "--out", "-o", help="CSV with the rank-change summary of every variant"),
+          ranks_out: Path = typer.Option(None, "--ranks", help="CSV with every player's overall rank per variant")):
+    """Rank the board under a grid of settings; the first value of every grid is the base variant."""
+    from rich.table import Table
+    from rich.console import Console
+
+    cfg = ScoringConfig.from_yaml(config)
+    try:
+        blends = [[float(w) for w in b.split(',')] for b in blend.split(';') if b.strip()]
+        grid_min_games = [int(m) for m in min_games.split(',') if m.strip()]
+        grid_teams = [int(t) for t in teams.split(',') if t.strip()] if teams else [cfg.teams]
+    except ValueError as e:
+        print(f"[red]Error: {e}[/]")
+        return
+    onesies = [parse_onesie_discounts(o) for o in onesie_discount.split(';')]
+    lookback = len(blends[0])
+    if any(len(b) != lookback for b in blends):
+        print("[red]Error: every --blend set needs the same number of weights[/]")
+        return
+    variants = variant_grid(blends, grid_min_games, onesies, grid_teams)
+    data_years = list(range(year - 1, year - 1 - lookback, -1))
+    print(f"[bold]Sweeping {len(variants)} variants over {data_years}...[/]")
+
+    # Load once; DST and kickers are scored once with the base blend
+    weekly, rosters, dst_weekly, dst_rosters, kicker_weekly, kicker_rosters = load_with_cache(data_years, cache)
+    base = variants[0]
+    fixed = (apply_dst_blended_scoring(dst_weekly, dst_rosters, cfg, data_years, list(base.blend), base.min_games)
+             + apply_kicker_blended_scoring(kicker_weekly, kicker_rosters, cfg, data_years, list(base.blend), base.min_games))
+
+    started = time.perf_counter()
+    players, ranks = run_sweep(weekly, rosters, data_years, cfg, variants, fixed, include_bench)
+    changes = rank_changes(players, ranks, top)
+    print(f"[dim]{len(variants)} variants in {time.perf_counter() - started:.2f}s[/]")
+
+    if out:
+        changes.to_csv(out, index=False)
+        print(f"[green]Wrote {out}[/]")
+    if ranks_out:
+        players.set_index('key').join(ranks.astype('Int64')).to_csv(ranks_out)
+        print(f"[green]Wrote {ranks_out}[/]")
+
+    table = Table(title=f"Rank changes vs {ranks.columns[0]} (top {top})")
+    table.add_column("Variant", style="cyan")
+    table.add_column("Mean |Δ|", justify="right", style="green")
+    table.add_column("Out of top", justify="right")
+    table.add_column("Biggest riser")
+    table.add_column("Biggest faller")
+    shown = changes.iloc[1:].sort_values('mean_abs', ascending=False).head(show)
+    for row in shown.itertuples():
+        table.add_row(row.variant, f"{row.mean_abs:.1f}", str(row.turnover), row.riser, row.faller)
+    Console().print(table)
+
+@app.command()
+def serve(config: Path = typer.Option(..., "--config", "-c", help="League YAML (teams, roster slots)"),
+          players_path: Path = typer.Option(Path("public/players.json"), "--players", help="Exported board"),
+          slot: int = typer.Option(None, "--slot", help="Your draft slot (enables availability at your next pick)"),
+          onesie_discount: str = typer.Option("qb=0.90,te=1.00", "--onesie-discount", help="Position discount factors, as in build"),
+          host: str = typer.Option("127.0.0.1", "--host", help="Bind address (localhost only by default)"),
+          port: int = typer.Option(8765, "--port", help="Port to listen on"),
+          auction_budget: float = typer.Option(None, "--auction-budget", help="Auction draft: per-team budget (default: YAML auction.budget)")):
+    """Serve a live draft board: POST picks/undos, stream VORP/tier/availability deltas."""
+    from .live.board import LiveBoard
+    from .live.server import create_server
+
+    with players_path.open() as f:
+        players = json.load(f)
+    cfg = ScoringConfig.from_yaml(config)
+    if bad_slot(slot, cfg.teams):
+        return
+    board = LiveBoard(players, cfg, slot=slot, onesie_discounts=parse_onesie_discounts(onesie_discount))
+    server = create_server(board, host, port, auction_budget or cfg.auction_budget)
+    print(f"[bold green]Live draft for {cfg.teams} teams x {board.rounds} rounds at http://{host}:{server.server_address[1]}[/]")
+    print("[dim]GET /board /recommendations /events /stats; POST /pick {\"player_id\": ...} /undo[/]")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("[dim]Shutting down[/]")
+    finally:
+        server.server_close()
+
+@app.command()
+def draft(config: Path = typer.Option(..., "--config", "-c", help="League YAML (teams, roster slots)"),
+          players_path: Path = typer.Option(Path("public/players.json"), "--players", help="Exported board"),
+          log_path: Path = typer.Option(Path("public/draft-log.jsonl"), "--log", help="Draft event log (replayed if it exists)"),
+          slot: int = typer.Option(None, "--slot", help="Your draft slot (enables availability at your next pick)"),
+          onesie_discount: str = typer.Option("qb=0.90,te=1.00", "--onesie-discount", help="Position discount factors, as in build")):
+    """Run a live draft in the terminal, backed by an append-only event log."""
+    from .live.board import LiveBoard
+    from .live.log import DraftLog
+    from .live.terminal import run
+
+    with players_path.open() as f:
+        players = json.load(f)
+    cfg = ScoringConfig.from_yaml(config)
+    if bad_slot(slot, cfg.teams):
+        return
+    board = LiveBoard(players, cfg, slot=slot, onesie_discounts=parse_onesie_discounts(onesie_discount))
+    try:
+        log = DraftLog(log_path, board)
+    except ValueError as e:
+        print(f"[red]Error: {e}[/]")
+        return
+    if log.events:
+        print(f"[dim]Recovered {len(log.events)} events from {log_path}[/]")
+    print("[dim]Type a player name to pick, 'h' for help, 'q' to quit[/]")
+    run(log)
 
 if __name__ == "__main__":
     app()
@@ -0,0 +1,119 @@
+from __future__ import annotations
+from datetime import date as Date
+from pathlib import Path
+import json
+import re
+
+import numpy as np
+import pandas as pd
+
+from ..transforms.names import NameIndex
+
+ADP_COLUMNS = ['player_id', 'name', 'pos', 'tm', 'adp', 'adp_std', 'adp_high', 'adp_low']
+
+# Column names used by Sleeper/FFC/FantasyPros style dumps -> ours
+COLUMN_ALIASES = {
+    'id': 'player_id', 'gsis_id': 'player_id',
+    'player': 'name', 'player_name': 'name', 'full_name': 'name',
+    'position': 'pos', 'team': 'tm',
+    'avg_pick': 'adp', 'average_pick': 'adp', 'avg': 'adp',
+    'stdev': 'adp_std', 'std': 'adp_std', 'std_dev': 'adp_std',
+    'high': 'adp_high', 'best': 'adp_high', 'min_pick': 'adp_high',
+    'low': 'adp_low', 'worst': 'adp_low', 'max_pick': 'adp_low',
+}
+
+_DATE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+
+
+def read_adp_file(path: Path) -> pd.DataFrame:
+    """
+    Read an ADP snapshot from a local CSV or JSON dump.
+
+    JSON may be a list of records, {"players": [...]}, or a mapping of id -> record.
+    Returns the ADP_COLUMNS; player_id may be blank for name-only files.
+    """
+    path = Path(path)
+    if path.suffix.lower() == '.json':
+        with path.open() as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = data.get('players', data)
+        if isinstance(data, dict):
+            data = [{'player_id': k, **v} for k, v in data.items()]
+        df = pd.DataFrame(data)
+    else:
+        df = pd.read_csv(path, dtype={'player_id': str, 'id': str, 'gsis_id': str})
+
+    df.columns = [str(c).strip().lower() for c in df.columns]
+    df = df.rename(columns={c: COLUMN_ALIASES[c] for c in df.columns
+                            if c in COLUMN_ALIASES and COLUMN_ALIASES[c] not in df.columns})
+    if 'adp' not in df.columns:
+        raise ValueError(f"{path} has no adp column")
+    for col in ADP_COLUMNS:
+        if col not in df.columns:
+            df[col] = None
+    for col in ('adp', 'adp_std', 'adp_high', 'adp_low'):
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+    df['pos'] = df['pos'].fillna('').astype(str).str.upper().replace({'DST': 'DEF', 'D/ST': 'DEF', 'PK': 'K'})
+    df['tm'] = df['tm'].fillna('').astype(str).str.upper()
+    df['name'] = df['name'].fillna('').astype(str)
+    df['player_id'] = df['player_id'].where(df['player_id'].notna() & (df['player_id'].astype(str).str.strip() != ''))
+    return df.dropna(subset=['adp'])[ADP_COLUMNS].reset_index(drop=True)
+
+
+def snapshot_key(path: Path, source: str | None = None, date: str | None = None) -> tuple[str, str]:
+    """
+    (source, date) for an ADP file: the file stem minus any YYYY-MM-DD part, and
+    that date (else the file's modification date).
+    """
+    path = Path(path)
+    found = _DATE.search(path.stem)
+    if source is None:
+        source = _DATE.sub('', path.stem).strip('_- ') or 'adp'
+    if date is None:
+        date = found.group(1) if found else Date.fromtimestamp(path.stat().st_mtime).isoformat()
+    return source, date
+
+
+def load_adp(path: Path, cache_dir: Path | None = None, index: NameIndex | None = None,
+             source: str | None = None, date: str | None = None) -> pd.DataFrame:
+    """
+    Load one ADP snapshot, resolving name-only rows to nflverse ids.
+
+    With a cache directory the resolved snapshot is stored as
+    adp_<source>_<date>.parquet and reused on later builds (until the dump
+    itself is newer than the cached copy).
+
+    Args:
+        path: CSV or JSON ADP dump
+        cache_dir: Parquet cache directory
+        index: Name index for rows without a player_id (DEF rows map to DEF-<team>)
+        source, date: Snapshot key (default: from the file name, see snapshot_key)
+
+    Returns:
+        DataFrame with ADP_COLUMNS plus source, date and match_status
+    """
+    source, date = snapshot_key(path, source, date)
+    cache_path = Path(cache_dir) / f"adp_{source}_{date}.parquet" if cache_dir else None
+    if cache_path and cache_path.exists() and cache_path.stat().st_mtime >= Path(path).stat().st_mtime:
+        return pd.read_parquet(cache_path)
+
+    df = read_adp_file(path)
+    df['match_status'] = np.where(df['player_id'].notna(), 'id', 'missing')
+    blank = df['player_id'].isna()
+    defense = blank & (df['pos'] == 'DEF') & (df['tm'] != '')
+    df.loc[defense, 'player_id'] = 'DEF-' + df.loc[defense, 'tm']
+    df.loc[defense, 'match_status'] = 'exact'
+    blank &= ~defense
+    if index is not None and blank.any():
+        matches = index.resolve_frame(df[blank])
+        df.loc[blank, 'player_id'] = matches['resolved_id']
+        df.loc[blank, 'match_status'] = matches['match_status']
+    df['source'] = source
+    df['date'] = date
+
+    if cache_path:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(cache_path)
+    return df
+
@@ -1,7 +1,10 @@
 from __future__ import annotations
+import numpy as np
 import pandas as pd
 import nfl_data_py as nfl
 
+from ..transforms.scoring import OFFENSE_STATS, PAIR_COLUMNS, STAT_PAIRS
+
 def load_weekly(years: list[int]) -> pd.DataFrame:
     # nfl.import_weekly_data returns weekly player stats across seasons
     df = nfl.import_weekly_data(years)
@@ -26,3 +29,28 @@ def load_rosters(years: list[int]) -> pd.DataFrame:
         if col not in rosters.columns:
             rosters[col] = None
     return rosters[keep].drop_duplicates(subset=['player_id'])
+
+def summarize_weekly(weekly: pd.DataFrame) -> pd.DataFrame:
+    """
+    Player-season summary of weekly offense rows, one row per (season, player_id).
+
+    Columns: season, player_id, player_name, position, recent_team (latest week),
+    games (weekly rows), the OFFENSE_STATS sums and the PAIR_COLUMNS cross-product
+    sums. Stat lines blend from the sums; weekly points moments for any scoring
+    weights follow from the cross products (scoring.summary_points).
+    """
+    if len(weekly) == 0:
+        return pd.DataFrame(columns=['season', 'player_id', 'player_name', 'position', 'recent_team',
+                                     'games', *OFFENSE_STATS, *PAIR_COLUMNS])
+    weekly = weekly.sort_values(['season', 'week'], kind='stable')
+    X = weekly.reindex(columns=OFFENSE_STATS, fill_value=0).fillna(0).to_numpy(dtype=float)
+    first = [OFFENSE_STATS.index(a) for a, _ in STAT_PAIRS]
+    second = [OFFENSE_STATS.index(b) for _, b in STAT_PAIRS]
+    values = pd.DataFrame(np.hstack([X, X[:, first] * X[:, second]]), columns=OFFENSE_STATS + PAIR_COLUMNS)
+    keys = [weekly['season'].to_numpy(), weekly['player_id'].to_numpy()]
+    sums = values.groupby(keys).sum()
+    info = weekly.reindex(columns=['player_name', 'position', 'recent_team']).groupby(keys).last()
+    games = weekly.groupby(keys).size().rename('games')
+    out = pd.concat([info, games, sums], axis=1)
+    out.index.names = ['season', 'player_id']
+    return out.reset_index()
@@ -1,10 +1,19 @@
 from __future__ import annotations
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
 import pandas as pd
 import nfl_data_py as nfl
 
+SCHEDULE_COLUMNS = ['season', 'week', 'home_team', 'away_team']
+
 def load_bye_weeks(year: int) -> dict[str, int]:
     """
     Load bye weeks for all teams in a given year.
+
+    Byes follow OpponentMatrix.bye_weeks (a team's first regular-season week
+    without a game), so they match the matrix the weekly and sos exports use.
     
     Args:
         year: Season year to get bye weeks for
@@ -12,26 +21,9 @@ def load_bye_weeks(year: int) -> dict[str, int]:
     Returns:
         Dictionary mapping team abbreviation to bye week number
     """
-    # Get schedule for the year
     sched = nfl.import_schedules([year])
-    
-    # Filter to regular season only  
-    regular_season = sched[sched['game_type'] == 'REG'].copy()
-    
-    # Get all teams
-    all_teams = set(regular_season['home_team'].unique()) | set(regular_season['away_team'].unique())
-    
-    # Find bye weeks - teams that don't play in a given week
-    bye_weeks = {}
-    for week in sorted(regular_season['week'].unique()):
-        week_games = regular_season[regular_season['week'] == week]
-        playing_teams = set(week_games['home_team'].unique()) | set(week_games['away_team'].unique())
-        bye_teams = all_teams - playing_teams
-        
-        for team in bye_teams:
-            bye_weeks[team] = week
-    
-    return bye_weeks
+    regular_season = sched.loc[sched['game_type'] == 'REG', SCHEDULE_COLUMNS]
+    return opponent_matrix(regular_season, year).bye_weeks()
 
 def get_2025_bye_weeks() -> dict[str, int]:
     """
@@ -45,3 +37,70 @@ def get_2025_bye_weeks() -> dict[str, int]:
     """
     # Use 2024 bye weeks as approximation for 2025
     return load_bye_weeks(2024)
+
+def get_bye_weeks(year: int) -> dict[str, int]:
+    """
+    Bye weeks for a target year, falling back to the previous season's byes
+    when the year's schedule isn't published yet.
+
+    Args:
+        year: Target season year
+
+    Returns:
+        Dictionary mapping team abbreviation to bye week number
+    """
+    try:
+        bye_weeks = load_bye_weeks(year)
+    except Exception:
+        bye_weeks = {}
+    return bye_weeks or load_bye_weeks(year - 1)
+
+def load_schedule(years: list[int]) -> pd.DataFrame:
+    """Regular-season games (season, week, home_team, away_team) for the given years."""
+    sched = nfl.import_schedules(years)
+    return sched.loc[sched['game_type'] == 'REG', SCHEDULE_COLUMNS].reset_index(drop=True)
+
+
+@dataclass
+class OpponentMatrix:
+    """Dense team x week opponents for one season."""
+    season: int
+    teams: np.ndarray        # team axis (abbreviations)
+    opponents: np.ndarray    # teams x weeks int16 team codes; column w - 1 is week w, -1 on byes
+
+    def team_index(self, teams: Sequence[str]) -> np.ndarray:
+        """Codes of teams on the team axis (-1 for unknown teams)."""
+        return pd.Index(self.teams).get_indexer(list(teams))
+
+    def bye_weeks(self) -> dict[str, int]:
+        """Team -> bye week (first week without a game; teams without one are left out)."""
+        byes = {}
+        for team, row in zip(self.teams, self.opponents):
+            weeks = np.flatnonzero(row < 0)
+            if len(weeks):
+                byes[team] = int(weeks[0]) + 1
+        return byes
+
+
+def opponent_matrix(schedule: pd.DataFrame, season: int,
+                    teams: Optional[Sequence[str]] = None) -> OpponentMatrix:
+    """
+    Lay one season's regular-season games out as an OpponentMatrix.
+
+    Args:
+        schedule: Rows with season, week, home_team, away_team
+        season: Season to take from schedule
+        teams: Team axis to use (default: every team in the season's games, sorted)
+    """
+    games = schedule[schedule['season'] == season]
+    if teams is None:
+        teams = sorted(set(games['home_team']) | set(games['away_team']))
+    index = pd.Index(teams)
+    n_weeks = int(games['week'].max()) if len(games) else 0
+    opponents = np.full((len(index), n_weeks), -1, dtype=np.int16)
+    home, away = index.get_indexer(games['home_team']), index.get_indexer(games['away_team'])
+    week = games['week'].to_numpy(dtype=int) - 1
+    ok = (home >= 0) & (away >= 0)
+    opponents[home[ok], week[ok]] = away[ok]
+    opponents[away[ok], week[ok]] = home[ok]
+    return OpponentMatrix(season, np.asarray(index, dtype=object), opponents)
@@ -0,0 +1,158 @@
+"""
+Dense weekly stat tensor: players x seasons x weeks x stats values with a
+played mask, cached on disk as memory-mapped .npy files.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..transforms.backtest import regular_season_weeks
+from ..transforms.scoring import OFFENSE_STATS, ScoringConfig, score_array
+
+MAX_WEEKS = 22
+
+
+@dataclass
+class WeeklyTensor:
+    """
+    Weekly rows keyed by integer player codes, so slicing a player, season or
+    week is array indexing and scoring is one matmul over the whole tensor.
+    """
+    player_ids: np.ndarray       # code -> player_id
+    positions: np.ndarray        # code -> latest position
+    seasons: np.ndarray          # season axis
+    stats: List[str]             # stat axis
+    values: np.ndarray           # players x seasons x weeks x stats, float32 (0 where not played)
+    played: np.ndarray           # players x seasons x weeks, bool
+
+    def __post_init__(self):
+        self._codes = pd.Index(self.player_ids)
+        self._seasons = pd.Index(self.seasons)
+
+    def codes(self, player_ids: Sequence[str]) -> np.ndarray:
+        """Player codes (-1 for unknown ids)."""
+        return self._codes.get_indexer(list(player_ids))
+
+    def season_index(self, seasons: Sequence[int]) -> np.ndarray:
+        """Positions of seasons on the season axis (-1 if absent)."""
+        return self._seasons.get_indexer(list(seasons))
+
+    def stat(self, name: str) -> np.ndarray:
+        """players x seasons x weeks view of one stat."""
+        return self.values[..., self.stats.index(name)]
+
+    def player(self, player_id: str, season: Optional[int] = None) -> np.ndarray:
+        """One player's seasons x weeks x stats block (weeks x stats for a single season)."""
+        code = self.codes([player_id])[0]
+        if code < 0:
+            raise KeyError(player_id)
+        if season is None:
+            return self.values[code]
+        return self.values[code, self.season_index([season])[0]]
+
+    def select(self, player_ids: Sequence[str], seasons: Sequence[int]) -> tuple[np.ndarray, np.ndarray]:
+        """(values, played) for the given players and seasons, in that order."""
+        p, s = self.codes(player_ids), self.season_index(seasons)
+        if (p < 0).any() or (s < 0).any():
+            raise KeyError("unknown player or season")
+        return self.values[np.ix_(p, s)], self.played[np.ix_(p, s)]
+
+    def games(self) -> np.ndarray:
+        """players x seasons games played."""
+        return self.played.sum(axis=2)
+
+    def regular_season(self, seasons: Sequence[int]) -> np.ndarray:
+        """seasons x weeks mask of each season's regular-season weeks (17 before 2021, 18 since)."""
+        weeks = np.arange(1, self.played.shape[2] + 1)
+        return weeks[None, :] <= np.array([regular_season_weeks(s) for s in seasons])[:, None]
+
+    def points(self, cfg: ScoringConfig) -> np.ndarray:
+        """players x seasons x weeks fantasy points (0 where not played)."""
+        return score_array(self.values, cfg, self.stats)
+
+
+def build_tensor(weekly: pd.DataFrame, seasons: Optional[Sequence[int]] = None,
+                 stats: Sequence[str] = OFFENSE_STATS) -> WeeklyTensor:
+    """Lay weekly rows (season, week, player_id, position, stats) out as a WeeklyTensor."""
+    seasons = np.array(sorted(seasons if seasons is not None else weekly['season'].unique()), dtype=int)
+    s = pd.Index(seasons).get_indexer(weekly['season'])
+    keep = (s >= 0) & weekly['week'].between(1, MAX_WEEKS).to_numpy()
+    data, s = weekly[keep], s[keep]
+    codes, ids = pd.factorize(data['player_id'])
+    w = data['week'].to_numpy(dtype=int) - 1
+    shape = (len(ids), len(seasons), MAX_WEEKS)
+
+    X = data.reindex(columns=list(stats), fill_value=0).fillna(0).to_numpy(dtype=np.float32)
+    values = np.zeros(shape + (len(stats),), dtype=np.float32)
+    np.add.at(values, (codes, s, w), X)
+    played = np.zeros(shape, dtype=bool)
+    played[codes, s, w] = True
+
+    positions = (data.assign(_code=codes).sort_values('season', kind='stable')
+                 .groupby('_code')['position'].last().reindex(range(len(ids))))
+    return WeeklyTensor(np.asarray(ids, dtype=object), positions.to_numpy(dtype=object), seasons,
+                        list(stats), values, played)
+
+
+def _paths(directory: Path, name: str) -> tuple[Path, Path, Path]:
+    directory = Path(directory)
+    return (directory / f"{name}.values.npy", directory / f"{name}.played.npy", directory / f"{name}.index.npz")
+
+
+def save_tensor(tensor: WeeklyTensor, directory: Path, name: str = 'weekly_tensor') -> Path:
+    """
+    Write the tensor's files; returns the values path.
+
+        <name>.values.npy   float32 values (memory-mapped on load)
+        <name>.played.npy   bool mask (memory-mapped on load)
+        <name>.index.npz    player_ids, positions, seasons, stats
+    """
+    values_path, played_path, index_path = _paths(directory, name)
+    values_path.parent.mkdir(parents=True, exist_ok=True)
+    np.save(values_path, np.ascontiguousarray(tensor.values))
+    np.save(played_path, np.ascontiguousarray(tensor.played))
+    np.savez(index_path, player_ids=tensor.player_ids.astype(str), positions=tensor.positions.astype(str),
+             seasons=tensor.seasons, stats=np.array(tensor.stats))
+    return values_path
+
+
+def load_tensor(directory: Path, name: str = 'weekly_tensor', mmap: bool = True) -> WeeklyTensor:
+    """Read a saved tensor; values and mask are memory-mapped read-only unless mmap=False."""
+    values_path, played_path, index_path = _paths(directory, name)
+    mode = 'r' if mmap else None
+    with np.load(index_path) as index:
+        player_ids = index['player_ids'].astype(object)
+        positions = index['positions'].astype(object)
+        seasons, stats = index['seasons'], [str(x) for x in index['stats']]
+    positions[np.isin(positions, ['None', 'nan'])] = None
+    return WeeklyTensor(player_ids, positions, seasons, stats,
+                        np.load(values_path, mmap_mode=mode), np.load(played_path, mmap_mode=mode))
+
+
+def load_tensor_with_cache(years: Sequence[int], cache_dir: Path,
+                           load_weekly: Callable[[List[int], Path], pd.DataFrame]) -> WeeklyTensor:
+    """
+    Tensor for `years`, memory-mapped from weekly_tensor_<first>_<last> in cache_dir.
+
+    Rebuilt from load_weekly(years, cache_dir) when missing, built for other
+    seasons, or older than any weekly_<year>.parquet it was built from. Without
+    a cache directory the tensor is built in memory.
+    """
+    years = sorted(years)
+    if cache_dir is None:
+        return build_tensor(load_weekly(years, None), years)
+    name = f"weekly_tensor_{years[0]}_{years[-1]}"
+    _, _, index_path = _paths(cache_dir, name)
+    sources = [Path(cache_dir) / f"weekly_{y}.parquet" for y in years]
+    if index_path.exists() and all(
+            not src.exists() or src.stat().st_mtime <= index_path.stat().st_mtime for src in sources):
+        tensor = load_tensor(cache_dir, name)
+        if list(tensor.seasons) == years:
+            return tensor
+    tensor = build_tensor(load_weekly(years, cache_dir), years)
+    save_tensor(tensor, cache_dir, name)
+    return load_tensor(cache_dir, name)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ..transforms.scoring import ScoringConfig, stat_contributions
+from .write_json import write_columnar
+
+
+def contribution_table(stat_lines: pd.DataFrame, players: list[dict], cfg: ScoringConfig,
+                       games: float = 1) -> pd.DataFrame:
+    """
+    Players x stats points breakdown for the offense players on the board.
+
+    Args:
+        stat_lines: Season stat lines behind the projections (index player_id)
+        players: Final board; rows are kept in board order
+        cfg: Scoring config (same weights as the scoring kernel)
+        games: Multiplier for per-game lines (17 for blended projections)
+
+    Returns:
+        DataFrame with player_id, one float32 column per stat (points from that stat)
+        and total (their sum; differs from the board's points for point overrides)
+    """
+    ids = [p['player_id'] for p in players if p.get('player_id') in stat_lines.index]
+    contrib = stat_contributions(stat_lines.loc[ids], cfg)
+    if games != 1:
+        contrib *= games
+    contrib = contrib.astype(np.float32)
+    contrib['total'] = contrib.sum(axis=1)
+    return contrib.rename_axis('player_id').reset_index()
+
+
+def write_explain(table: pd.DataFrame, path: Path) -> Path:
+    """Write explain.parquet, or columnar JSON ({column: [values]}) for a .json path."""
+    return write_columnar(table, path, ['player_id'])
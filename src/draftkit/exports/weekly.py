@@ -0,0 +1,45 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from ..connectors.schedule import OpponentMatrix
+from ..transforms.sos import matchup_multipliers
+from .write_json import write_columnar
+
+SEASON_GAMES = 17
+ID_COLUMNS = ['player_id', 'name', 'pos', 'tm']
+
+
+def weekly_projection_table(players: list[dict], matrix: OpponentMatrix,
+                            dvp: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """
+    Players x weeks projected points for the final board.
+
+    Each week is the player's points per game (points / 17), 0 on the team's
+    bye, times the matchup multiplier when a dvp table is given. Without
+    matchups a regular season with one bye sums back to the board's points.
+    Players whose team isn't on the schedule get their points per game every week.
+
+    Args:
+        players: Final board (any position; kickers are keyed by name)
+        matrix: Target-year OpponentMatrix
+        dvp: Optional sos.dvp_table output for matchup multipliers
+
+    Returns:
+        DataFrame with player_id, name, pos, tm and one float32 column per week (w1, w2, ...)
+    """
+    table = dvp if dvp is not None else pd.DataFrame(index=matrix.teams)
+    mult = matchup_multipliers(matrix, table, [p.get('tm') for p in players], [p.get('pos') for p in players])
+    ppg = np.array([p.get('points') or 0.0 for p in players], dtype=float) / SEASON_GAMES
+    weeks = (ppg[:, None] * mult).astype(np.float32)
+    out = pd.DataFrame({c: [p.get(c) for p in players] for c in ID_COLUMNS})
+    week_cols = pd.DataFrame(weeks, columns=[f'w{w + 1}' for w in range(weeks.shape[1])])
+    return pd.concat([out, week_cols], axis=1)
+
+
+def write_weekly(table: pd.DataFrame, path: Path) -> Path:
+    """Write weekly.parquet, or columnar JSON ({column: [values]}) for a .json path."""
+    return write_columnar(table, path, ID_COLUMNS)
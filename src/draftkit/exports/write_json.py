@@ -1 +1,24 @@
-# reserved for future file writers
+from __future__ import annotations
+from pathlib import Path
+from typing import Sequence
+import json
+
+import numpy as np
+import pandas as pd
+
+
+def write_columnar(table: pd.DataFrame, path: Path, id_columns: Sequence[str]) -> Path:
+    """
+    Write a table as parquet, or as columnar JSON ({column: [values]}) for a .json path.
+
+    JSON keeps id_columns as-is and rounds every other column to 2 decimals.
+    """
+    path = Path(path)
+    if path.suffix == '.json':
+        columns = {c: (table[c].tolist() if c in id_columns else np.round(table[c].astype(float), 2).tolist())
+                   for c in table.columns}
+        with path.open('w') as f:
+            json.dump(columns, f, separators=(',', ':'))
+    else:
+        table.to_parquet(path, index=False)
+    return path
@@ -0,0 +1,321 @@
+"""
+In-memory live draft board with incrementally updated VORP, tiers, availability
+and bye-week coverage.
+"""
+from __future__ import annotations
+from typing import Dict, List, Optional
+import numpy as np
+
+from ..transforms.slots import RosterSlot, roster_slots, fill_slots, open_slots
+from ..transforms.snake import snake_team_order, snake_pick_numbers, draft_rounds
+from ..transforms.availability import adp_parameters, availability_matrix
+from ..transforms.byes import bye_masks, coverage_gains, fill_weeks, position_codes, starter_slot_weeks
+
+LIVE_FIELDS = ('vorp', 'repl_pts', 'tier_left', 'avail_next')
+
+
+def player_key(player: Dict) -> str:
+    """Stable id for a board entry (kickers from blended scoring have no player_id)."""
+    return player.get('player_id') or f"{player.get('name')}|{player.get('pos')}|{player.get('tm')}"
+
+
+class LiveBoard:
+    """
+    Draft state plus incrementally maintained VORP, tiers and availability.
+
+    The board is loaded once into NumPy arrays. A pick or undo updates only what
+    it touches (the drafting team's open slots, league-wide open slots,
+    replacement levels, tier counters and availability at our next pick) and
+    returns a delta of the players whose live fields changed. Batch callers
+    (log replay) pass refresh=False and call sync() once at the end.
+    """
+
+    def __init__(self, players: List[Dict], cfg, slot: Optional[int] = None,
+                 onesie_discounts: Optional[Dict[str, float]] = None):
+        self.players = [dict(p) for p in players]
+        self.cfg = cfg
+        self.teams = cfg.teams
+        self.slot = slot
+        self.slots = roster_slots(cfg)
+        self.rounds = draft_rounds(cfg)
+        self.order = snake_team_order(self.teams, self.rounds)
+        self.my_picks = np.array(snake_pick_numbers(self.teams, slot, self.rounds) if slot else [], dtype=int)
+        self.discounts = onesie_discounts or {}
+
+        n = len(self.players)
+        self.ids = [player_key(p) for p in self.players]
+        self.index = {pid: i for i, pid in enumerate(self.ids)}
+        self.points = np.array([float(p.get('points') or 0.0) for p in self.players])
+        self.pos = np.array([p.get('pos') for p in self.players], dtype=object)
+        self.positions = sorted(set(self.pos))
+        # Static per-position order by points (best first)
+        self.by_pos = {pos: np.flatnonzero(self.pos == pos)[np.argsort(-self.points[self.pos == pos], kind='stable')]
+                       for pos in self.positions}
+        self.discount = np.array([self.discounts.get(p, 1.0) for p in self.pos])
+        self.bye_mask = bye_masks([p.get('bye') for p in self.players])
+        self.pos_code = position_codes(self.pos, self.positions)
+
+        tiers = [(p.get('pos'), p.get('tier')) for p in self.players]
+        self.tier_keys = sorted(set(tiers), key=str)
+        tier_code = {key: j for j, key in enumerate(self.tier_keys)}
+        self.tier = np.array([tier_code[t] for t in tiers], dtype=int)
+        self.tier_left_count = np.bincount(self.tier, minlength=len(self.tier_keys))
+
+        self.owner = np.full(n, -1, dtype=int)
+        self.history: List[tuple] = []     # (player index, team)
+        self.keepers: Dict[int, int] = {}  # player index -> team
+        self.pick_owner: Dict[int, int] = {}  # traded overall picks -> team
+        self._dirty = set()
+        self.rosters: List[List[int]] = [[] for _ in range(self.teams)]
+        self.team_open = [list(self.slots) for _ in range(self.teams)]
+        self.league_open = np.array([s.count * self.teams for s in self.slots], dtype=int)
+
+        self.mean, self.sd = adp_parameters(self.players)
+        self.repl = np.zeros(n)
+        self.vorp = np.zeros(n)
+        self.avail_next = np.ones(n)
+        self._refresh_values()
+        self._refresh_availability()
+        self._last = self._live_rows(np.arange(n))
+
+    # ------------------------------------------------------------------ state
+
+    @property
+    def pick_number(self) -> int:
+        """Overall pick currently on the clock (1-based)."""
+        return len(self.history) + 1
+
+    def team_on_clock(self) -> Optional[int]:
+        idx = len(self.history)
+        if idx >= len(self.order):
+            return None
+        return self.pick_owner.get(idx + 1, int(self.order[idx]))
+
+    def available(self) -> np.ndarray:
+        return self.owner < 0
+
+    def check_team(self, team) -> int:
+        """0-based team index; ValueError unless it is an integer in 0..teams - 1."""
+        if isinstance(team, bool) or not isinstance(team, (int, np.integer)) or not 0 <= team < self.teams:
+            raise ValueError(f"team must be an integer from 0 to {self.teams - 1}, got {team!r}")
+        return int(team)
+
+    def index_of(self, player_id: str) -> int:
+        if player_id not in self.index:
+            raise KeyError(f"Unknown player: {player_id}")
+        return self.index[player_id]
+
+    # ---------------------------------------------------------------- updates
+
+    def _refresh_team(self, team: int) -> None:
+        roster = self.rosters[team]
+        points_by_pos = {}
+        for pos in self.positions:
+            idx = [i for i in roster if self.pos[i] == pos]
+            if idx:
+                points_by_pos[pos] = np.sort(self.points[idx])[::-1]
+        old = np.array([s.count for s in self.team_open[team]], dtype=int)
+        self.team_open[team] = open_slots(points_by_pos, self.slots)
+        new = np.array([s.count for s in self.team_open[team]], dtype=int)
+        self.league_open += new - old
+
+    def _refresh_values(self) -> None:
+        """Replacement levels over the remaining pool for the remaining league slots."""
+        avail = self.available()
+        remaining = {pos: idx[avail[idx]] for pos, idx in self.by_pos.items()}
+        points_by_pos = {pos: self.points[idx] for pos, idx in remaining.items()}
+        pending = [RosterSlot(s.name, int(c), s.eligible, s.starter) for s, c in zip(self.slots, self.league_open)]
+        counts, _ = fill_slots(points_by_pos, pending, teams=1)
+        for pos, idx in remaining.items():
+            if len(idx) == 0:
+                # Pool exhausted: fall back to the position's worst projection
+                self.repl[self.by_pos[pos]] = self.points[self.by_pos[pos][-1]]
+                continue
+            j = min(max(counts.get(pos, 0) - 1, 0), len(idx) - 1)
+            self.repl[self.by_pos[pos]] = self.points[idx[j]]
+        self.vorp = np.round((self.points - self.repl) * self.discount, 2)
+
+    def _refresh_availability(self) -> None:
+        current = len(self.history)
+        upcoming = self.my_picks[self.my_picks > current + 1]
+        if len(upcoming) == 0:
+            self.avail_next = np.where(self.available(), 1.0, 0.0)
+            return
+        probs = availability_matrix(self.mean, self.sd, upcoming[:1], after_pick=current)[:, 0]
+        self.avail_next = np.where(self.available(), np.round(probs, 3), 0.0)
+
+    def _live_rows(self, idx: np.ndarray) -> Dict[int, tuple]:
+        tier_left = self.tier_left_count[self.tier]
+        return {int(i): (float(self.vorp[i]), float(self.repl[i]), int(tier_left[i]), float(self.avail_next[i]))
+                for i in idx}
+
+    def _delta(self, kind: str, index: int, team: int) -> Dict:
+        n = len(self.players)
+        current = self._live_rows(np.arange(n))
+        changed = []
+        for i, row in current.items():
+            if self._last.get(i) != row:
+                entry = {'player_id': self.ids[i]}
+                entry.update(dict(zip(LIVE_FIELDS, row)))
+                entry['drafted_by'] = int(self.owner[i]) if self.owner[i] >= 0 else None
+                changed.append(entry)
+        if not any(c['player_id'] == self.ids[index] for c in changed):
+            changed.append({'player_id': self.ids[index],
+                            'drafted_by': int(self.owner[index]) if self.owner[index] >= 0 else None})
+        self._last = current
+        return {
+            'type': kind,
+            'pick': {'player_id': self.ids[index], 'name': self.players[index].get('name'),
+                     'pos': self.players[index].get('pos'), 'team': team},
+            'pick_number': self.pick_number,
+            'on_clock': self.team_on_clock(),
+            'changed': changed,
+        }
+
+    def _assign(self, index: int, team: int) -> None:
+        self.owner[index] = team
+        self.rosters[team].append(index)
+        self.tier_left_count[self.tier[index]] -= 1
+        self._dirty.add(team)
+
+    def _release(self, index: int) -> int:
+        team = int(self.owner[index])
+        self.owner[index] = -1
+        self.rosters[team].remove(index)
+        self.tier_left_count[self.tier[index]] += 1
+        self._dirty.add(team)
+        return team
+
+    def refresh(self) -> None:
+        """Recompute open slots, replacement levels and availability after deferred updates."""
+        for team in sorted(self._dirty):
+            self._refresh_team(team)
+        self._dirty.clear()
+        self._refresh_values()
+        self._refresh_availability()
+
+    def _finish(self, kind: str, index: int, team: int, refresh: bool) -> Optional[Dict]:
+        if not refresh:
+            return None
+        self.refresh()
+        return self._delta(kind, index, team)
+
+    def sync(self) -> None:
+        """Refresh after a batch of refresh=False updates and reset the delta baseline."""
+        self.refresh()
+        self._last = self._live_rows(np.arange(len(self.players)))
+
+    def pick(self, player_id: str, team: Optional[int] = None, refresh: bool = True) -> Optional[Dict]:
+        """Draft a player (to the team on the clock unless `team` is given)."""
+        index = self.index_of(player_id)
+        if self.owner[index] >= 0:
+            raise ValueError(f"{player_id} already drafted by team {self.owner[index]}")
+        if team is None:
+            team = self.team_on_clock()
+            if team is None:
+                raise ValueError("Draft is complete")
+        team = self.check_team(team)
+        self.history.append((index, int(team)))
+        self._assign(index, int(team))
+        return self._finish('pick', index, int(team), refresh)
+
+    def undo(self, refresh: bool = True) -> Optional[Dict]:
+        """Revert the most recent pick."""
+        if not self.history:
+            raise ValueError("Nothing to undo")
+        index, team = self.history.pop()
+        self._release(index)
+        return self._finish('undo', index, team, refresh)
+
+    def keep(self, player_id: str, team: int, refresh: bool = True) -> Optional[Dict]:
+        """Assign a keeper to a team before (or outside) the pick order."""
+        index = self.index_of(player_id)
+        if self.owner[index] >= 0:
+            raise ValueError(f"{player_id} already on team {self.owner[index]}")
+        team = self.check_team(team)
+        self.keepers[index] = int(team)
+        self._assign(index, int(team))
+        return self._finish('keeper', index, int(team), refresh)
+
+    def release(self, player_id: str, refresh: bool = True) -> Optional[Dict]:
+        """Return a keeper to the pool."""
+        index = self.index_of(player_id)
+        if index not in self.keepers:
+            raise ValueError(f"{player_id} is not a keeper")
+        del self.keepers[index]
+        team = self._release(index)
+        return self._finish('release', index, team, refresh)
+
+    def move_player(self, player_id: str, team: int, refresh: bool = True) -> Optional[Dict]:
+        """Move a rostered player to another team (trade); returns the delta."""
+        index = self.index_of(player_id)
+        if self.owner[index] < 0:
+            raise ValueError(f"{player_id} is not on a roster")
+        team = self.check_team(team)
+        old = self._release(index)
+        self._assign(index, int(team))
+        if index in self.keepers:
+            self.keepers[index] = int(team)
+        return self._finish('trade', index, old, refresh)
+
+    def trade_pick(self, pick_number: int, team: int) -> int:
+        """Give overall pick `pick_number` to `team`; returns its previous owner."""
+        if not len(self.history) < pick_number <= len(self.order):
+            raise ValueError(f"Pick {pick_number} is not a future pick")
+        team = self.check_team(team)
+        previous = self.pick_owner.get(pick_number, int(self.order[pick_number - 1]))
+        if team == int(self.order[pick_number - 1]):
+            self.pick_owner.pop(pick_number, None)
+        else:
+            self.pick_owner[pick_number] = int(team)
+        return previous
+
+    # ---------------------------------------------------------------- views
+
+    def snapshot(self) -> Dict:
+        """Full board with live fields, for a client's initial load."""
+        tier_left = self.tier_left_count[self.tier]
+        players = []
+        for i, p in enumerate(self.players):
+            row = dict(p)
+            row.update({'vorp': float(self.vorp[i]), 'repl_pts': float(self.repl[i]),
+                        'tier_left': int(tier_left[i]), 'avail_next': float(self.avail_next[i]),
+                        'drafted_by': int(self.owner[i]) if self.owner[i] >= 0 else None})
+            players.append(row)
+        return {
+            'pick_number': self.pick_number,
+            'on_clock': self.team_on_clock(),
+            'slot': self.slot,
+            'picks': [{'player_id': self.ids[i], 'team': t} for i, t in self.history],
+            'keepers': [{'player_id': self.ids[i], 'team': t} for i, t in self.keepers.items()],
+            'players': players,
+        }
+
+    def bye_coverage(self, team: int) -> tuple[int, np.ndarray]:
+        """(starter slot-weeks the team's roster fills, coverage gain of every board player)."""
+        roster = np.array(self.rosters[self.check_team(team)], dtype=int)
+        coverage, open_masks = fill_weeks(self.bye_mask[roster], self.pos_code[roster], self.positions, self.slots)
+        return coverage, coverage_gains(open_masks, self.bye_mask, self.pos_code)
+
+    def coverage(self, team: int) -> Dict:
+        """A team's bye-week lineup coverage: filled and total starter slot-weeks."""
+        filled, _ = self.bye_coverage(team)
+        return {'team': team, 'coverage': filled, 'max_coverage': starter_slot_weeks(self.slots)}
+
+    def recommendations(self, n: int = 10, team: Optional[int] = None) -> List[Dict]:
+        """
+        Best available players by live VORP, with bye_gain: starter slot-weeks
+        each would add to `team` (default: ours with a slot, else the team on the clock).
+        """
+        avail = np.flatnonzero(self.available())
+        top = avail[np.argsort(-self.vorp[avail], kind='stable')][:n]
+        tier_left = self.tier_left_count[self.tier]
+        if team is None:
+            team = self.slot - 1 if self.slot else self.team_on_clock()
+        gains = self.bye_coverage(team)[1] if team is not None else np.zeros(len(self.players), dtype=int)
+        return [{'player_id': self.ids[i], 'name': self.players[i].get('name'), 'pos': self.pos[i],
+                 'points': float(self.points[i]), 'vorp': float(self.vorp[i]),
+                 'tier': self.players[i].get('tier'), 'tier_left': int(tier_left[i]),
+                 'avail_next': float(self.avail_next[i]), 'bye': self.players[i].get('bye'),
+                 'bye_gain': int(gains[i])}
+                for i in top]
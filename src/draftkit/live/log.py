@@ -0,0 +1,179 @@
+"""
+Append-only draft event log, one JSON line per draft action:
+
+    {"seq": 1, "type": "pick", "player_id": "00-0034844", "team": 0}
+    {"seq": 2, "type": "keeper", "player_id": "00-0036900", "team": 4}
+    {"seq": 3, "type": "trade", "picks": {"37": 5}, "players": {"00-0035704": 2}}
+    {"seq": 4, "type": "undo"}
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, List, Optional
+import json
+import os
+
+from .board import LiveBoard
+
+EVENT_TYPES = ('pick', 'keeper', 'trade', 'undo')
+
+
+def read_events(path: Path) -> List[Dict]:
+    """
+    Parse a log file. A bad last line (crash mid-write) is ignored; a bad line
+    followed by more events raises ValueError rather than dropping them.
+    """
+    path = Path(path)
+    if not path.exists():
+        return []
+    with path.open() as f:
+        lines = [(n, line.strip()) for n, line in enumerate(f, start=1) if line.strip()]
+    events = []
+    for i, (n, line) in enumerate(lines):
+        try:
+            events.append(json.loads(line))
+        except json.JSONDecodeError:
+            if i < len(lines) - 1:
+                raise ValueError(f"{path}:{n}: corrupt event before the end of the log")
+            break
+    return events
+
+
+class DraftLog:
+    """
+    A LiveBoard driven by an on-disk event log.
+
+    Undo is itself an event; in memory it pops a stack of applied events and
+    runs the inverse operation, O(1) in the log length. Opening a log replays it
+    with deferred board refreshes, so recovery is one pass plus one refresh.
+    """
+
+    def __init__(self, path: Optional[Path], board: LiveBoard):
+        """Open (and replay) the log at `path`; path=None keeps the log in memory only."""
+        self.path = Path(path) if path else None
+        self.board = board
+        self.events: List[Dict] = []
+        self.applied: List[tuple] = []   # (event, inverse info) for undo
+        if self.path:
+            for event in read_events(self.path):
+                self._apply(event, refresh=False)
+                self.events.append(event)
+            self.board.sync()
+            self._rewrite_if_truncated()
+
+    def _rewrite_if_truncated(self) -> None:
+        # Drop any bad trailing line so later appends start on a clean line
+        if not self.path.exists():
+            return
+        with self.path.open('rb') as f:
+            data = f.read()
+        lines = sum(1 for line in data.splitlines() if line.strip())
+        if data and (not data.endswith(b'\n') or lines != len(self.events)):
+            with self.path.open('w') as f:
+                for event in self.events:
+                    f.write(json.dumps(event) + '\n')
+
+    # ---------------------------------------------------------------- events
+
+    def _apply(self, event: Dict, refresh: bool = True) -> Optional[Dict]:
+        kind = event.get('type')
+        board = self.board
+        if kind == 'pick':
+            delta = board.pick(event['player_id'], event.get('team'), refresh=refresh)
+            if event.get('team') is None:
+                event['team'] = board.history[-1][1]
+            self.applied.append((event, None))
+            return delta
+        if kind == 'keeper':
+            delta = board.keep(event['player_id'], int(event['team']), refresh=refresh)
+            self.applied.append((event, None))
+            return delta
+        if kind == 'trade':
+            # Validate everything before the first pick or player moves
+            picks = {int(k): board.check_team(v) for k, v in (event.get('picks') or {}).items()}
+            players = {pid: board.check_team(team) for pid, team in (event.get('players') or {}).items()}
+            for pick in picks:
+                if not len(board.history) < pick <= len(board.order):
+                    raise ValueError(f"Pick {pick} is not a future pick")
+            for pid in players:
+                if board.owner[board.index_of(pid)] < 0:
+                    raise ValueError(f"{pid} is not on a roster")
+            previous_picks = {pick: board.trade_pick(pick, team) for pick, team in picks.items()}
+            previous_players = {}
+            for pid, team in players.items():
+                previous_players[pid] = int(board.owner[board.index_of(pid)])
+                board.move_player(pid, team, refresh=False)
+            self.applied.append((event, (previous_picks, previous_players)))
+            return self._trade_delta('trade', event, refresh)
+        if kind == 'undo':
+            return self._undo(refresh)
+        raise ValueError(f"Unknown event type {kind!r} (expected one of {', '.join(EVENT_TYPES)})")
+
+    def _undo(self, refresh: bool) -> Optional[Dict]:
+        if not self.applied:
+            raise ValueError("Nothing to undo")
+        event, inverse = self.applied.pop()
+        board = self.board
+        if event['type'] == 'pick':
+            return board.undo(refresh=refresh)
+        if event['type'] == 'keeper':
+            return board.release(event['player_id'], refresh=refresh)
+        previous_picks, previous_players = inverse
+        for pid, team in previous_players.items():
+            board.move_player(pid, team, refresh=False)
+        for pick, team in previous_picks.items():
+            board.trade_pick(pick, team)
+        return self._trade_delta('undo', event, refresh)
+
+    def _trade_delta(self, kind: str, event: Dict, refresh: bool) -> Optional[Dict]:
+        if not refresh:
+            return None
+        self.board.sync()
+        return {'type': kind, 'trade': event, 'pick_number': self.board.pick_number,
+                'on_clock': self.board.team_on_clock()}
+
+    def append(self, event: Dict) -> Optional[Dict]:
+        """
+        Apply an event to the board, then persist it. Invalid events raise and are
+        not written; each write is flushed and fsynced, so the file is always a
+        valid prefix of the draft.
+        """
+        event = {'seq': len(self.events) + 1, **event}
+        delta = self._apply(event)
+        if self.path:
+            with self.path.open('a') as f:
+                f.write(json.dumps(event) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+        self.events.append(event)
+        return delta
+
+    def pick(self, player_id: str, team: Optional[int] = None) -> Dict:
+        return self.append({'type': 'pick', 'player_id': player_id, 'team': team})
+
+    def keeper(self, player_id: str, team: int) -> Dict:
+        return self.append({'type': 'keeper', 'player_id': player_id, 'team': team})
+
+    def trade(self, picks: Optional[Dict[int, int]] = None, players: Optional[Dict[str, int]] = None) -> Dict:
+        """Move future picks (overall pick -> team) and/or rostered players (id -> team)."""
+        return self.append({'type': 'trade', 'picks': {str(k): v for k, v in (picks or {}).items()},
+                            'players': players or {}})
+
+    def undo(self) -> Dict:
+        return self.append({'type': 'undo'})
+
+    # ---------------------------------------------------------------- replay
+
+    def replay(self, picks: Optional[int] = None) -> LiveBoard:
+        """
+        Fresh board rebuilt from the log, stopped as soon as `picks` picks are in
+        (all events when None). The live board is untouched.
+        """
+        board = self.board
+        fresh = LiveBoard(board.players, board.cfg, slot=board.slot, onesie_discounts=board.discounts)
+        replayed = DraftLog(None, fresh)
+        for event in self.events:
+            if picks is not None and len(fresh.history) >= picks:
+                break
+            replayed._apply(dict(event), refresh=False)
+        fresh.sync()
+        return fresh
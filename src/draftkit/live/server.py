@@ -0,0 +1,266 @@
+"""
+Localhost HTTP server for a live draft.
+
+Routes (JSON in and out):
+    GET  /board              full board with live fields
+    GET  /recommendations    best available by live VORP with bye coverage gain (?n=10&team=0-based team)
+    GET  /coverage           a team's bye-week starter coverage (?team=0-based team)
+    GET  /stats              request latency percentiles (ms)
+    POST /pick               {"player_id": ..., "team": optional 0-based team}
+    POST /undo
+    POST /nominate           {"player_id": ...} -> value and inflation-adjusted value (auction)
+    POST /sale               {"player_id": ..., "team": 0-based team, "price": dollars} (auction)
+    GET  /events             Server-Sent Events stream of pick/undo deltas
+
+The board lives in memory and is guarded by one lock; every update pushes the
+delta to all connected event streams.
+"""
+from __future__ import annotations
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+from urllib.parse import urlparse, parse_qs
+import json
+import queue
+import threading
+import time
+
+import numpy as np
+
+from .board import LiveBoard, player_key
+from ..transforms.auction import AuctionTracker
+
+
+class BadRequest(Exception):
+    """Malformed or out-of-range request input (answered with 400)."""
+
+
+def int_param(value, name: str, low: int = 0, high: Optional[int] = None) -> int:
+    """Integer request field (JSON number or query string) in low..high, else BadRequest."""
+    if isinstance(value, bool) or isinstance(value, float) and not value.is_integer():
+        raise BadRequest(f"{name} must be an integer, got {value!r}")
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise BadRequest(f"{name} must be an integer, got {value!r}") from None
+    if high is not None and not low <= number <= high:
+        raise BadRequest(f"{name} must be between {low} and {high}, got {number}")
+    if number < low:
+        raise BadRequest(f"{name} must be at least {low}, got {number}")
+    return number
+
+
+def float_param(value, name: str) -> float:
+    """Finite non-negative number request field, else BadRequest."""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise BadRequest(f"{name} must be a number, got {value!r}") from None
+    if isinstance(value, bool) or not np.isfinite(number) or number < 0:
+        raise BadRequest(f"{name} must be a non-negative number, got {value!r}")
+    return number
+
+
+class DraftSession:
+    """Thread-safe wrapper around a LiveBoard with event fan-out and latency stats."""
+
+    def __init__(self, board: LiveBoard, auction: AuctionTracker = None, latency_window: int = 5000):
+        self.board = board
+        self.auction = auction
+        self.lock = threading.Lock()
+        self.subscribers: List[queue.Queue] = []
+        self.latencies = deque(maxlen=latency_window)
+
+    def subscribe(self) -> queue.Queue:
+        q = queue.Queue()
+        with self.lock:
+            self.subscribers.append(q)
+        return q
+
+    def unsubscribe(self, q: queue.Queue) -> None:
+        with self.lock:
+            if q in self.subscribers:
+                self.subscribers.remove(q)
+
+    def publish(self, delta: dict) -> None:
+        for q in list(self.subscribers):
+            q.put(delta)
+
+    def pick(self, player_id: str, team=None) -> dict:
+        with self.lock:
+            delta = self.board.pick(player_id, team)
+        self.publish(delta)
+        return delta
+
+    def undo(self) -> dict:
+        with self.lock:
+            last = self.board.ids[self.board.history[-1][0]] if self.board.history else None
+            delta = self.board.undo()
+            if self.auction and self.auction.history and self.auction.history[-1][0] == last:
+                delta['auction'] = self.auction.undo()
+        self.publish(delta)
+        return delta
+
+    def nominate(self, player_id: str) -> dict:
+        if not self.auction:
+            raise ValueError("Not an auction draft (start with --auction-budget)")
+        with self.lock:
+            return self.auction.nominate(player_id)
+
+    def sale(self, player_id: str, team: int, price: float) -> dict:
+        if not self.auction:
+            raise ValueError("Not an auction draft (start with --auction-budget)")
+        with self.lock:
+            sold = self.auction.sell(player_id, team, price)
+            try:
+                delta = self.board.pick(player_id, team)
+            except (KeyError, ValueError):
+                self.auction.undo()
+                raise
+            delta['auction'] = sold
+        self.publish(delta)
+        return delta
+
+    def stats(self) -> dict:
+        lat = np.array(self.latencies) if self.latencies else np.zeros(1)
+        return {
+            'requests': len(self.latencies),
+            'p50_ms': round(float(np.percentile(lat, 50)), 3),
+            'p99_ms': round(float(np.percentile(lat, 99)), 3),
+            'max_ms': round(float(lat.max()), 3),
+        }
+
+
+def make_handler(session: DraftSession):
+    """Request handler class bound to a draft session."""
+
+    class DraftHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):  # keep the terminal quiet
+            pass
+
+        def _send(self, status: int, payload) -> None:
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _body(self) -> dict:
+            length = int(self.headers.get('Content-Length') or 0)
+            if not length:
+                return {}
+            return json.loads(self.rfile.read(length) or b'{}')
+
+        def do_OPTIONS(self):
+            self.send_response(204)
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+            self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == '/events':
+                return self._stream()
+            start = time.perf_counter()
+            query = parse_qs(url.query)
+            last_team = session.board.teams - 1
+            try:
+                if url.path == '/board':
+                    with session.lock:
+                        payload = session.board.snapshot()
+                elif url.path == '/recommendations':
+                    n = int_param(query.get('n', ['10'])[0], 'n')
+                    team = int_param(query['team'][0], 'team', 0, last_team) if 'team' in query else None
+                    with session.lock:
+                        payload = session.board.recommendations(n, team)
+                elif url.path == '/coverage':
+                    team = int_param(query['team'][0], 'team', 0, last_team) if 'team' in query else None
+                    with session.lock:
+                        team = session.board.team_on_clock() if team is None else team
+                        if team is None:
+                            raise BadRequest("team is required once the draft is complete")
+                        payload = session.board.coverage(team)
+                elif url.path == '/stats':
+                    payload = session.stats()
+                else:
+                    return self._send(404, {'error': f"Unknown route {url.path}"})
+            except BadRequest as e:
+                return self._send(400, {'error': str(e)})
+            self._send(200, payload)
+            session.latencies.append((time.perf_counter() - start) * 1000)
+
+        def do_POST(self):
+            start = time.perf_counter()
+            url = urlparse(self.path)
+            last_team = session.board.teams - 1
+            try:
+                body = self._body()
+                if not isinstance(body, dict):
+                    raise BadRequest("Request body must be a JSON object")
+                if url.path == '/pick':
+                    if 'player_id' not in body:
+                        return self._send(400, {'error': "Missing player_id"})
+                    team = body.get('team')
+                    team = None if team is None else int_param(team, 'team', 0, last_team)
+                    payload = session.pick(body['player_id'], team)
+                elif url.path == '/undo':
+                    payload = session.undo()
+                elif url.path == '/nominate':
+                    payload = session.nominate(body.get('player_id'))
+                elif url.path == '/sale':
+                    if not {'player_id', 'team', 'price'} <= body.keys():
+                        return self._send(400, {'error': "Sale needs player_id, team and price"})
+                    payload = session.sale(body['player_id'], int_param(body['team'], 'team', 0, last_team),
+                                           float_param(body['price'], 'price'))
+                else:
+                    return self._send(404, {'error': f"Unknown route {url.path}"})
+            except (BadRequest, json.JSONDecodeError, UnicodeDecodeError, TypeError) as e:
+                return self._send(400, {'error': str(e)})
+            except KeyError as e:
+                return self._send(404, {'error': str(e.args[0]) if e.args else str(e)})
+            except ValueError as e:
+                return self._send(409, {'error': str(e)})
+            self._send(200, payload)
+            session.latencies.append((time.perf_counter() - start) * 1000)
+
+        def _stream(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            q = session.subscribe()
+            try:
+                while True:
+                    try:
+                        delta = q.get(timeout=15)
+                        message = f"event: {delta['type']}\ndata: {json.dumps(delta)}\n\n"
+                    except queue.Empty:
+                        message = ": keep-alive\n\n"
+                    self.wfile.write(message.encode())
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            finally:
+                session.unsubscribe(q)
+
+    return DraftHandler
+
+
+def create_server(board: LiveBoard, host: str = '127.0.0.1', port: int = 8765,
+                  auction_budget: float = None) -> ThreadingHTTPServer:
+    """Build (but do not start) the HTTP server; port 0 picks a free port."""
+    auction = None
+    if auction_budget:
+        auction = AuctionTracker(board.players, board.cfg, auction_budget, board.cfg.min_bid, key_fn=player_key)
+    session = DraftSession(board, auction)
+    server = ThreadingHTTPServer((host, port), make_handler(session))
+    server.daemon_threads = True
+    server.session = session
+    return server
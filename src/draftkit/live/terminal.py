@@ -0,0 +1,165 @@
+"""
+Terminal live-draft mode (`draftkit draft`).
+
+Reads commands from the prompt, writes them to the draft log and re-renders the
+recommendations from the in-memory board. Teams are shown 1-based.
+
+Commands:
+    <name>                 pick for the team on the clock
+    k <team> <name>        keeper
+    tp <pick> <team>       trade an overall pick to a team
+    tr <team> <name>       trade a rostered player to a team
+    u                      undo the last event
+    r <n>                  show the board as it stood after n picks
+    h                      help
+    q                      quit
+"""
+from __future__ import annotations
+from typing import List, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+from .board import LiveBoard
+from .log import DraftLog
+
+HELP = __doc__.split("Commands:")[1]
+
+
+class CommandError(Exception):
+    pass
+
+
+def find_players(board: LiveBoard, query: str, rostered: Optional[bool] = False) -> List[int]:
+    """
+    Board indices matching an id or a case-insensitive name fragment.
+
+    rostered=False searches the available pool, True only rostered players, None everyone.
+    """
+    query = query.strip()
+    if query in board.index:
+        return [board.index[query]]
+    q = query.lower()
+    matches = []
+    for i, p in enumerate(board.players):
+        if rostered is not None and (board.owner[i] >= 0) != rostered:
+            continue
+        name = (p.get('name') or '').lower()
+        if name == q:
+            return [i]
+        if q in name:
+            matches.append(i)
+    return sorted(matches, key=lambda i: -board.points[i])
+
+
+def _one(board: LiveBoard, query: str, rostered: Optional[bool] = False) -> str:
+    matches = find_players(board, query, rostered)
+    if not matches:
+        raise CommandError(f"No player matches '{query}'")
+    if len(matches) > 1:
+        names = ", ".join(f"{board.players[i].get('name')} ({board.pos[i]} {board.players[i].get('tm')})"
+                          for i in matches[:6])
+        raise CommandError(f"'{query}' is ambiguous: {names}")
+    return board.ids[matches[0]]
+
+
+def _team(board: LiveBoard, text: str) -> int:
+    team = int(text) - 1
+    if not 0 <= team < board.teams:
+        raise CommandError(f"Team must be 1-{board.teams}")
+    return team
+
+
+def handle_command(log: DraftLog, text: str) -> Optional[str]:
+    """Apply one command; returns a status message (None for quit)."""
+    board = log.board
+    parts = text.strip().split()
+    if not parts:
+        return ""
+    cmd, args = parts[0].lower(), parts[1:]
+    try:
+        if cmd in ('q', 'quit', 'exit'):
+            return None
+        if cmd in ('h', 'help', '?'):
+            return HELP
+        if cmd in ('u', 'undo'):
+            log.undo()
+            return "Undid last event"
+        if cmd == 'k' and len(args) >= 2:
+            team = _team(board, args[0])
+            pid = _one(board, " ".join(args[1:]))
+            log.keeper(pid, team)
+            return f"Keeper: {board.players[board.index[pid]].get('name')} -> team {team + 1}"
+        if cmd == 'tp' and len(args) == 2:
+            team = _team(board, args[1])
+            log.trade(picks={int(args[0]): team})
+            return f"Pick {args[0]} -> team {team + 1}"
+        if cmd == 'tr' and len(args) >= 2:
+            team = _team(board, args[0])
+            pid = _one(board, " ".join(args[1:]), rostered=True)
+            log.trade(players={pid: team})
+            return f"Traded {board.players[board.index[pid]].get('name')} -> team {team + 1}"
+        if cmd == 'r' and len(args) == 1:
+            past = log.replay(int(args[0]))
+            return f"After {len(past.history)} picks: " + ", ".join(
+                f"{r['name']} ({r['pos']} {r['vorp']:.1f})" for r in past.recommendations(5))
+        query = " ".join(args) if cmd == 'p' else text
+        pid = _one(board, query)
+        on_clock = board.team_on_clock()
+        log.pick(pid)
+        return f"Pick {len(board.history)}: team {on_clock + 1} takes {board.players[board.index[pid]].get('name')}"
+    except CommandError as e:
+        return f"[yellow]{e}[/]"
+    except (KeyError, ValueError) as e:
+        return f"[red]{e.args[0] if e.args else e}[/]"
+
+
+def render(board: LiveBoard, console: Console, top: int = 15) -> None:
+    """Draw the on-the-clock header, recommendations and our roster."""
+    team = board.team_on_clock()
+    rnd = (len(board.history) // board.teams) + 1
+    header = (f"[bold]Pick {board.pick_number}[/] (round {rnd}) - team {team + 1} on the clock"
+              if team is not None else "[bold green]Draft complete[/]")
+    if board.slot and team == board.slot - 1:
+        header += " [bold green](you)[/]"
+    console.print(header)
+
+    table = Table(title="Best available")
+    table.add_column("#", style="dim", justify="right")
+    table.add_column("Player", style="bold")
+    table.add_column("Pos", style="cyan")
+    table.add_column("Tm")
+    table.add_column("Pts", justify="right")
+    table.add_column("VORP", justify="right", style="green")
+    table.add_column("Tier (left)", justify="right")
+    table.add_column("Next pick", justify="right")
+    table.add_column("Bye", justify="right")
+    table.add_column("Cov+", justify="right")
+    for i, rec in enumerate(board.recommendations(top), start=1):
+        table.add_row(str(i), rec['name'] or '', rec['pos'], str(board.players[board.index[rec['player_id']]].get('tm') or ''),
+                      f"{rec['points']:.1f}", f"{rec['vorp']:.1f}", f"{rec['tier']} ({rec['tier_left']})",
+                      f"{rec['avail_next']:.0%}" if board.slot else "-", str(rec['bye'] or ''), str(rec['bye_gain']))
+    console.print(table)
+
+    if board.slot:
+        mine = board.rosters[board.slot - 1]
+        if mine:
+            roster = ", ".join(f"{board.players[i].get('name')} ({board.pos[i]})" for i in mine)
+            console.print(f"[bold]Your roster:[/] {roster}")
+
+
+def run(log: DraftLog, console: Optional[Console] = None) -> None:
+    """Interactive loop; every command is persisted before the board is redrawn."""
+    console = console or Console()
+    render(log.board, console)
+    while True:
+        try:
+            text = console.input("[bold cyan]draft> [/]")
+        except (EOFError, KeyboardInterrupt):
+            break
+        message = handle_command(log, text)
+        if message is None:
+            break
+        if message:
+            console.print(message)
+        render(log.board, console)
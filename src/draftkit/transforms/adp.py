@@ -0,0 +1,104 @@
+"""
+ADP enrichment for the exported board: adp, adp_std, adp_spread and adp_gap
+from one or more ADP snapshots (see connectors/adp.py).
+"""
+from __future__ import annotations
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .names import normalize_name
+
+ADP_FIELDS = ('adp', 'adp_std', 'adp_spread', 'adp_gap')
+
+
+def _name_keys(names, positions, teams=None) -> List[str]:
+    if teams is None:
+        return [f"{normalize_name(n)}|{p}" for n, p in zip(names, positions)]
+    return [f"{normalize_name(n)}|{p}|{t}" for n, p, t in zip(names, positions, teams)]
+
+
+def add_adp(players: List[Dict], adp: pd.DataFrame) -> List[Dict]:
+    """
+    Join ADP snapshots onto the board.
+
+    Board keys are interned once (player_id, or normalized name|pos|team for
+    players exported without an id, e.g. kickers) and ADP rows are mapped to
+    board codes by id, then name|pos|team, then name|pos. Fields set:
+
+        adp         mean ADP across sources
+        adp_std     reported standard deviation (averaged), else the spread of
+                    ADP between sources
+        adp_spread  latest minus earliest pick seen across sources (high/low
+                    columns when the source has them); None for a single source
+                    without high/low, where the spread is unknown rather than 0
+        adp_gap     adp - overall_rank; positive means the market drafts the
+                    player later than our rank (value), negative earlier (reach)
+
+    Args:
+        players: Board after ranking (player dicts with overall_rank)
+        adp: Concatenated snapshots (player_id, name, pos, tm, adp, adp_std,
+            adp_high, adp_low, source)
+
+    Returns:
+        players with ADP_FIELDS set (None when no source lists the player)
+    """
+    if not players:
+        return players
+    names = [p.get('name') for p in players]
+    positions = [p.get('pos') for p in players]
+    board_keys = [p.get('player_id') or key for p, key in
+                  zip(players, _name_keys(names, positions, [p.get('tm') for p in players]))]
+    interned = pd.Index(pd.unique(pd.Series(board_keys)))
+    board_code = interned.get_indexer(board_keys)
+    # name|pos -> code of its first board row, for ADP rows without an id or team match
+    loose = pd.Series(board_code, index=_name_keys(names, positions))
+    loose = loose[~loose.index.duplicated()]
+
+    adp = adp.dropna(subset=['adp']).reset_index(drop=True)
+    code = interned.get_indexer(adp['player_id'].fillna('').astype(str)) if len(adp) else np.array([], dtype=int)
+    missing = code < 0
+    if missing.any():
+        code[missing] = interned.get_indexer(_name_keys(adp['name'][missing], adp['pos'][missing], adp['tm'][missing]))
+        missing = code < 0
+    if missing.any():
+        code[missing] = loose.reindex(_name_keys(adp['name'][missing], adp['pos'][missing])).fillna(-1).to_numpy(int)
+    rows = adp.assign(code=code)
+    rows = rows[rows['code'] >= 0]
+    source = rows['source'] if 'source' in rows else 'adp'
+    rows = rows.assign(source=source).drop_duplicates(['source', 'code'])
+
+    lo = rows[['adp', 'adp_high', 'adp_low']].min(axis=1)
+    hi = rows[['adp', 'adp_high', 'adp_low']].max(axis=1)
+    ranged = rows[['adp_high', 'adp_low']].notna().any(axis=1)
+    g = rows.assign(lo=lo, hi=hi, ranged=ranged).groupby('code')
+    stats = pd.DataFrame({
+        'adp': g['adp'].mean(),
+        'reported_std': g['adp_std'].mean(),
+        'source_std': g['adp'].std(ddof=0).where(g['adp'].count() > 1),
+        'spread': (g['hi'].max() - g['lo'].min()).where((g['adp'].count() > 1) | g['ranged'].any()),
+    })
+
+    n = len(interned)
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    spread = np.full(n, np.nan)
+    codes = stats.index.to_numpy()
+    mean[codes] = stats['adp'].to_numpy()
+    std[codes] = stats['reported_std'].fillna(stats['source_std']).to_numpy()
+    spread[codes] = stats['spread'].to_numpy()
+
+    rank = np.array([p.get('overall_rank') or np.nan for p in players], dtype=float)
+    mean, std, spread = mean[board_code], std[board_code], spread[board_code]
+    gap = mean - rank
+
+    def value(x: float, digits: int = 1) -> Optional[float]:
+        return None if np.isnan(x) else round(float(x), digits)
+
+    for p, m, s, sp, gp in zip(players, mean, std, spread, gap):
+        p['adp'] = value(m)
+        p['adp_std'] = value(s, 2)
+        p['adp_spread'] = value(sp)
+        p['adp_gap'] = value(gp)
+    return players
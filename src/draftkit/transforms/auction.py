@@ -0,0 +1,167 @@
+"""
+Auction dollar values and live inflation.
+"""
+from __future__ import annotations
+from typing import Dict, List, Optional
+import numpy as np
+
+from .slots import replacement_counts
+from .snake import draft_rounds
+
+
+def auction_values(points: np.ndarray, pos: np.ndarray, cfg, budget: float = 200,
+                   min_bid: float = 1, roster_size: Optional[int] = None) -> np.ndarray:
+    """
+    Dollar value per player in one vectorized pass.
+
+    Points above the league-wide starter replacement level (the VORP slot
+    allocator) share the money left after every rostered spot, bench included,
+    gets the minimum bid:
+
+        value = min_bid + surplus / sum(surplus) * (teams * budget - teams * roster_size * min_bid)
+
+    for the teams * roster_size players who get rostered.
+
+    Args:
+        points: Projected points per player
+        pos: Position per player
+        cfg: ScoringConfig (teams, roster, bench)
+        budget: Budget per team
+        min_bid: Minimum bid
+        roster_size: Players per team (default: starters + bench)
+
+    Returns:
+        Array of dollar values (0 for players nobody rosters).
+    """
+    points = np.asarray(points, dtype=float)
+    pos = np.asarray(pos, dtype=object)
+    roster_size = roster_size or draft_rounds(cfg)
+
+    order = np.argsort(-points, kind='stable')
+    sorted_pos = pos[order]
+    points_by_pos = {p: points[order][sorted_pos == p] for p in np.unique(pos)}
+    starters = replacement_counts(points_by_pos, cfg)
+    counts = replacement_counts(points_by_pos, cfg, include_bench=True)
+
+    # Rank within position, and the starter replacement level for each player's position
+    rank = np.empty(len(points), dtype=int)
+    repl = np.zeros(len(points))
+    for p, pts in points_by_pos.items():
+        idx = order[sorted_pos == p]
+        rank[idx] = np.arange(len(idx))
+        n = starters.get(p, 0)
+        repl[idx] = pts[min(max(n - 1, 0), len(pts) - 1)] if len(pts) else 0.0
+    rostered = rank < np.array([counts.get(p, 0) for p in pos])
+
+    surplus = np.where(rostered, np.clip(points - repl, 0.0, None), 0.0)
+    spendable = cfg.teams * (budget - roster_size * min_bid)
+    total = surplus.sum()
+    share = surplus / total * spendable if total > 0 else surplus
+    return np.where(rostered, np.round(min_bid + share, 1), 0.0)
+
+
+def add_auction_values(players: List[Dict], cfg, budget: float = 200, min_bid: float = 1,
+                       roster_size: Optional[int] = None) -> List[Dict]:
+    """Add `auction_value` ($) to each player dict."""
+    if not players:
+        return players
+    points = np.array([float(p.get('points') or 0.0) for p in players])
+    pos = np.array([p.get('pos') for p in players], dtype=object)
+    values = auction_values(points, pos, cfg, budget, min_bid, roster_size)
+    for player, value in zip(players, values):
+        player['auction_value'] = float(value)
+    return players
+
+
+class AuctionTracker:
+    """Running league money and surplus value for O(1) inflation updates."""
+
+    def __init__(self, players: List[Dict], cfg, budget: float = 200, min_bid: float = 1,
+                 roster_size: Optional[int] = None, key_fn=None):
+        key_fn = key_fn or (lambda p: p.get('player_id'))
+        self.teams = cfg.teams
+        self.budget = budget
+        self.min_bid = min_bid
+        self.roster_size = roster_size or draft_rounds(cfg)
+        if players and 'auction_value' in players[0]:
+            self.values = np.array([float(p.get('auction_value') or 0.0) for p in players])
+        else:
+            points = np.array([float(p.get('points') or 0.0) for p in players])
+            pos = np.array([p.get('pos') for p in players], dtype=object)
+            self.values = auction_values(points, pos, cfg, budget, min_bid, self.roster_size)
+        self.index = {key_fn(p): i for i, p in enumerate(players)}
+        self.surplus = np.clip(self.values - min_bid, 0.0, None)
+
+        self.money_left = float(self.teams * budget)
+        self.spots_left = self.teams * self.roster_size
+        self.surplus_left = float(self.surplus.sum())
+        self.team_money = [float(budget)] * self.teams
+        self.team_spots = [self.roster_size] * self.teams
+        self.sold = {}
+        self.history: List[tuple] = []   # (player_id, player index, team, price)
+
+    @property
+    def inflation(self) -> float:
+        """Dollars available above min bids per dollar of surplus value left."""
+        if self.surplus_left <= 0:
+            return 1.0
+        return (self.money_left - self.min_bid * self.spots_left) / self.surplus_left
+
+    def inflated_value(self, index: int) -> float:
+        return round(self.min_bid + self.surplus[index] * self.inflation, 1) if self.values[index] > 0 else 0.0
+
+    def check_team(self, team) -> int:
+        """0-based team index; ValueError unless it is an integer in 0..teams - 1."""
+        if isinstance(team, bool) or not isinstance(team, (int, np.integer)) or not 0 <= team < self.teams:
+            raise ValueError(f"team must be an integer from 0 to {self.teams - 1}, got {team!r}")
+        return int(team)
+
+    def max_bid(self, team: int) -> float:
+        """Most a team can bid while still filling its roster at the minimum."""
+        team = self.check_team(team)
+        spots = self.team_spots[team]
+        return self.team_money[team] - self.min_bid * max(spots - 1, 0) if spots > 0 else 0.0
+
+    def nominate(self, player_id: str) -> Dict:
+        """Value and inflation-adjusted value for a nominated player."""
+        i = self.index[player_id]
+        if i in self.sold:
+            raise ValueError(f"{player_id} already sold")
+        return {'player_id': player_id, 'value': float(self.values[i]),
+                'inflated_value': self.inflated_value(i), 'inflation': round(self.inflation, 4)}
+
+    def sell(self, player_id: str, team: int, price: float) -> Dict:
+        """Record a sale and update the running totals."""
+        i = self.index[player_id]
+        if i in self.sold:
+            raise ValueError(f"{player_id} already sold")
+        team = self.check_team(team)
+        if price < self.min_bid or price > self.max_bid(team):
+            raise ValueError(f"Bid {price} outside [{self.min_bid}, {self.max_bid(team)}] for team {team}")
+        self._apply(i, team, price, +1)
+        self.history.append((player_id, i, team, price))
+        return self._state(player_id, team, price)
+
+    def undo(self) -> Dict:
+        """Revert the most recent sale."""
+        if not self.history:
+            raise ValueError("Nothing to undo")
+        player_id, i, team, price = self.history.pop()
+        self._apply(i, team, price, -1)
+        return self._state(player_id, team, price)
+
+    def _apply(self, i: int, team: int, price: float, sign: int) -> None:
+        self.money_left -= sign * price
+        self.spots_left -= sign
+        self.surplus_left -= sign * self.surplus[i]
+        self.team_money[team] -= sign * price
+        self.team_spots[team] -= sign
+        if sign > 0:
+            self.sold[i] = (team, price)
+        else:
+            self.sold.pop(i, None)
+
+    def _state(self, player_id: str, team: int, price: float) -> Dict:
+        return {'player_id': player_id, 'team': team, 'price': price,
+                'inflation': round(self.inflation, 4), 'money_left': self.money_left,
+                'team_money': self.team_money[team], 'team_max_bid': self.max_bid(team)}
@@ -0,0 +1,99 @@
+"""
+Closed-form pick-availability estimates: P(player still on the board) at each
+pick, with draft position modelled as Normal(mean, sd) or logistic.
+"""
+from __future__ import annotations
+from typing import Dict, List, Sequence, Tuple
+import numpy as np
+import pandas as pd
+
+from .snake import snake_pick_numbers
+
+LOGISTIC_SCALE = np.sqrt(3.0) / np.pi  # logistic scale with unit variance
+
+
+def adp_parameters(players: List[Dict], spread_frac: float = 0.2,
+                   min_sd: float = 1.5) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Draft-position mean and spread per player.
+
+    Uses `adp` / `adp_std` when present on the board, else `overall_rank` and tier width:
+    players inside one tier are roughly interchangeable, so their draft order is
+    uncertain by about the tier's rank span.
+    """
+    if not players:
+        return np.zeros(0), np.zeros(0)
+    df = pd.DataFrame({
+        'rank': [p.get('overall_rank') or (i + 1) for i, p in enumerate(players)],
+        'pos': [p.get('pos') for p in players],
+        'tier': [p.get('tier') for p in players],
+        'adp': [p.get('adp') for p in players],
+        'adp_std': [p.get('adp_std') for p in players],
+    })
+    df['rank'] = df['rank'].astype(float)
+    df['adp'] = pd.to_numeric(df['adp'], errors='coerce')
+    df['adp_std'] = pd.to_numeric(df['adp_std'], errors='coerce')
+
+    mean = df['adp'].fillna(df['rank']).to_numpy()
+
+    # Tier span: rank range of the player's (pos, tier) group
+    grouped = df.fillna({'tier': -1}).groupby(['pos', 'tier'])['rank']
+    span = (grouped.transform('max') - grouped.transform('min')).to_numpy()
+    fallback_sd = np.sqrt((spread_frac * mean) ** 2 + span ** 2 / 12.0)
+
+    sd = df['adp_std'].to_numpy()
+    sd = np.where(np.isnan(sd), fallback_sd, sd)
+    return mean, np.maximum(sd, min_sd)
+
+
+def _cdf(z: np.ndarray, method: str) -> np.ndarray:
+    if method == 'normal':
+        from scipy.special import ndtr
+        return ndtr(z)
+    if method == 'logit':
+        return 1.0 / (1.0 + np.exp(-z / LOGISTIC_SCALE))
+    raise ValueError(f"Unknown availability method: {method}")
+
+
+def availability_matrix(mean: np.ndarray, sd: np.ndarray, picks: Sequence[int],
+                        method: str = 'normal', after_pick: int = 0) -> np.ndarray:
+    """
+    P(player still available at each pick) as a (players, picks) array.
+
+    Args:
+        mean: Draft-position means
+        sd: Draft-position spreads
+        picks: Overall pick numbers (1-based)
+        method: 'normal' or 'logit' CDF
+        after_pick: Condition on the player having survived this many picks
+                    (live drafts); 0 = pre-draft
+    """
+    picks = np.asarray(picks, dtype=float)
+    # Drafted before pick k <=> draft position < k - 0.5 (continuity correction)
+    survive = _cdf((mean[:, None] - (picks[None, :] - 0.5)) / sd[:, None], method)
+    if after_pick > 0:
+        base = _cdf((mean - (after_pick + 0.5)) / sd, method)
+        survive = np.where(picks[None, :] > after_pick,
+                           survive / np.maximum(base, 1e-12)[:, None], 1.0)
+    return np.clip(survive, 0.0, 1.0)
+
+
+def add_availability(players: List[Dict], teams: int, slot: int, rounds: int = 16,
+                     method: str = 'normal', threshold: float = 0.5) -> List[Dict]:
+    """
+    Add availability at each of our picks to every player.
+
+    Adds `avail` (probabilities per own pick) and `latest_pick` (our last pick at which
+    the player is still at least `threshold` likely to be there, or None).
+    """
+    picks = snake_pick_numbers(teams, slot, rounds)
+    mean, sd = adp_parameters(players)
+    probs = availability_matrix(mean, sd, picks, method)
+
+    ok = probs >= threshold
+    # Availability is non-increasing in pick number, so the last ok column is ok.sum()-1
+    last_idx = ok.sum(axis=1) - 1
+    for player, row, idx in zip(players, probs, last_idx):
+        player['avail'] = [round(float(x), 3) for x in row]
+        player['latest_pick'] = int(picks[idx]) if idx >= 0 else None
+    return players
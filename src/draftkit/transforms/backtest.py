@@ -0,0 +1,130 @@
+"""
+Historical backtest of the blended projections against each past season's
+actual regular-season points.
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from scipy.stats import spearmanr
+
+from .scoring import OFFENSE_POS, ScoringConfig, blend_stat_lines, score_stats, season_stat_lines
+
+EXPANDED_SEASON = 2021  # first 18-week, 17-game regular season
+
+_weekly: Optional[pd.DataFrame] = None
+
+
+def _init_worker(weekly: pd.DataFrame) -> None:
+    global _weekly
+    _weekly = weekly
+
+
+def regular_season_weeks(season: int) -> int:
+    """Weeks in the season's regular season (17 before 2021, 18 since)."""
+    return 18 if season >= EXPANDED_SEASON else 17
+
+
+def season_games(season: int) -> int:
+    """Games per team in the season's regular season (16 before 2021, 17 since)."""
+    return regular_season_weeks(season) - 1
+
+
+def regular_season_mask(weekly: pd.DataFrame) -> np.ndarray:
+    """True for the weekly rows inside their own season's regular season."""
+    cutoff = np.where(weekly['season'].to_numpy(dtype=int) >= EXPANDED_SEASON, 18, 17)
+    return weekly['week'].to_numpy(dtype=int) <= cutoff
+
+
+def position_metrics(frame: pd.DataFrame, top: int) -> Dict[str, float]:
+    """MAE, Spearman and top-N hit rate for one position (columns proj, actual)."""
+    projected = frame.nlargest(top, 'proj')
+    finishers = set(frame.nlargest(top, 'actual').index)
+    rho = spearmanr(projected['proj'], projected['actual']).correlation if len(projected) > 2 else np.nan
+    return {
+        'n': len(projected),
+        'mae': float((projected['proj'] - projected['actual']).abs().mean()),
+        'spearman': float(rho),
+        'hit_rate': len(finishers & set(projected.index)) / max(len(projected), 1),
+    }
+
+
+def season_metrics(weekly: pd.DataFrame, season: int, lookback: int, blend_weights: List[float],
+                   min_games: int, cfg: ScoringConfig, top: int = 24) -> List[Dict]:
+    """
+    Backtest one target season.
+
+    Offensive players are projected from the `lookback` prior seasons exactly
+    as `build` does (blend_stat_lines scored and scaled to the season's games)
+    and compared over the top-N projected players per position:
+
+        mae       mean absolute error of projected vs actual points
+        spearman  rank correlation of projected vs actual points
+        hit_rate  share of the projected top N that finished in the actual top N
+
+    Returns one row per position (plus 'ALL', pooled over positions) with
+    season, pos, n, mae, spearman and hit_rate.
+    """
+    data_years = list(range(season - 1, season - 1 - lookback, -1))
+    lines = blend_stat_lines(weekly, data_years, blend_weights, min_games)
+    proj = pd.Series(score_stats(lines * season_games(season), cfg), index=lines.index)
+
+    current = weekly[(weekly['season'] == season) & (weekly['week'] <= regular_season_weeks(season))]
+    actual_lines = season_stat_lines(current)
+    actual = pd.Series(score_stats(actual_lines, cfg), index=actual_lines.index)
+
+    # Latest known position: the target season's, else the most recent one projected from
+    known = weekly[weekly['season'] <= season].sort_values('season')
+    positions = known.groupby('player_id')['position'].last()
+
+    ids = proj.index.union(actual.index)
+    frame = pd.DataFrame({
+        'proj': proj.reindex(ids),          # NaN: not projected (e.g. rookies)
+        'actual': actual.reindex(ids, fill_value=0.0),  # 0: projected but never played
+        'pos': positions.reindex(ids),
+    })
+    frame = frame[frame['pos'].isin(OFFENSE_POS)]
+
+    rows = []
+    for pos, group in frame.groupby('pos'):
+        rows.append({'season': season, 'pos': pos, **position_metrics(group, top)})
+    pooled = pd.concat([g.nlargest(top, 'proj') for _, g in frame.groupby('pos')])
+    all_row = position_metrics(pooled, len(pooled))
+    all_row['hit_rate'] = float(np.average([r['hit_rate'] for r in rows], weights=[r['n'] for r in rows]))
+    rows.append({'season': season, 'pos': 'ALL', **all_row})
+    return rows
+
+
+def _run_season(job) -> List[Dict]:
+    return season_metrics(_weekly, *job)
+
+
+def run_backtest(weekly: pd.DataFrame, seasons: List[int], lookback: int, blend_weights: List[float],
+                 min_games: int, cfg: ScoringConfig, top: int = 24, workers: int = 1) -> pd.DataFrame:
+    """
+    Backtest every season in `seasons` (each needs its `lookback` prior seasons in weekly).
+
+    Seasons are independent, so they run in a process pool; the weekly data is
+    handed to each worker once (pool initializer) and shared by all its seasons.
+
+    Returns:
+        DataFrame with one row per season and position: season, pos, n, mae, spearman, hit_rate
+    """
+    needed = {y for s in seasons for y in range(s - lookback, s + 1)}
+    weekly = weekly[weekly['season'].isin(needed)]
+    jobs = [(season, lookback, blend_weights, min_games, cfg, top) for season in seasons]
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(weekly,)) as pool:
+            results = list(pool.map(_run_season, jobs))
+    else:
+        results = [season_metrics(weekly, *job) for job in jobs]
+    return pd.DataFrame([row for rows in results for row in rows])
+
+
+def summarize(results: pd.DataFrame) -> pd.DataFrame:
+    """Mean metrics per position across seasons (ALL last)."""
+    summary = results.groupby('pos')[['mae', 'spearman', 'hit_rate']].mean()
+    order = sorted(p for p in summary.index if p != 'ALL') + (['ALL'] if 'ALL' in summary.index else [])
+    return summary.loc[order]
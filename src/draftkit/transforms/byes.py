@@ -0,0 +1,93 @@
+"""
+Bye-week roster coverage: the starter slot-weeks a roster fills, and how many
+more each candidate would fill. Byes are bitmasks (bit w - 1 for a week-w bye).
+"""
+from __future__ import annotations
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .slots import RosterSlot
+
+SEASON_WEEKS = 17  # fantasy season: weeks 1-17
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.int64)
+
+
+def bye_masks(byes: Sequence[Optional[int]]) -> np.ndarray:
+    """uint32 bitmask per player with bit (bye - 1) set; 0 when the bye is unknown."""
+    weeks = np.array([b if isinstance(b, (int, np.integer)) and 1 <= b <= 32 else 0 for b in byes], dtype=np.int64)
+    return np.where(weeks > 0, np.left_shift(1, np.maximum(weeks - 1, 0)), 0).astype(np.uint32)
+
+
+def popcount(x: np.ndarray) -> np.ndarray:
+    """Set bits per element of a uint32 array."""
+    x = np.asarray(x, dtype=np.uint32)
+    return sum(_POPCOUNT[(x >> shift) & 0xFF] for shift in (0, 8, 16, 24))
+
+
+def season_mask(weeks: int = SEASON_WEEKS) -> int:
+    """Bits for weeks 1..weeks."""
+    return (1 << weeks) - 1
+
+
+def fill_weeks(masks: np.ndarray, pos_codes: np.ndarray, positions: Sequence[str], slots: List[RosterSlot],
+               weeks: int = SEASON_WEEKS) -> tuple[int, np.ndarray]:
+    """
+    Fill the starting slots in every week from a roster's players.
+
+    Slots are filled narrowest eligibility first, one vector op per slot across
+    all weeks at once.
+
+    Args:
+        masks: Bye bitmasks of the rostered players
+        pos_codes: Their positions as indexes into `positions` (-1 for others)
+        positions: Position axis of the returned open masks
+        slots: Roster slots (non-starters are ignored)
+
+    Returns:
+        (coverage, open_masks): starter slot-weeks filled, and per position a
+        bitmask of weeks with an empty slot that position could fill
+    """
+    bits = (masks[:, None] >> np.arange(weeks, dtype=np.uint32)[None, :]) & 1
+    playing = (bits == 0).astype(int)
+    counts = np.zeros((len(positions), weeks), dtype=int)
+    known = pos_codes >= 0
+    np.add.at(counts, pos_codes[known], playing[known])
+
+    code = {pos: j for j, pos in enumerate(positions)}
+    open_weeks = np.zeros((len(positions), weeks), dtype=bool)
+    coverage = 0
+    for slot in sorted((s for s in slots if s.starter), key=lambda s: len(s.eligible)):
+        need = np.full(weeks, slot.count, dtype=int)
+        eligible = [code[pos] for pos in slot.eligible if pos in code]
+        for j in eligible:
+            take = np.minimum(counts[j], need)
+            counts[j] -= take
+            need -= take
+        coverage += int((slot.count - need).sum())
+        open_weeks[eligible] |= need > 0
+    open_masks = (open_weeks.astype(np.uint32) << np.arange(weeks, dtype=np.uint32)[None, :]).sum(axis=1)
+    return coverage, open_masks.astype(np.uint32)
+
+
+def coverage_gains(open_masks: np.ndarray, masks: np.ndarray, pos_codes: np.ndarray,
+                   weeks: int = SEASON_WEEKS) -> np.ndarray:
+    """
+    Starter slot-weeks each player would add to the roster behind open_masks (0 for unknown positions).
+
+    The gain is popcount(open[pos] & ~bye & season), so the whole board is
+    scored without refilling a roster per candidate.
+    """
+    candidate_open = np.where(pos_codes >= 0, open_masks[np.maximum(pos_codes, 0)], 0).astype(np.uint32)
+    return popcount(candidate_open & ~masks & np.uint32(season_mask(weeks)))
+
+
+def starter_slot_weeks(slots: List[RosterSlot], weeks: int = SEASON_WEEKS) -> int:
+    """Starter slot-weeks a full-coverage roster fills."""
+    return sum(s.count for s in slots if s.starter) * weeks
+
+
+def position_codes(pos: Sequence[str], positions: Sequence[str]) -> np.ndarray:
+    """Indexes of pos into positions (-1 for others)."""
+    code: Dict[str, int] = {p: j for j, p in enumerate(positions)}
+    return np.array([code.get(p, -1) for p in pos], dtype=int)
@@ -0,0 +1,187 @@
+"""
+Multi-source projection consensus: a weighted stat-level blend of draftkit's
+own lines and local projection exports, with a source-disagreement measure.
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+
+import numpy as np
+import pandas as pd
+
+from .names import NameIndex
+from .scoring import OFFENSE_POS, OFFENSE_STATS, ScoringConfig, stat_weights
+
+logger = logging.getLogger(__name__)
+
+NFLVERSE = 'nflverse'
+
+# Common export column names -> nflverse stat names
+STAT_ALIASES = {
+    'pass_yds': 'passing_yards', 'pass_yards': 'passing_yards', 'pass_td': 'passing_tds',
+    'pass_tds': 'passing_tds', 'int': 'interceptions', 'ints': 'interceptions', 'pass_int': 'interceptions',
+    'rush_yds': 'rushing_yards', 'rush_yards': 'rushing_yards', 'rush_td': 'rushing_tds', 'rush_tds': 'rushing_tds',
+    'rec': 'receptions', 'rec_yds': 'receiving_yards', 'rec_yards': 'receiving_yards',
+    'rec_td': 'receiving_tds', 'rec_tds': 'receiving_tds',
+    'fl': 'fumbles_lost', 'fumbles': 'fumbles_lost', '2pt': 'two_point_conversions',
+    'player': 'name', 'player_name': 'name', 'position': 'pos', 'team': 'tm',
+}
+
+
+def load_projection_file(path: Path, index: Optional[NameIndex] = None) -> pd.DataFrame:
+    """
+    Season stat projections from a local CSV export.
+
+    Returns a frame indexed by player_id with name, pos, tm and OFFENSE_STATS
+    (NaN where the source has no projection). Rows without a player_id are
+    resolved by name through `index`; unresolved or ambiguous rows are dropped
+    with a warning.
+    """
+    df = pd.read_csv(path, dtype={'player_id': str})
+    df.columns = [str(c).strip().lower() for c in df.columns]
+    df = df.rename(columns={c: STAT_ALIASES[c] for c in df.columns
+                            if c in STAT_ALIASES and STAT_ALIASES[c] not in df.columns})
+    stats = [c for c in OFFENSE_STATS if c in df.columns]
+    if not stats:
+        raise ValueError(f"{path} has no stat columns ({', '.join(OFFENSE_STATS)})")
+    for col in ('player_id', 'name', 'pos', 'tm'):
+        if col not in df.columns:
+            df[col] = None
+    df = df.reindex(columns=['player_id', 'name', 'pos', 'tm'] + OFFENSE_STATS)
+    df[OFFENSE_STATS] = df[OFFENSE_STATS].apply(pd.to_numeric, errors='coerce')
+    df[['name', 'pos', 'tm']] = df[['name', 'pos', 'tm']].fillna('').astype(str)
+    df['pos'] = df['pos'].str.upper()
+    df['tm'] = df['tm'].str.upper()
+
+    blank = df['player_id'].isna() | (df['player_id'].astype(str).str.strip() == '')
+    if blank.any() and index is not None:
+        matches = index.resolve_frame(df[blank])
+        df.loc[blank, 'player_id'] = matches['resolved_id']
+        unresolved = matches['match_status'].isin(['ambiguous', 'missing'])
+        if unresolved.any():
+            logger.warning(f"{path}: {int(unresolved.sum())} rows could not be matched to a player id")
+    df = df.dropna(subset=['player_id']).drop_duplicates('player_id')
+    return df.set_index('player_id')
+
+
+def stack_sources(sources: Dict[str, pd.DataFrame]) -> tuple[pd.Index, np.ndarray]:
+    """Align sources on the union of their ids: (ids, sources x players x stats array)."""
+    ids = pd.Index([], dtype=object)
+    for df in sources.values():
+        ids = ids.union(df.index)
+    X = np.stack([df.reindex(index=ids, columns=OFFENSE_STATS).to_numpy(dtype=float)
+                  for df in sources.values()])
+    return ids, X
+
+
+def weight_matrix(names: List[str], positions: np.ndarray,
+                  weights: Optional[Dict[str, Dict[str, float]]] = None) -> np.ndarray:
+    """
+    sources x players weights from {source: {'*': w, 'QB': w_qb, ...}}; unlisted
+    sources and positions weigh 1 (or the source's '*' weight).
+    """
+    weights = weights or {}
+    pos_values, pos_codes = np.unique(positions.astype(str), return_inverse=True)
+    per_pos = np.array([[weights.get(s, {}).get(p, weights.get(s, {}).get('*', 1.0)) for p in pos_values]
+                        for s in names], dtype=float).reshape(len(names), len(pos_values))
+    return per_pos[:, pos_codes]
+
+
+def consensus_projections(sources: Dict[str, pd.DataFrame], positions: pd.Series, cfg: ScoringConfig,
+                          weights: Optional[Dict[str, Dict[str, float]]] = None) -> pd.DataFrame:
+    """
+    Weighted stat-level consensus of several projection sources.
+
+    The consensus is a masked weighted mean over sources, per stat, so a source
+    that doesn't project a stat (e.g. two-point conversions) drops out of that
+    stat only. Each source's line (gaps filled from the consensus) is scored,
+    and the weighted standard deviation of those points is the disagreement.
+
+    Args:
+        sources: Source name -> season stat lines indexed by player_id
+        positions: player_id -> position (for per-position weights)
+        cfg: Scoring config for points and disagreement
+        weights: Per-source weights, optionally per position
+
+    Returns:
+        Frame indexed by player_id with the consensus OFFENSE_STATS, points,
+        stdev (weighted points disagreement between sources) and n_sources
+    """
+    ids, X = stack_sources(sources)
+    pos = positions.reindex(ids).fillna('').to_numpy()
+    W = weight_matrix(list(sources), pos, weights)                 # S x P
+    present = ~np.isnan(X)                                          # S x P x K
+    W = W * present.any(axis=2)
+
+    # Per-stat masked weighted mean over sources
+    w_stat = W[:, :, None] * present
+    total = w_stat.sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        C = (np.where(present, X, 0.0) * w_stat).sum(axis=0) / total
+    C = np.where(total > 0, C, np.nan)
+
+    # Each source scored with its gaps filled from the consensus
+    w = stat_weights(cfg).to_numpy()
+    filled = np.where(present, X, np.nan_to_num(C)[None])
+    source_pts = filled @ w                                         # S x P
+    points = np.nan_to_num(C) @ w
+    w_total = W.sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        var = (W * (source_pts - points) ** 2).sum(axis=0) / w_total
+    has = w_total > 0
+
+    out = pd.DataFrame(C, index=ids, columns=OFFENSE_STATS)
+    out['points'] = np.where(has, np.round(points, 2), np.nan)
+    out['stdev'] = np.where(has, np.round(np.sqrt(var), 2), np.nan)
+    out['n_sources'] = (W > 0).sum(axis=0)
+    return out
+
+
+def apply_consensus(players: List[Dict], nflverse_lines: pd.DataFrame, projections: Dict[str, pd.DataFrame],
+                    cfg: ScoringConfig, weights: Optional[Dict[str, Dict[str, float]]] = None,
+                    bye_weeks: Optional[Dict[str, int]] = None, return_lines: bool = False):
+    """
+    Replace blended offense points with the multi-source consensus.
+
+    Args:
+        players: apply_blended_scoring() output
+        nflverse_lines: Blended per-game stat lines (blend_stat_lines); projected to 17 games
+        projections: Source name -> load_projection_file() output
+        cfg: Scoring config
+        weights: Per-source (and per-position) weights; draftkit's own lines are 'nflverse'
+        bye_weeks: Team -> bye week, used for players only the external sources know
+        return_lines: Also return the consensus season stat lines (index player_id)
+
+    Returns:
+        players with points, consensus_stdev and consensus_sources set; offense players
+        that appear only in the external files are appended
+    """
+    board = {p['player_id']: p for p in players if p.get('player_id')}
+    sources = {NFLVERSE: nflverse_lines.reindex(index=list(board), columns=OFFENSE_STATS) * 17, **projections}
+    sources[NFLVERSE] = sources[NFLVERSE].dropna(how='all')
+
+    extra = pd.concat([df[['name', 'pos', 'tm']] for df in projections.values()]) if projections else pd.DataFrame()
+    extra = extra[~extra.index.duplicated() & ~extra.index.isin(list(board))]
+    extra = extra[extra['pos'].isin(OFFENSE_POS) & (extra['name'] != '')]
+    positions = pd.concat([pd.Series({pid: p['pos'] for pid, p in board.items()}, dtype=object), extra['pos']])
+
+    result = consensus_projections(sources, positions, cfg, weights)
+    result = result[result['points'].notna()]
+
+    for pid, pts, sd, n in zip(result.index, result['points'], result['stdev'], result['n_sources']):
+        player = board.get(pid)
+        if player is None:
+            if pid not in extra.index:
+                continue
+            row = extra.loc[pid]
+            player = {'player_id': pid, 'name': row['name'], 'pos': row['pos'], 'tm': row['tm']}
+            if bye_weeks is not None:
+                player['bye'] = int(bye_weeks.get(row['tm'], 0))
+            players.append(player)
+        player['points'] = float(pts)
+        player['consensus_stdev'] = float(sd)
+        player['consensus_sources'] = int(n)
+    if return_lines:
+        return players, result[OFFENSE_STATS]
+    return players
@@ -0,0 +1,83 @@
+"""
+Weekly consistency metrics (gp, ppg, stdev, pN_share) over regular-season
+weeks, blended across seasons like the projections.
+"""
+from __future__ import annotations
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .backtest import regular_season_mask
+
+THRESHOLDS = (10, 15, 20)
+CONSISTENCY_FIELDS = ('gp', 'ppg', 'stdev') + tuple(f'p{t}_share' for t in THRESHOLDS)
+
+
+def consistency_metrics(points: pd.DataFrame, data_years: List[int], blend_weights: List[float],
+                        min_games: int = 0, thresholds: Sequence[float] = THRESHOLDS) -> pd.DataFrame:
+    """
+    Blended consistency metrics per player.
+
+    Weekly points are reduced in one pass to per player-season sums of 1, x,
+    x^2 and the threshold indicators (one bincount per column). Seasons are
+    blended with the weights and min-games rule of blend_stat_lines, treating
+    the blend as a mixture of the seasons' weekly distributions:
+
+        gp          weighted mean games per season
+        ppg         weighted mean points per game
+        stdev       standard deviation of weekly points under the mixture
+        pN_share    weighted share of games with at least N points
+
+    Args:
+        points: Weekly rows with season, week, player_id and weekly_points (playoff weeks are dropped)
+        data_years: Seasons to blend (most recent first)
+        blend_weights: Weight of each season
+        min_games: Games a season needs to count (as in blend_stat_lines)
+        thresholds: Point thresholds for the pN_share columns
+
+    Returns:
+        DataFrame indexed by player_id with gp, ppg, stdev and one pN_share per threshold
+    """
+    share_cols = [f'p{t:g}_share' for t in thresholds]
+    season_idx = pd.Index(data_years).get_indexer(points['season'])
+    rows = (season_idx >= 0) & regular_season_mask(points)
+    data = points[rows]
+    if data.empty:
+        return pd.DataFrame(columns=['gp', 'ppg', 'stdev', *share_cols], index=pd.Index([], name='player_id'))
+    codes, ids = pd.factorize(data['player_id'])
+    n_players, n_seasons = len(ids), len(data_years)
+    cell = codes * n_seasons + season_idx[rows]
+
+    x = data['weekly_points'].to_numpy(dtype=float)
+    columns = [np.ones_like(x), x, x * x] + [(x >= t).astype(float) for t in thresholds]
+    sums = np.stack([np.bincount(cell, weights=c, minlength=n_players * n_seasons) for c in columns],
+                    axis=-1).reshape(n_players, n_seasons, -1)
+
+    games = sums[:, :, 0]
+    moments = sums[:, :, 1:] / np.maximum(games, 1)[:, :, None]   # mean, mean of squares, shares
+    W = np.asarray(blend_weights, dtype=float)[None, :] * (games >= max(min_games, 1))
+    total = W.sum(axis=1)
+    keep = total > 0
+    W, games, moments = W[keep] / total[keep, None], games[keep], moments[keep]
+
+    blended = np.einsum('ps,psk->pk', W, moments)
+    ppg = blended[:, 0]
+    out = pd.DataFrame({
+        'gp': np.round((W * games).sum(axis=1), 1),
+        'ppg': np.round(ppg, 2),
+        'stdev': np.round(np.sqrt(np.maximum(blended[:, 1] - ppg ** 2, 0.0)), 2),
+    }, index=pd.Index(ids[keep], name='player_id'))
+    for j, col in enumerate(share_cols):
+        out[col] = np.round(blended[:, 2 + j], 3)
+    return out.sort_index()
+
+
+def add_consistency(players: List[Dict], metrics: pd.DataFrame) -> List[Dict]:
+    """Set the consistency fields on players whose player_id has metrics."""
+    records = metrics.to_dict(orient='index')
+    for p in players:
+        row = records.get(p.get('player_id'))
+        if row:
+            p.update({k: float(v) for k, v in row.items()})
+    return players
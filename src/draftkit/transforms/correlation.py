@@ -0,0 +1,105 @@
+"""
+Teammate weekly-points correlations (QB-WR stacks, RB handcuffs).
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, List
+import json
+
+import numpy as np
+import pandas as pd
+
+from .backtest import regular_season_mask
+from .scoring import OFFENSE_POS
+
+
+def team_season_correlations(points: pd.DataFrame, min_weeks: int = 8) -> pd.DataFrame:
+    """
+    Masked weekly-points correlations of every same-team pair in each season.
+
+    Weekly points are laid out per team-season as a padded groups x players x
+    weeks array with a played mask, and every sum a masked Pearson correlation
+    needs (over the weeks both players played) is one batched einsum.
+
+    Args:
+        points: Weekly rows with season, week, player_id, recent_team and weekly_points
+            (playoff weeks are dropped)
+        min_weeks: Weeks both players must have played for the team
+
+    Returns:
+        DataFrame with season, team, player_id, other_id, weeks and corr (each pair once per direction)
+    """
+    columns = ['season', 'team', 'player_id', 'other_id', 'weeks', 'corr']
+    points = points[regular_season_mask(points)].dropna(subset=['recent_team'])
+    if points.empty:
+        return pd.DataFrame(columns=columns)
+    group_codes, groups = pd.factorize(pd.MultiIndex.from_arrays([points['season'], points['recent_team']]))
+    member = points.assign(_g=group_codes).drop_duplicates(['_g', 'player_id'])[['_g', 'player_id']]
+    member['_slot'] = member.groupby('_g').cumcount()
+    slots = points.assign(_g=group_codes).merge(member, on=['_g', 'player_id'])['_slot'].to_numpy()
+    weeks = points['week'].to_numpy(dtype=int)
+    n_groups, n_slots, n_weeks = len(groups), int(member['_slot'].max()) + 1, int(weeks.max()) + 1
+
+    X = np.zeros((n_groups, n_slots, n_weeks))
+    M = np.zeros((n_groups, n_slots, n_weeks))
+    X[group_codes, slots, weeks] = points['weekly_points'].to_numpy(dtype=float)
+    M[group_codes, slots, weeks] = 1.0
+
+    XM, X2M = X * M, X * X * M
+    n = np.einsum('giw,gjw->gij', M, M)
+    sx = np.einsum('giw,gjw->gij', XM, M)      # sum of i's points over weeks both played
+    sy = np.einsum('giw,gjw->gij', M, XM)
+    sxy = np.einsum('giw,gjw->gij', XM, XM)
+    sxx = np.einsum('giw,gjw->gij', X2M, M)
+    syy = np.einsum('giw,gjw->gij', M, X2M)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = sxy - sx * sy / n
+        corr = cov / np.sqrt((sxx - sx ** 2 / n) * (syy - sy ** 2 / n))
+
+    off_diag = ~np.eye(n_slots, dtype=bool)[None]
+    g, i, j = np.nonzero((n >= min_weeks) & off_diag & np.isfinite(corr))
+    ids = np.full((n_groups, n_slots), None, dtype=object)
+    ids[member['_g'].to_numpy(), member['_slot'].to_numpy()] = member['player_id'].to_numpy()
+    return pd.DataFrame({
+        'season': groups.get_level_values(0)[g], 'team': groups.get_level_values(1)[g],
+        'player_id': ids[g, i], 'other_id': ids[g, j],
+        'weeks': n[g, i, j].astype(int), 'corr': corr[g, i, j],
+    }, columns=columns)
+
+
+def teammate_pairs(pairs: pd.DataFrame, players: List[Dict], top: int = 5) -> Dict[str, List[Dict]]:
+    """
+    Top correlated current teammates per board player.
+
+    Season pairs are pooled per (player, other) as the co-week weighted mean
+    correlation; only pairs on the same board team are kept, sorted by
+    correlation (strongest first, `top` per player).
+
+    Returns:
+        {player_id: [{player_id, name, pos, corr, weeks}, ...]}
+    """
+    board = {p['player_id']: p for p in players if p.get('player_id') and p.get('pos') in OFFENSE_POS}
+    if pairs.empty or not board:
+        return {}
+    pooled = (pairs.assign(wc=pairs['corr'] * pairs['weeks'])
+              .groupby(['player_id', 'other_id'])[['wc', 'weeks']].sum().reset_index())
+    pooled['corr'] = pooled['wc'] / pooled['weeks']
+    team = {pid: p.get('tm') for pid, p in board.items()}
+    keep = [team.get(a) is not None and team.get(a) == team.get(b)
+            for a, b in zip(pooled['player_id'], pooled['other_id'])]
+    pooled = pooled[keep].sort_values(['player_id', 'corr'], ascending=[True, False])
+
+    out: Dict[str, List[Dict]] = {}
+    for pid, group in pooled.groupby('player_id', sort=False):
+        out[pid] = [{'player_id': other, 'name': board[other]['name'], 'pos': board[other]['pos'],
+                     'corr': round(float(c), 3), 'weeks': int(w)}
+                    for other, c, w in zip(group['other_id'][:top], group['corr'][:top], group['weeks'][:top])]
+    return out
+
+
+def write_correlations(pairs: Dict[str, List[Dict]], path: Path) -> Path:
+    """Write {player_id: [teammates]} as JSON."""
+    path = Path(path)
+    with path.open('w') as f:
+        json.dump(pairs, f, indent=1)
+    return path
@@ -0,0 +1,177 @@
+"""
+Player name resolution for name-only inputs (overrides, ADP files, expert ranks).
+Close calls are reported as ambiguous with their candidates, never guessed.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+# Feed/site position labels -> nflverse roster positions
+POSITION_ALIASES = {'FB': 'RB', 'HB': 'RB', 'PK': 'K', 'DST': 'DEF', 'D/ST': 'DEF'}
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase ASCII name without punctuation or generational suffixes."""
+    if not isinstance(name, str):
+        return ''
+    text = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode()
+    text = re.sub(r"[.'`’]", '', text.lower())
+    tokens = [t for t in re.split(r'[^a-z0-9]+', text) if t]
+    while len(tokens) > 1 and tokens[-1] in SUFFIXES:
+        tokens.pop()
+    return ' '.join(tokens)
+
+
+def trigrams(text: str) -> List[str]:
+    """Distinct character trigrams of a normalized name, padded at word edges."""
+    padded = f"  {text} "
+    return sorted({padded[i:i + 3] for i in range(len(padded) - 2)})
+
+
+@dataclass
+class NameMatch:
+    query: str
+    status: str                       # 'exact', 'fuzzy', 'ambiguous' or 'missing'
+    player_id: Optional[str] = None
+    name: Optional[str] = None
+    score: float = 0.0
+    candidates: List[Tuple[str, str, float]] = field(default_factory=list)  # (player_id, name, score)
+
+
+class NameIndex:
+    """
+    Name -> nflverse id resolver built from roster rows.
+
+    Normalized names (accents, punctuation, case, Jr./Sr./II-V suffixes) are
+    indexed once two ways: an exact map to roster rows, and a trigram inverted
+    index scored with the Dice coefficient via one bincount over the query's
+    posting lists. Position and team narrow the candidates when given.
+    """
+
+    def __init__(self, players: pd.DataFrame, min_score: float = 0.6, margin: float = 0.05):
+        """
+        Args:
+            players: DataFrame with player_id, name, pos and tm columns
+            min_score: Minimum Dice similarity for a fuzzy match
+            margin: Runner-up within this score of the best makes a match ambiguous
+        """
+        players = players.dropna(subset=['player_id', 'name']).drop_duplicates('player_id').reset_index(drop=True)
+        self.ids = players['player_id'].astype(str).to_numpy()
+        self.names = players['name'].astype(str).to_numpy()
+        self.pos = players['pos'].fillna('').astype(str).str.upper().to_numpy() if 'pos' in players else np.full(len(players), '')
+        self.tm = players['tm'].fillna('').astype(str).str.upper().to_numpy() if 'tm' in players else np.full(len(players), '')
+        self.min_score = min_score
+        self.margin = margin
+
+        self.exact: Dict[str, List[int]] = {}
+        postings: Dict[str, List[int]] = {}
+        self.gram_counts = np.zeros(len(players), dtype=float)
+        for i, name in enumerate(self.names):
+            norm = normalize_name(name)
+            self.exact.setdefault(norm, []).append(i)
+            grams = trigrams(norm)
+            self.gram_counts[i] = len(grams)
+            for g in grams:
+                postings.setdefault(g, []).append(i)
+        self.postings = {g: np.array(rows, dtype=np.int32) for g, rows in postings.items()}
+
+    @classmethod
+    def from_rosters(cls, *rosters: pd.DataFrame, **kwargs) -> 'NameIndex':
+        """
+        Build from nflverse roster frames (player_id, player_name or
+        player_display_name, position, team); the first row per id wins.
+        """
+        frames = []
+        for r in rosters:
+            if r is None or r.empty or 'player_id' not in r:
+                continue
+            name_col = 'player_name' if 'player_name' in r else 'player_display_name'
+            frames.append(pd.DataFrame({
+                'player_id': r['player_id'],
+                'name': r[name_col],
+                'pos': r['position'] if 'position' in r else '',
+                'tm': r['team'] if 'team' in r else '',
+            }))
+        frame = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=['player_id', 'name', 'pos', 'tm'])
+        return cls(frame, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _narrow(self, rows: np.ndarray, pos: Optional[str], team: Optional[str]) -> np.ndarray:
+        if pos:
+            pos = POSITION_ALIASES.get(pos.upper(), pos.upper())
+            same = rows[self.pos[rows] == pos]
+            if len(same):
+                rows = same
+        if team and len(rows) > 1:
+            same = rows[self.tm[rows] == team.upper()]
+            if len(same):
+                rows = same
+        return rows
+
+    def resolve(self, name: str, pos: Optional[str] = None, team: Optional[str] = None) -> NameMatch:
+        """Resolve one name, using position and team as tie-breakers."""
+        norm = normalize_name(name)
+        if not norm:
+            return NameMatch(name, 'missing')
+
+        exact = self.exact.get(norm)
+        if exact:
+            rows = self._narrow(np.array(exact), pos, team)
+            if len(rows) == 1:
+                i = int(rows[0])
+                return NameMatch(name, 'exact', self.ids[i], self.names[i], 1.0)
+            return NameMatch(name, 'ambiguous', candidates=[(self.ids[i], self.names[i], 1.0) for i in rows])
+
+        grams = [self.postings[g] for g in trigrams(norm) if g in self.postings]
+        if not grams:
+            return NameMatch(name, 'missing')
+        overlap = np.bincount(np.concatenate(grams), minlength=len(self.ids))
+        scores = 2.0 * overlap / (self.gram_counts + len(trigrams(norm)))
+        rows = np.flatnonzero(scores >= self.min_score)
+        rows = self._narrow(rows, pos, team)
+        if len(rows) == 0:
+            return NameMatch(name, 'missing')
+        rows = rows[np.argsort(-scores[rows], kind='stable')]
+        candidates = [(self.ids[i], self.names[i], round(float(scores[i]), 3)) for i in rows[:5]]
+        best = float(scores[rows[0]])
+        if len(rows) > 1 and best - float(scores[rows[1]]) < self.margin:
+            return NameMatch(name, 'ambiguous', score=round(best, 3), candidates=candidates)
+        i = int(rows[0])
+        return NameMatch(name, 'fuzzy', self.ids[i], self.names[i], round(best, 3), candidates)
+
+    def resolve_frame(self, df: pd.DataFrame, name_col: str = 'name', pos_col: str = 'pos',
+                      team_col: str = 'tm') -> pd.DataFrame:
+        """
+        Resolve every row of a name-only table.
+
+        Returns a frame aligned with df with columns resolved_id, resolved_name,
+        match_status, match_score and match_candidates ('id:name' strings for
+        ambiguous rows).
+        """
+        names = df[name_col].tolist()
+        positions = df[pos_col].tolist() if pos_col in df else [None] * len(df)
+        teams = df[team_col].tolist() if team_col in df else [None] * len(df)
+        # Rows repeating the same (name, pos, team) are resolved once
+        cache: Dict[tuple, NameMatch] = {}
+        matches = []
+        for key in zip(names, positions, teams):
+            key = tuple(k if isinstance(k, str) else None for k in key)
+            if key not in cache:
+                cache[key] = self.resolve(*key)
+            matches.append(cache[key])
+        return pd.DataFrame({
+            'resolved_id': [m.player_id for m in matches],
+            'resolved_name': [m.name for m in matches],
+            'match_status': [m.status for m in matches],
+            'match_score': [m.score for m in matches],
+            'match_candidates': ['; '.join(f"{pid}:{nm}" for pid, nm, _ in m.candidates) if m.status == 'ambiguous' else ''
+                                 for m in matches],
+        }, index=df.index)
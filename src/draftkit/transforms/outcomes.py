@@ -0,0 +1,128 @@
+"""
+Bootstrap season-outcome simulator: p10/p50/p90 season points and positional
+ranks from each player's resampled past weeks.
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+SEASON_GAMES = 17
+OUTCOME_FIELDS = ('sim_p10', 'sim_p50', 'sim_p90', 'sim_rank_p10', 'sim_rank_p50', 'sim_rank_p90')
+
+
+def weekly_pools(points: np.ndarray, played: np.ndarray, season_weights: Sequence[float],
+                 min_games: int = 0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Resampling pools from players x seasons x weeks points and played mask.
+
+    Every played week of a qualifying season (games >= min_games) is drawn with
+    probability w_season / games_season, the projection's season weights. The
+    play rate is the blend-weighted share of 17 games the player appeared in.
+
+    Returns:
+        (pool, cdf, play_rate): pool and cdf are players x (seasons * weeks);
+        cdf rows end at exactly 1 (all 0 for players without a qualifying season)
+    """
+    n_players, n_seasons, n_weeks = points.shape
+    games = played.sum(axis=2)
+    W = np.asarray(season_weights, dtype=float)[None, :] * (games >= max(min_games, 1))
+    total = W.sum(axis=1)
+    prob = (W / np.maximum(games, 1))[:, :, None] * played
+    cdf = np.cumsum(prob.reshape(n_players, -1), axis=1)
+    has = total > 0
+    cdf[has] /= cdf[has, -1:]
+    cdf[~has] = 0.0
+    play_rate = np.where(has, (W * np.minimum(games / SEASON_GAMES, 1.0)).sum(axis=1) / np.maximum(total, 1e-12), 0.0)
+    pool = np.where(played, points, 0.0).reshape(n_players, -1).astype(np.float32)
+    return pool, cdf, play_rate
+
+
+def _simulate_chunk(args) -> np.ndarray:
+    pool, cdf, play_rate, n_sims, seed = args
+    rng = np.random.default_rng(seed)
+    n = len(pool)
+    # Per-player CDFs laid end to end (row r offset by 2r), so one searchsorted
+    # draws every week of every simulation
+    offsets = 2.0 * np.arange(n)
+    flat_cdf = (cdf + offsets[:, None]).ravel()
+    u = 1.0 - rng.random((n, n_sims, SEASON_GAMES))        # (0, 1]: never lands on a zero-probability week
+    idx = np.searchsorted(flat_cdf, u + offsets[:, None, None], side='left')
+    weeks = pool.ravel()[idx]
+    games = rng.binomial(SEASON_GAMES, play_rate[:, None], size=(n, n_sims))
+    weeks *= np.arange(SEASON_GAMES)[None, None, :] < games[:, :, None]
+    return weeks.sum(axis=2, dtype=np.float32)
+
+
+def simulate_seasons(points: np.ndarray, played: np.ndarray, season_weights: Sequence[float],
+                     min_games: int = 0, n_sims: int = 5000, workers: int = 1, seed: int = 42,
+                     chunk_size: int = 16) -> np.ndarray:
+    """
+    Simulated season totals, players x n_sims (NaN rows for players without history).
+
+    Each season is the sum of Binomial(17, play_rate) sampled weeks. Players
+    run in vectorized chunks, each with its own child seed, so results don't
+    depend on the worker count.
+
+    Args:
+        points, played: players x seasons x weeks (seasons in blend order, most recent first);
+            mask played to regular-season weeks (WeeklyTensor.regular_season) to keep playoff games out
+        season_weights: Blend weight per season
+        min_games: Games a season needs to be resampled
+        n_sims: Simulated seasons per player
+        workers: Processes to spread player chunks over (1 = run inline)
+        seed: Base seed; each chunk gets a child of SeedSequence(seed)
+        chunk_size: Players per vectorized batch (memory ~ chunk_size * n_sims * 17 * 20 bytes)
+    """
+    pool, cdf, play_rate = weekly_pools(points, played, season_weights, min_games)
+    rows = np.flatnonzero(cdf[:, -1] > 0)
+    out = np.full((len(pool), n_sims), np.nan, dtype=np.float32)
+    if len(rows) == 0:
+        return out
+    chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    jobs = [(pool[c], cdf[c], play_rate[c], n_sims, s) for c, s in zip(chunks, seeds)]
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool_exec:
+            results = list(pool_exec.map(_simulate_chunk, jobs))
+    else:
+        results = [_simulate_chunk(job) for job in jobs]
+    for c, sims in zip(chunks, results):
+        out[c] = sims
+    return out
+
+
+def outcome_table(sims: np.ndarray, player_ids: Sequence[str], positions: Sequence[str]) -> pd.DataFrame:
+    """
+    p10/p50/p90 season points and positional rank per player from simulate_seasons output.
+
+    Ranks are 1 = best at the position within each simulation, so sim_rank_p10
+    is the optimistic end of the rank range and sim_rank_p90 the pessimistic end.
+    """
+    ok = ~np.isnan(sims).any(axis=1)
+    sims, ids, pos = sims[ok], np.asarray(player_ids, dtype=object)[ok], np.asarray(positions, dtype=object)[ok]
+    ranks = np.empty_like(sims)
+    for p in pd.unique(pos):
+        rows = np.flatnonzero(pos == p)
+        order = np.argsort(-sims[rows], axis=0, kind='stable')
+        r = np.empty_like(order)
+        np.put_along_axis(r, order, np.arange(1, len(rows) + 1)[:, None], axis=0)
+        ranks[rows] = r
+    pts = np.percentile(sims, [10, 50, 90], axis=1)
+    rk = np.percentile(ranks, [10, 50, 90], axis=1)
+    return pd.DataFrame({
+        'sim_p10': np.round(pts[0], 1), 'sim_p50': np.round(pts[1], 1), 'sim_p90': np.round(pts[2], 1),
+        'sim_rank_p10': np.round(rk[0]), 'sim_rank_p50': np.round(rk[1]), 'sim_rank_p90': np.round(rk[2]),
+    }, index=pd.Index(ids, name='player_id'))
+
+
+def add_outcomes(players: List[Dict], table: pd.DataFrame) -> List[Dict]:
+    """Set the OUTCOME_FIELDS on players whose player_id was simulated."""
+    records = table.to_dict(orient='index')
+    for p in players:
+        row = records.get(p.get('player_id'))
+        if row:
+            p.update({k: (int(v) if k.startswith('sim_rank') else float(v)) for k, v in row.items()})
+    return players
@@ -5,11 +5,15 @@ Allows manual point overrides for players that blended projections can't handle
 such as rookies with no NFL history or players in significantly new roles.
 """
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import logging
 
+from .scoring import ScoringConfig, OFFENSE_STATS, score_stats
+from .names import NameIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,7 +22,11 @@ def load_overrides(override_path: Path) -> pd.DataFrame:
     Load player overrides from CSV file.
     
     Args:
-        override_path: Path to CSV file with columns: player_id, name, pos, tm, points, note
+        override_path: Path to CSV file with columns: player_id, name, pos, tm, points, note.
+            Instead of (or as well as) points, a row may give a projected season stat
+            line using the scoring kernel's column names (see OFFENSE_STATS).
+            player_id may be blank (or the column absent) for rows resolved by name
+            (see resolve_override_ids).
         
     Returns:
         DataFrame with override data, empty if file doesn't exist or has issues
@@ -28,22 +36,31 @@ def load_overrides(override_path: Path) -> pd.DataFrame:
         return pd.DataFrame()
     
     try:
-        overrides = pd.read_csv(override_path)
+        overrides = pd.read_csv(override_path, dtype={'player_id': str})
         
         # Validate required columns
-        required_cols = ['player_id', 'name', 'pos', 'tm', 'points']
-        missing_cols = [col for col in required_cols if col not in overrides.columns]
-        if missing_cols:
-            logger.warning(f"Override file missing required columns: {missing_cols}")
+        stat_cols = [c for c in OFFENSE_STATS if c in overrides.columns]
+        has_key = 'player_id' in overrides.columns or 'name' in overrides.columns
+        if not has_key or ('points' not in overrides.columns and not stat_cols):
+            logger.warning("Override file needs player_id or name and either points or stat columns "
+                           f"({', '.join(OFFENSE_STATS)})")
             return pd.DataFrame()
+        if 'player_id' not in overrides.columns:
+            overrides['player_id'] = None
         
-        # Optional note column
-        if 'note' not in overrides.columns:
-            overrides['note'] = ''
+        # Optional columns
+        for col in ('name', 'pos', 'tm', 'note'):
+            if col not in overrides.columns:
+                overrides[col] = ''
+        overrides[['name', 'pos', 'tm', 'note']] = overrides[['name', 'pos', 'tm', 'note']].fillna('')
+        if 'points' not in overrides.columns:
+            overrides['points'] = np.nan
         
         # Validate data types
         overrides['points'] = pd.to_numeric(overrides['points'], errors='coerce')
-        overrides = overrides.dropna(subset=['points'])
+        for col in stat_cols:
+            overrides[col] = pd.to_numeric(overrides[col], errors='coerce')
+        overrides = overrides.dropna(subset=['points'] + stat_cols, how='all')
         
         logger.info(f"Loaded {len(overrides)} player overrides from {override_path}")
         return overrides
@@ -53,70 +70,125 @@ def load_overrides(override_path: Path) -> pd.DataFrame:
         return pd.DataFrame()
 
 
-def apply_overrides(players: List[Dict[str, Any]], override_path: Optional[Path] = None) -> List[Dict[str, Any]]:
+def resolve_override_ids(overrides: pd.DataFrame, index: NameIndex) -> pd.DataFrame:
+    """
+    Fill blank player_ids from the name index.
+
+    Rows that already carry an id are left alone. Resolved rows get the matched
+    id; ambiguous rows keep a blank id and list their candidates in
+    `match_candidates`. Adds match_status ('id', 'exact', 'fuzzy', 'ambiguous'
+    or 'missing') and match_score columns.
+    """
+    overrides = overrides.copy()
+    overrides['match_status'] = 'id'
+    overrides['match_score'] = 1.0
+    overrides['match_candidates'] = ''
+    blank = overrides['player_id'].isna() | (overrides['player_id'].astype(str).str.strip() == '')
+    if not blank.any():
+        return overrides
+    matches = index.resolve_frame(overrides[blank])
+    overrides.loc[blank, 'player_id'] = matches['resolved_id']
+    overrides.loc[blank, ['match_status', 'match_score', 'match_candidates']] = \
+        matches[['match_status', 'match_score', 'match_candidates']]
+    return overrides
+
+
+def override_points(overrides: pd.DataFrame, cfg: Optional[ScoringConfig] = None) -> pd.Series:
+    """
+    Points for each override row.
+
+    Rows with any stat column filled are scored through the scoring kernel (missing
+    stats count as zero); other rows keep their `points` value.
+    """
+    stat_cols = [c for c in OFFENSE_STATS if c in overrides.columns]
+    if not stat_cols:
+        return overrides['points']
+    has_stats = overrides[stat_cols].notna().any(axis=1)
+    scored = pd.Series(score_stats(overrides, cfg or ScoringConfig()), index=overrides.index)
+    return scored.where(has_stats, overrides['points'])
+
+
+def apply_overrides(players: List[Dict[str, Any]], override_path: Optional[Path] = None,
+                    cfg: Optional[ScoringConfig] = None,
+                    bye_weeks: Optional[Dict[str, int]] = None,
+                    index: Optional[NameIndex] = None) -> List[Dict[str, Any]]:
     """
     Apply player overrides to the players list.
     
+    Overrides are joined to the board on player_id in one keyed merge; `points`,
+    `source` ('override' or 'blend') and `override_note` are filled from the merged
+    columns. Override rows whose player is not on the board (e.g. rookies with no
+    NFL history) are added as new players when they carry a name and position.
+    Rows without a player_id are resolved by name through `index`; ambiguous
+    names are logged with their candidates and not applied.
+    
     Args:
         players: List of player dictionaries with standard fantasy data
         override_path: Path to CSV override file, if provided
+        cfg: Scoring config for stat-line overrides (default scoring otherwise)
+        bye_weeks: Team -> bye week, used for added players
+        index: Name index for rows without a player_id
         
     Returns:
         Updated players list with overrides applied and source field added
     """
-    if not override_path or not override_path.exists():
-        # Add source field to all players as 'blend' (default)
-        for player in players:
-            player['source'] = 'blend'
-        return players
-    
-    # Load overrides
-    overrides_df = load_overrides(override_path)
+    overrides_df = load_overrides(override_path) if override_path else pd.DataFrame()
     if overrides_df.empty:
-        # Add source field as 'blend' if no overrides loaded
         for player in players:
             player['source'] = 'blend'
+            player['override_note'] = ''
         return players
     
-    # Convert players to DataFrame for easier processing
-    players_df = pd.DataFrame(players)
-    
-    # Create override lookup by player_id
-    override_lookup = {}
-    for _, row in overrides_df.iterrows():
-        override_lookup[row['player_id']] = {
-            'points': row['points'],
-            'note': row.get('note', ''),
-            'override_name': row['name'],  # For verification
-            'override_pos': row['pos'],
-            'override_tm': row['tm']
-        }
-    
-    # Apply overrides
-    overrides_applied = 0
-    for i, player in enumerate(players):
-        player_id = player.get('player_id')
-        
-        if player_id and player_id in override_lookup:
-            override_data = override_lookup[player_id]
-            
-            # Apply the override
-            original_points = player.get('points', 0)
-            player['points'] = override_data['points']
-            player['source'] = 'override'
-            player['override_note'] = override_data['note']
-            
-            # Log the override for transparency
-            logger.info(f"Override applied: {player.get('name', 'Unknown')} "
-                       f"({player.get('pos', 'N/A')}) - "
-                       f"{original_points:.1f} → {override_data['points']:.1f} pts")
-            
-            overrides_applied += 1
-        else:
-            # Mark as blend source
-            player['source'] = 'blend'
+    if index is not None:
+        overrides_df = resolve_override_ids(overrides_df, index)
+        for row in overrides_df[overrides_df['match_status'] == 'ambiguous'].itertuples():
+            logger.warning(f"Override for '{row.name}' is ambiguous ({row.match_candidates}); add a player_id")
+    
+    # Rows still without an id can only be added as new players
+    unkeyed = overrides_df[overrides_df['player_id'].isna()]
+    unkeyed = unkeyed[(unkeyed['name'] != '') & (unkeyed['pos'] != '')]
+    if 'match_status' in unkeyed:
+        unkeyed = unkeyed[unkeyed['match_status'] != 'ambiguous']
+    overrides_df = overrides_df.dropna(subset=['player_id']).drop_duplicates('player_id', keep='last')
+    ov = pd.DataFrame({
+        'player_id': overrides_df['player_id'],
+        'points_ovr': override_points(overrides_df, cfg),
+        'note_ovr': overrides_df['note'],
+    })
+    
+    board = pd.DataFrame({
+        'player_id': [p.get('player_id') for p in players],
+        'points': [p.get('points', 0.0) for p in players],
+    })
+    merged = board.merge(ov, on='player_id', how='left', validate='many_to_one')
+    hit = merged['points_ovr'].notna()
+    merged['points'] = merged['points_ovr'].where(hit, merged['points'])
+    merged['source'] = np.where(hit, 'override', 'blend')
+    merged['override_note'] = merged['note_ovr'].where(hit, '').astype(str)
+    
+    for player, pts, source, note in zip(players, merged['points'].to_numpy(),
+                                         merged['source'], merged['override_note']):
+        player['points'] = float(pts)
+        player['source'] = source
+        player['override_note'] = note
+    logger.info(f"Applied {int(hit.sum())} player overrides")
     
-    logger.info(f"Applied {overrides_applied} player overrides")
+    # Players only known from the override file
+    new = ov[~ov['player_id'].isin(board['player_id'])].join(overrides_df[['name', 'pos', 'tm']])
+    new = new[(new['name'] != '') & (new['pos'] != '')]
+    new = pd.concat([new, pd.DataFrame({
+        'player_id': None, 'points_ovr': override_points(unkeyed, cfg), 'note_ovr': unkeyed['note'],
+        'name': unkeyed['name'], 'pos': unkeyed['pos'], 'tm': unkeyed['tm'],
+    })])
+    for row in new.to_dict(orient='records'):
+        player = {'player_id': row['player_id'], 'name': row['name'], 'pos': row['pos'],
+                  'tm': row['tm'], 'points': float(row['points_ovr'])}
+        if bye_weeks is not None:
+            player['bye'] = int(bye_weeks.get(row['tm'], 0))
+        player.update({'source': 'override', 'override_note': row['note_ovr']})
+        players.append(player)
+    if len(new):
+        logger.info(f"Added {len(new)} players from overrides")
     return players
 
 
@@ -131,7 +203,7 @@ def create_sample_overrides_2025(output_path: Path) -> None:
     # Note: These are example projections - adjust based on your league's scoring and expectations
     sample_overrides = [
         {
-            'player_id': '00-0037013',  # Caleb Williams (example ID)
+            'player_id': '00-0039918',  # Caleb Williams
             'name': 'Caleb Williams',
             'pos': 'QB',
             'tm': 'CHI',
@@ -139,7 +211,7 @@ def create_sample_overrides_2025(output_path: Path) -> None:
             'note': '2024 #1 overall pick, expected starter with rushing upside'
         },
         {
-            'player_id': '00-0037019',  # Marvin Harrison Jr. (example ID)  
+            'player_id': '00-0039849',  # Marvin Harrison Jr.
             'name': 'Marvin Harrison Jr.',
             'pos': 'WR',
             'tm': 'ARI',
@@ -147,7 +219,7 @@ def create_sample_overrides_2025(output_path: Path) -> None:
             'note': '2024 #4 overall pick, elite college production, immediate WR1 role'
         },
         {
-            'player_id': '00-0037021',  # Rome Odunze (example ID)
+            'player_id': '00-0039919',  # Rome Odunze
             'name': 'Rome Odunze',
             'pos': 'WR', 
             'tm': 'CHI',
@@ -155,7 +227,7 @@ def create_sample_overrides_2025(output_path: Path) -> None:
             'note': '2024 #9 overall pick, strong college metrics, WR2 role in Chicago'
         },
         {
-            'player_id': '00-0037025',  # Jayden Daniels (example ID)
+            'player_id': '00-0039910',  # Jayden Daniels
             'name': 'Jayden Daniels',
             'pos': 'QB',
             'tm': 'WAS',
@@ -163,7 +235,7 @@ def create_sample_overrides_2025(output_path: Path) -> None:
             'note': '2024 #2 overall pick, dual-threat QB with rushing floor'
         },
         {
-            'player_id': '00-0037018',  # Drake Maye (example ID)
+            'player_id': '00-0039851',  # Drake Maye
             'name': 'Drake Maye',
             'pos': 'QB',
             'tm': 'NE',
@@ -185,13 +257,16 @@ def create_sample_overrides_2025(output_path: Path) -> None:
     print("...")
 
 
-def validate_overrides(override_path: Path, players: List[Dict[str, Any]]) -> Dict[str, Any]:
+def validate_overrides(override_path: Path, players: List[Dict[str, Any]],
+                       index: Optional[NameIndex] = None) -> Dict[str, Any]:
     """
     Validate override file against current player data.
     
     Args:
         override_path: Path to override CSV file
         players: Current players list to validate against
+        index: Name index used to resolve rows without a player_id; fuzzy and
+            ambiguous matches are reported as warnings
         
     Returns:
         Dictionary with validation results and warnings
@@ -202,6 +277,8 @@ def validate_overrides(override_path: Path, players: List[Dict[str, Any]]) -> Di
     overrides_df = load_overrides(override_path)
     if overrides_df.empty:
         return {'valid': False, 'warnings': [], 'errors': ['Could not load override file']}
+    if index is not None:
+        overrides_df = resolve_override_ids(overrides_df, index)
     
     # Create player lookup for validation
     player_lookup = {p.get('player_id'): p for p in players if p.get('player_id')}
@@ -211,17 +288,26 @@ def validate_overrides(override_path: Path, players: List[Dict[str, Any]]) -> Di
     
     for _, override in overrides_df.iterrows():
         player_id = override['player_id']
+        status = override.get('match_status', 'id')
+        if status == 'ambiguous':
+            warnings.append(f"Override for {override['name']} is ambiguous - candidates: {override['match_candidates']}")
+            continue
+        if status == 'fuzzy':
+            warnings.append(f"Override for {override['name']} matched {player_id} by fuzzy name "
+                            f"(score {override['match_score']:.2f})")
         
         # Check if player exists in current data
-        if player_id not in player_lookup:
+        if pd.isna(player_id):
+            warnings.append(f"Override for {override['name']} has no player_id and no roster match")
+        elif player_id not in player_lookup:
             warnings.append(f"Override for {override['name']} ({player_id}) - player not found in current data")
         else:
             # Validate basic info matches
             player = player_lookup[player_id]
-            if player.get('pos') != override['pos']:
+            if override['pos'] and player.get('pos') != override['pos']:
                 warnings.append(f"Position mismatch for {override['name']}: "
                                f"override={override['pos']}, data={player.get('pos')}")
-            if player.get('tm') != override['tm']:
+            if override['tm'] and player.get('tm') != override['tm']:
                 warnings.append(f"Team mismatch for {override['name']}: "
                                f"override={override['tm']}, data={player.get('tm')}")
         
@@ -0,0 +1,141 @@
+"""
+Draft strategy search: the position-by-round plans with the highest expected
+starting-lineup points for our slot.
+"""
+from __future__ import annotations
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+
+from .slots import roster_slots, fill_slots
+from .simulate import position_caps
+
+
+def expected_pick_values(players: List[Dict], probs: np.ndarray, positions: Sequence[str],
+                         depth: Dict[str, int], value_key: str = 'points',
+                         pool_per_pos: int = 80) -> Dict[str, np.ndarray]:
+    """
+    Expected value of the (j+1)-th best available player per position and pick.
+
+    Computed for the whole board at once with a Poisson-binomial recursion over
+    each position's players sorted by value, using the availability probabilities.
+
+    Args:
+        players: Board (player dicts with pos and value_key)
+        probs: Availability, shape (len(players), picks)
+        positions: Positions to evaluate
+        depth: Position -> max j + 1 to compute
+        value_key: Player field to maximize (points by default)
+        pool_per_pos: Only the top-N players per position are considered
+
+    Returns:
+        Position -> array of shape (depth[pos], picks); entry [j, k] is the expected
+        value of our (j+1)-th player at that position if taken at pick k.
+    """
+    n_picks = probs.shape[1]
+    pos_arr = np.array([p.get('pos') for p in players])
+    values = np.array([float(p.get(value_key) or 0.0) for p in players])
+
+    result = {}
+    for pos in positions:
+        idx = np.flatnonzero(pos_arr == pos)
+        J = max(int(depth.get(pos, 1)), 1)
+        if len(idx) == 0:
+            result[pos] = np.zeros((J, n_picks))
+            continue
+        idx = idx[np.argsort(-values[idx], kind='stable')][:pool_per_pos]
+
+        # dist[j, k] = P(exactly j better players of this position are available at pick k)
+        dist = np.zeros((J, n_picks))
+        dist[0] = 1.0
+        expected = np.zeros((J, n_picks))
+        for i in idx:
+            a = probs[i]
+            expected += values[i] * a[None, :] * dist
+            shifted = np.vstack([np.zeros((1, n_picks)), dist[:-1]])
+            dist = dist * (1.0 - a[None, :]) + shifted * a[None, :]
+        result[pos] = expected
+    return result
+
+
+def _lineup_value(held: Dict[str, tuple], slots, bench_weight: float,
+                  repl: Dict[str, float]) -> float:
+    by_pos = {pos: np.sort(np.array(vals))[::-1] for pos, vals in held.items() if vals}
+    taken, starters = fill_slots(by_pos, slots, teams=1)
+    bench = 0.0
+    for pos, vals in by_pos.items():
+        bench += float(np.clip(vals[taken[pos]:] - repl.get(pos, 0.0), 0.0, None).sum())
+    return starters + bench_weight * bench
+
+
+def plan_draft(players: List[Dict], probs: np.ndarray, cfg, rounds: Optional[int] = None,
+               beam_width: int = 2000, top_n: int = 5, bench_weight: float = 0.1,
+               value_key: str = 'points', caps: Optional[Dict[str, int]] = None) -> List[Dict]:
+    """
+    Search position-by-round plans maximizing expected starting-lineup points.
+
+    States are keyed by how many players of each position we hold; only the
+    best-scoring history per key is kept (memoized DP), and a beam width bounds
+    the keys per round. A state scores its expected starting lineup (the
+    replacement-level slot allocator) plus a small weight on bench points above
+    replacement.
+
+    Args:
+        players: Board with pos and points (output of compute_replacement_and_vorp)
+        probs: Availability at each of our picks, shape (len(players), picks)
+        cfg: ScoringConfig (roster slots, flex positions, bench)
+        rounds: Rounds to plan (default: all columns of probs)
+        beam_width: Max states kept per round
+        top_n: Number of plans returned
+        bench_weight: Weight of non-starters' points above replacement (`repl_pts`)
+        value_key: Player field to maximize
+        caps: Max players per position (default: position_caps(cfg))
+
+    Returns:
+        List of {'plan': [pos per round], 'expected_points': float, 'pick_values': [...]}
+        sorted best first.
+    """
+    rounds = rounds or probs.shape[1]
+    slots = [s for s in roster_slots(cfg) if s.starter]
+    caps = caps or position_caps(cfg)
+    board_positions = {p.get('pos') for p in players}
+    positions = [pos for pos in caps if pos in board_positions and caps[pos] > 0]
+    expected = expected_pick_values(players, probs[:, :rounds], positions, caps, value_key)
+    repl = {}
+    for p in players:
+        if p.get('repl_pts') is not None:
+            repl.setdefault(p.get('pos'), float(p['repl_pts']))
+
+    empty = tuple(0 for _ in positions)
+    # key -> (score, plan, held values per position)
+    states = {empty: (0.0, (), {pos: () for pos in positions})}
+    for k in range(rounds):
+        nxt = {}
+        for counts, (_, plan, held) in states.items():
+            for i, pos in enumerate(positions):
+                j = counts[i]
+                if j >= caps[pos]:
+                    continue
+                new_counts = counts[:i] + (j + 1,) + counts[i + 1:]
+                new_held = dict(held)
+                new_held[pos] = held[pos] + (float(expected[pos][j, k]),)
+                score = _lineup_value(new_held, slots, bench_weight, repl)
+                best = nxt.get(new_counts)
+                if best is None or score > best[0]:
+                    nxt[new_counts] = (score, plan + (pos,), new_held)
+        if not nxt:
+            break
+        if len(nxt) > beam_width:
+            keep = sorted(nxt.items(), key=lambda kv: kv[1][0], reverse=True)[:beam_width]
+            nxt = dict(keep)
+        states = nxt
+
+    ranked = sorted(states.values(), key=lambda s: s[0], reverse=True)[:top_n]
+    plans = []
+    for score, plan, held in ranked:
+        seen = {pos: 0 for pos in positions}
+        pick_values = []
+        for k, pos in enumerate(plan):
+            pick_values.append(round(held[pos][seen[pos]], 2))
+            seen[pos] += 1
+        plans.append({'plan': list(plan), 'expected_points': round(score, 2), 'pick_values': pick_values})
+    return plans
@@ -1,10 +1,18 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Dict, Any, List
+import numpy as np
 import pandas as pd
 import yaml
 
 OFFENSE_POS = {'QB','RB','WR','TE'}
+# Offensive stat columns scored by the linear kernel (nflverse weekly names)
+OFFENSE_STATS = ['passing_yards','passing_tds','interceptions','rushing_yards','rushing_tds',
+                 'receptions','receiving_yards','receiving_tds','two_point_conversions','fumbles_lost']
+# Stat pairs (upper triangle) whose weekly cross-product sums the player-season
+# summary keeps: with weights w, sum(points^2) = sum_ij w_i w_j sum(x_i x_j)
+STAT_PAIRS = [(a, b) for i, a in enumerate(OFFENSE_STATS) for b in OFFENSE_STATS[i:]]
+PAIR_COLUMNS = [f"xx_{a}__{b}" for a, b in STAT_PAIRS]
 DST_POS = {'DST'}
 KICKER_POS = {'K'}
 
@@ -53,6 +61,11 @@ class ScoringConfig:
     teams: int = 12
     roster: Dict[str,int] = None  # e.g., {'QB':1,'RB':2,'WR':2,'TE':1,'FLEX':1,'K':1,'DEF':1}
     flex_positions: List[str] = None  # default ['RB','WR','TE']
+    bench: int = 0
+    slot_eligibility: Dict[str,List[str]] = None  # custom slots, e.g. {'WRT': ['WR','TE']}
+    # Auction leagues (budget 0 = snake draft)
+    auction_budget: float = 0.0
+    min_bid: float = 1.0
 
     @staticmethod
     def from_yaml(path) -> 'ScoringConfig':
@@ -62,6 +75,9 @@ class ScoringConfig:
         roster = data.get('roster', {'QB':1,'RB':2,'WR':2,'TE':1,'FLEX':1,'K':1,'DEF':1})
         teams = int(data.get('teams', 12))
         flex_positions = data.get('flex_positions', ['RB','WR','TE'])
+        bench = int(data.get('bench', 0) or 0)
+        slot_eligibility = data.get('slot_eligibility')
+        auction = data.get('auction') or {}
         return ScoringConfig(
             pass_yds_per_pt=s.get('passYdsPerPt',25),
             pass_td=s.get('passTd',4),
@@ -98,9 +114,32 @@ class ScoringConfig:
             k_xp_miss=s.get('kXpMiss',0),
             teams=teams,
             roster=roster,
-            flex_positions=flex_positions
+            flex_positions=flex_positions,
+            bench=bench,
+            slot_eligibility=slot_eligibility,
+            auction_budget=float(auction.get('budget', 0) or 0),
+            min_bid=float(auction.get('min_bid', 1))
         )
 
+def scoring_groups(cfg: ScoringConfig) -> Dict[str, tuple]:
+    """Scoring weights by scorer: 'offense', 'dst' and 'kicker'."""
+    groups = {'offense': [], 'dst': [], 'kicker': []}
+    for f in fields(cfg):
+        if f.name.startswith('dst_'):
+            groups['dst'].append(getattr(cfg, f.name))
+        elif f.name.startswith('k_'):
+            groups['kicker'].append(getattr(cfg, f.name))
+        elif f.name == 'teams':
+            break  # league settings follow the scoring weights
+        else:
+            groups['offense'].append(getattr(cfg, f.name))
+    return {k: tuple(v) for k, v in groups.items()}
+
+def changed_scoring_groups(old: ScoringConfig, new: ScoringConfig) -> set:
+    """Scorers whose weights differ between two configs."""
+    a, b = scoring_groups(old), scoring_groups(new)
+    return {k for k in a if a[k] != b[k]}
+
 def _score_row(row, cfg: ScoringConfig) -> float:
     pts = 0.0
     pts += row.get('passing_yards',0) / cfg.pass_yds_per_pt + row.get('passing_tds',0) * cfg.pass_td
@@ -110,6 +149,54 @@ def _score_row(row, cfg: ScoringConfig) -> float:
     pts += row.get('two_point_conversions',0) * cfg.two_pt + row.get('fumbles_lost',0) * cfg.fum_lost
     return round(pts, 2)
 
+def stat_weights(cfg: ScoringConfig) -> pd.Series:
+    """Fantasy points per unit of each offensive stat (indexed by OFFENSE_STATS)."""
+    return pd.Series({
+        'passing_yards': 1.0 / cfg.pass_yds_per_pt,
+        'passing_tds': cfg.pass_td,
+        'interceptions': cfg.interceptions,
+        'rushing_yards': 1.0 / cfg.rush_yds_per_pt,
+        'rushing_tds': cfg.rush_td,
+        'receptions': cfg.rec,
+        'receiving_yards': 1.0 / cfg.rec_yds_per_pt,
+        'receiving_tds': cfg.rec_td,
+        'two_point_conversions': cfg.two_pt,
+        'fumbles_lost': cfg.fum_lost,
+    })[OFFENSE_STATS]
+
+def _stat_matrix(stats: pd.DataFrame) -> np.ndarray:
+    """rows x OFFENSE_STATS array; missing stat columns and NaNs count as zero."""
+    return stats.reindex(columns=OFFENSE_STATS, fill_value=0).fillna(0).to_numpy(dtype=float)
+
+def score_stats(stats: pd.DataFrame, cfg: ScoringConfig) -> np.ndarray:
+    """
+    Score many stat lines at once: (rows x stats) @ weights.
+
+    Missing stat columns and NaNs count as zero. Same result as _score_row per row.
+    """
+    return np.round(_stat_matrix(stats) @ stat_weights(cfg).to_numpy(), 2)
+
+def score_array(X: np.ndarray, cfg: ScoringConfig, stats: list[str] = OFFENSE_STATS) -> np.ndarray:
+    """
+    Score any array whose last axis is `stats` (e.g. the players x seasons x
+    weeks x stats tensor) in one matmul; keeps X's float dtype and leading axes.
+    """
+    return X @ stat_weights(cfg).reindex(stats, fill_value=0).to_numpy(dtype=X.dtype)
+
+def add_weekly_points(weekly: pd.DataFrame, cfg: ScoringConfig) -> pd.DataFrame:
+    """Copy of weekly rows with a weekly_points column (score_stats of each player-week)."""
+    return weekly.assign(weekly_points=score_stats(weekly, cfg))
+
+def stat_contributions(stats: pd.DataFrame, cfg: ScoringConfig) -> pd.DataFrame:
+    """
+    Per-stat points behind score_stats: (rows x stats) * weights, same index as stats.
+
+    Row sums equal score_stats before rounding.
+    """
+    X = _stat_matrix(stats)
+    X *= stat_weights(cfg).to_numpy()
+    return pd.DataFrame(X, index=stats.index, columns=OFFENSE_STATS)
+
 def _score_dst_row(row, cfg: ScoringConfig) -> float:
     """Score a DST row based on team defensive stats."""
     pts = 0.0
@@ -159,9 +246,53 @@ def _score_kicker_row(row, cfg: ScoringConfig) -> float:
     
     return round(pts, 2)
 
+def decay_weights(lookback: int, decay: float) -> list[float]:
+    """Exponential season weights, most recent first: decay**0, decay**1, ... normalized to sum to 1."""
+    w = np.power(float(decay), np.arange(lookback))
+    return list(w / w.sum())
+
+def blend_stat_lines(weekly: pd.DataFrame, data_years: list[int], blend_weights: list[float],
+                     min_games: int) -> pd.DataFrame:
+    """
+    Blended per-game stat lines, one row per player (index player_id, columns OFFENSE_STATS).
+
+    Each player-season with at least min_games games contributes its per-game stats
+    with that season's weight; weights are renormalized over the seasons a player has.
+    Scoring is linear, so scoring these lines gives the blended points per game for
+    any league settings without re-aggregating the weekly data.
+
+    Weekly rows are accumulated into a dense players x seasons x stats array (one
+    bincount per stat) and blended with a single einsum, so the cost barely depends
+    on the number of seasons. Player-season summary rows (with a games column, see
+    connectors.nflverse.summarize_weekly) are accepted in place of weekly rows.
+    """
+    season_idx = pd.Index(data_years).get_indexer(weekly['season'])
+    data = weekly[season_idx >= 0]
+    if data.empty:
+        return pd.DataFrame(columns=OFFENSE_STATS, index=pd.Index([], name='player_id'))
+    seasons = season_idx[season_idx >= 0]
+    codes, ids = pd.factorize(data['player_id'])
+    n_players, n_seasons = len(ids), len(data_years)
+    cell = codes * n_seasons + seasons
+
+    X = data.reindex(columns=OFFENSE_STATS, fill_value=0).fillna(0).to_numpy(dtype=float)
+    totals = np.stack([np.bincount(cell, weights=X[:, k], minlength=n_players * n_seasons)
+                       for k in range(len(OFFENSE_STATS))], axis=-1).reshape(n_players, n_seasons, -1)
+    counts = data['games'].to_numpy(dtype=float) if 'games' in data.columns else None
+    games = np.bincount(cell, weights=counts, minlength=n_players * n_seasons).reshape(n_players, n_seasons)
+
+    W = np.asarray(blend_weights, dtype=float)[None, :] * (games >= min_games)
+    per_game = totals / np.maximum(games, 1)[:, :, None]
+    total_w = W.sum(axis=1)
+    keep = total_w > 0
+    blended = np.einsum('ps,psk->pk', W[keep], per_game[keep]) / total_w[keep, None]
+    lines = pd.DataFrame(blended, index=pd.Index(ids[keep], name='player_id'), columns=OFFENSE_STATS)
+    return lines.sort_index()
+
 def apply_blended_scoring(weekly: pd.DataFrame, rosters: pd.DataFrame, cfg: ScoringConfig, 
                          data_years: list[int], blend_weights: list[float], min_games: int, 
-                         bye_weeks: dict[str, int] = None) -> list[dict]:
+                         bye_weeks: dict[str, int] = None,
+                         stat_lines: pd.DataFrame = None) -> list[dict]:
     """
     Apply blended per-game scoring using historical data.
     
@@ -172,6 +303,7 @@ def apply_blended_scoring(weekly: pd.DataFrame, rosters: pd.DataFrame, cfg: Scor
         data_years: Years to blend (most recent first)
         blend_weights: Weights for each year (most recent first)
         min_games: Minimum games to include a player-season
+        stat_lines: Precomputed blend_stat_lines() output (skips re-aggregation)
     
     Returns:
         List of player dictionaries with blended projections
@@ -179,77 +311,18 @@ def apply_blended_scoring(weekly: pd.DataFrame, rosters: pd.DataFrame, cfg: Scor
     # Get base roster info
     base = rosters[['player_id','player_name','position','team']].drop_duplicates('player_id')
     
-    # Calculate per-game stats for each year
-    yearly_ppg = {}
-    for year in data_years:
-        year_data = weekly[weekly['season'] == year].copy()
-        if year_data.empty:
-            continue
-            
-        # Aggregate to season totals and game counts
-        agg = year_data.groupby('player_id').agg({
-            'passing_yards': 'sum',
-            'passing_tds': 'sum', 
-            'interceptions': 'sum',
-            'rushing_yards': 'sum',
-            'rushing_tds': 'sum',
-            'receptions': 'sum',
-            'receiving_yards': 'sum',
-            'receiving_tds': 'sum',
-            'two_point_conversions': 'sum',
-            'fumbles_lost': 'sum',
-            'week': 'count'  # games played
-        }).reset_index()
-        agg.rename(columns={'week': 'games'}, inplace=True)
-        
-        # Filter by minimum games
-        agg = agg[agg['games'] >= min_games].copy()
-        
-        # Calculate total points and PPG
-        agg['points'] = agg.apply(lambda r: _score_row(r, cfg), axis=1)
-        agg['ppg'] = agg['points'] / agg['games']
-        
-        yearly_ppg[year] = agg[['player_id', 'ppg', 'games']].copy()
-    
-    # Blend PPG across years for each player
-    all_players = set()
-    for year_data in yearly_ppg.values():
-        all_players.update(year_data['player_id'].tolist())
-    
-    blended_projections = []
-    for player_id in all_players:
-        weighted_ppg = 0.0
-        total_weight = 0.0
-        player_data = {}
-        
-        # Blend PPG across available years
-        for i, year in enumerate(data_years):
-            if year in yearly_ppg:
-                year_data = yearly_ppg[year]
-                player_year = year_data[year_data['player_id'] == player_id]
-                if not player_year.empty:
-                    ppg = player_year.iloc[0]['ppg']
-                    weight = blend_weights[i]
-                    weighted_ppg += ppg * weight
-                    total_weight += weight
-                    if not player_data:  # Store first found data for games reference
-                        player_data = player_year.iloc[0].to_dict()
-        
-        if total_weight > 0:
-            # Normalize by actual weights used
-            final_ppg = weighted_ppg / total_weight
-            # Project to 17-game season
-            projected_points = final_ppg * 17
-            
-            blended_projections.append({
-                'player_id': player_id,
-                'projected_ppg': round(final_ppg, 2),
-                'projected_points': round(projected_points, 2)
-            })
+    # Blended per-game stat lines, scored and projected to a 17-game season
+    if stat_lines is None:
+        stat_lines = blend_stat_lines(weekly, data_years, blend_weights, min_games)
+    ppg = stat_lines.reindex(columns=OFFENSE_STATS).to_numpy(dtype=float) @ stat_weights(cfg).to_numpy()
+    blended_projections = pd.DataFrame({
+        'player_id': stat_lines.index,
+        'projected_ppg': np.round(ppg, 2),
+        'projected_points': np.round(ppg * 17, 2),
+    })
     
     # Merge with roster data
-    blend_df = pd.DataFrame(blended_projections)
-    df = base.merge(blend_df, on='player_id', how='inner')
+    df = base.merge(blended_projections, on='player_id', how='inner')
     
     # Keep offense for v0  
     df = df[df['position'].isin(OFFENSE_POS)].copy()
@@ -274,15 +347,46 @@ def apply_blended_scoring(weekly: pd.DataFrame, rosters: pd.DataFrame, cfg: Scor
     return players
 
 
+def summary_points(summary: pd.DataFrame, cfg: ScoringConfig) -> pd.DataFrame:
+    """
+    Weekly points moments of player-season summary rows (same index as summary).
+
+    Returns games, points (season total), ppg and stdev (population standard
+    deviation of weekly points), computed from the stat sums and cross-product
+    sums without the weekly rows.
+    """
+    w = stat_weights(cfg).to_numpy()
+    points = _stat_matrix(summary) @ w
+    pair_w = np.array([w[OFFENSE_STATS.index(a)] * w[OFFENSE_STATS.index(b)] * (1 if a == b else 2)
+                       for a, b in STAT_PAIRS])
+    points_sq = summary.reindex(columns=PAIR_COLUMNS, fill_value=0).fillna(0).to_numpy(dtype=float) @ pair_w
+    games = summary['games'].to_numpy(dtype=float)
+    n = np.maximum(games, 1)
+    ppg = points / n
+    var = np.maximum(points_sq / n - ppg ** 2, 0.0)
+    return pd.DataFrame({'games': games, 'points': np.round(points, 2), 'ppg': np.round(ppg, 2),
+                         'stdev': np.round(np.sqrt(var), 2)}, index=summary.index)
+
+def season_stat_lines(weekly: pd.DataFrame) -> pd.DataFrame:
+    """
+    Season stat totals, one row per player (index player_id, columns OFFENSE_STATS).
+
+    Works on weekly rows or player-season summary rows alike.
+    """
+    return weekly.reindex(columns=OFFENSE_STATS, fill_value=0).groupby(weekly['player_id']).sum()
+
 def apply_scoring(weekly: pd.DataFrame, rosters: pd.DataFrame, cfg: ScoringConfig, 
-                 bye_weeks: dict[str, int] = None) -> list[dict]:
-    # aggregate to season totals
-    agg = weekly.groupby('player_id', as_index=False).sum(numeric_only=True)
+                 bye_weeks: dict[str, int] = None,
+                 stat_lines: pd.DataFrame = None) -> list[dict]:
+    # aggregate to season totals (or reuse precomputed season_stat_lines())
+    if stat_lines is None:
+        stat_lines = season_stat_lines(weekly)
+    agg = stat_lines.rename_axis('player_id').reset_index()
     # join back names/pos/team (prefer rosters)
     base = rosters[['player_id','player_name','position','team']].drop_duplicates('player_id')
     df = base.merge(agg, on='player_id', how='left')
     # score
-    df['points'] = df.apply(lambda r: _score_row(r, cfg), axis=1)
+    df['points'] = score_stats(df, cfg)
     # keep offense for v0
     df = df[df['position'].isin(OFFENSE_POS)].copy()
     # basic fields
@@ -0,0 +1,177 @@
+"""
+Monte Carlo mock-draft simulator: availability of every player at each of our picks.
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+import math
+import numpy as np
+
+from .slots import roster_slots, NO_BENCH_POSITIONS
+from .snake import snake_team_order, snake_pick_numbers
+
+DEFAULT_CAPS = {'QB': 3, 'RB': 8, 'WR': 8, 'TE': 3, 'K': 1, 'DEF': 1, 'DST': 1}
+DEFAULT_NEEDS = {'QB': 1, 'RB': 2, 'WR': 2, 'TE': 1, 'K': 1, 'DEF': 1, 'DST': 1}
+
+
+def position_caps(cfg) -> Dict[str, int]:
+    """
+    Max players per position a team will draft, from the league roster.
+
+    Starter slots a position can fill, plus half the bench for positions that get
+    benched at all (K/DEF are capped at their starting count).
+    """
+    caps: Dict[str, int] = {}
+    bench = (getattr(cfg, 'bench', 0) or 0)
+    for slot in roster_slots(cfg):
+        for pos in slot.eligible:
+            caps[pos] = caps.get(pos, 0) + slot.count
+    for pos in caps:
+        if pos not in NO_BENCH_POSITIONS:
+            caps[pos] += math.ceil(bench / 2)
+    return caps
+
+
+def starter_needs(cfg) -> Dict[str, int]:
+    """Dedicated starters per position a team must roster by the end of the draft."""
+    needs: Dict[str, int] = {}
+    for slot in roster_slots(cfg):
+        if len(slot.eligible) == 1 or slot.name in ('DEF', 'DST'):
+            for pos in slot.eligible:
+                needs[pos] = needs.get(pos, 0) + slot.count
+    return needs
+
+
+def _board_arrays(players: List[Dict], adp: Optional[Dict[str, float]], noise: float):
+    n = len(players)
+    rank = np.array([p.get('overall_rank') or (i + 1) for i, p in enumerate(players)], dtype=float)
+    mean = rank.copy()
+    spread = np.full(n, np.nan)
+    for i, p in enumerate(players):
+        pid = p.get('player_id')
+        if adp and pid in adp:
+            mean[i] = adp[pid]
+        elif p.get('adp') is not None:
+            mean[i] = p['adp']
+        if p.get('adp_std') is not None:
+            spread[i] = p['adp_std']
+    spread = np.where(np.isnan(spread), np.maximum(1.0, noise * mean), spread)
+    return rank, mean, spread
+
+
+def _simulate_chunk(args) -> np.ndarray:
+    (n_sims, seed, rank, mean, spread, pos_code, caps, needs, order, my_team, rounds) = args
+    rng = np.random.default_rng(seed)
+    n_players = len(rank)
+    teams = int(order.max()) + 1
+    my_picks = int((order == my_team).sum())
+
+    # One noisy board per simulated opponent
+    boards = mean[None, None, :] + spread[None, None, :] * rng.standard_normal(
+        (n_sims, teams, n_players)).astype(np.float32)
+    taken = np.zeros((n_sims, n_players), dtype=bool)
+    counts = np.zeros((n_sims, teams, len(caps)), dtype=np.int16)
+    survived = np.zeros((n_players, my_picks), dtype=np.int64)
+    rows = np.arange(n_sims)
+    my_k = 0
+
+    for pick_idx, team in enumerate(order):
+        team_counts = counts[:, team, :]
+        # Positional needs: caps always apply; once remaining picks only cover the
+        # unfilled starters, restrict to those positions.
+        rounds_left = rounds - pick_idx // teams
+        missing = np.maximum(needs[None, :] - team_counts, 0)
+        force = rounds_left <= missing.sum(axis=1)
+        allowed = np.where(force[:, None], missing > 0, team_counts < caps[None, :])
+        blocked = taken | ~allowed[:, pos_code]
+
+        if team == my_team:
+            survived[:, my_k] += (~taken).sum(axis=0)
+            my_k += 1
+            if my_k == my_picks:
+                break
+            key = np.where(blocked, np.inf, rank[None, :])
+        else:
+            key = np.where(blocked, np.inf, boards[:, team, :])
+
+        choice = key.argmin(axis=1)
+        ok = np.isfinite(key[rows, choice])
+        taken[rows[ok], choice[ok]] = True
+        counts[rows[ok], team, pos_code[choice[ok]]] += 1
+
+    return survived
+
+
+def simulate_availability(players: List[Dict], teams: int = 12, slot: int = 1, rounds: int = 16,
+                          n_sims: int = 2000, adp: Optional[Dict[str, float]] = None,
+                          noise: float = 0.15, caps: Optional[Dict[str, int]] = None,
+                          needs: Optional[Dict[str, int]] = None, workers: int = 1,
+                          seed: int = 42, chunk_size: int = 250) -> np.ndarray:
+    """
+    Probability that each player is still on the board at each of our picks.
+
+    Opponents draft from their own noisy copy of ADP (falling back to
+    `overall_rank`), subject to position caps and late-draft starter needs; our
+    team drafts the board best-available. Each chunk of simulations is one batch
+    of NumPy operations per pick.
+
+    Args:
+        players: Exported board (player dicts with player_id, pos, overall_rank; optional adp/adp_std)
+        teams: League size
+        slot: Our draft slot (1-based)
+        rounds: Draft rounds
+        n_sims: Number of simulated drafts
+        adp: Optional player_id -> ADP; overrides board `adp` values
+        noise: ADP standard deviation as a fraction of ADP when no adp_std is known
+        caps: Max players per position per team (default DEFAULT_CAPS)
+        needs: Starters per position each team must draft (default DEFAULT_NEEDS)
+        workers: Processes to spread chunks over (1 = run inline)
+        seed: Base seed; each chunk gets a child of SeedSequence(seed)
+        chunk_size: Simulations per vectorized batch (bounds memory)
+
+    Returns:
+        Array of shape (len(players), rounds) aligned with `players` and
+        snake_pick_numbers(teams, slot, rounds).
+
+    Only the top of the board (by ADP or rank) can be drafted in the sims; players
+    below that pool are reported as always available.
+    """
+    caps = caps or DEFAULT_CAPS
+    needs = needs or DEFAULT_NEEDS
+    n_players = len(players)
+    my_picks = len(snake_pick_numbers(teams, slot, rounds))
+    if n_players == 0:
+        return np.ones((0, my_picks))
+
+    rank, mean, spread = _board_arrays(players, adp, noise)
+
+    # Restrict to the draftable pool
+    total_picks = teams * rounds
+    pool_size = min(n_players, int(total_picks * 1.5) + teams)
+    pool = np.union1d(np.argsort(mean, kind='stable')[:pool_size],
+                      np.argsort(rank, kind='stable')[:pool_size])
+
+    positions = sorted({players[i]['pos'] for i in pool})
+    pos_index = {pos: j for j, pos in enumerate(positions)}
+    pos_code = np.array([pos_index[players[i]['pos']] for i in pool])
+    cap_arr = np.array([caps.get(pos, rounds) for pos in positions], dtype=np.int16)
+    need_arr = np.array([needs.get(pos, 0) for pos in positions], dtype=np.int16)
+    order = snake_team_order(teams, rounds)
+
+    n_chunks = max(1, math.ceil(n_sims / chunk_size))
+    sizes = [chunk_size] * (n_chunks - 1) + [n_sims - chunk_size * (n_chunks - 1)]
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+    jobs = [(size, s, rank[pool], mean[pool].astype(np.float32), spread[pool].astype(np.float32),
+             pos_code, cap_arr, need_arr, order, slot - 1, rounds)
+            for size, s in zip(sizes, seeds)]
+
+    if workers > 1 and n_chunks > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool_exec:
+            results = list(pool_exec.map(_simulate_chunk, jobs))
+    else:
+        results = [_simulate_chunk(job) for job in jobs]
+
+    survived = np.sum(results, axis=0)
+    probs = np.ones((n_players, my_picks))
+    probs[pool, :survived.shape[1]] = survived / n_sims
+    return probs
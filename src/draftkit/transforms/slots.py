@@ -0,0 +1,157 @@
+"""
+Roster slot definitions and a greedy slot-filling allocator.
+
+The league YAML `roster` section is turned into a list of slots, each with an
+eligibility set (e.g. FLEX -> RB/WR/TE, SUPERFLEX -> QB/RB/WR/TE, IDP -> DL/LB/DB).
+Slots are filled narrowest-eligibility first using a priority queue over the
+heads of each position's sorted points list, so the cost is one sort per
+position plus O(slots * log(positions)) regardless of league format.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Dict, List, Tuple, Iterable
+import heapq
+import numpy as np
+
+# Known slot names -> eligible positions. 'FLEX' is resolved from cfg.flex_positions.
+SLOT_ELIGIBILITY: Dict[str, Tuple[str, ...]] = {
+    'QB': ('QB',),
+    'RB': ('RB',),
+    'WR': ('WR',),
+    'TE': ('TE',),
+    'K': ('K',),
+    'DEF': ('DEF', 'DST'),
+    'DST': ('DEF', 'DST'),
+    'WRRB': ('RB', 'WR'),
+    'RBWR': ('RB', 'WR'),
+    'WRTE': ('WR', 'TE'),
+    'SUPERFLEX': ('QB', 'RB', 'WR', 'TE'),
+    'SFLEX': ('QB', 'RB', 'WR', 'TE'),
+    'OP': ('QB', 'RB', 'WR', 'TE'),
+    # IDP
+    'DL': ('DL', 'DE', 'DT'),
+    'DE': ('DE',),
+    'DT': ('DT',),
+    'LB': ('LB', 'ILB', 'OLB', 'MLB'),
+    'DB': ('DB', 'CB', 'S', 'SS', 'FS'),
+    'CB': ('CB',),
+    'S': ('S', 'SS', 'FS'),
+    'IDP': ('DL', 'DE', 'DT', 'LB', 'ILB', 'OLB', 'MLB', 'DB', 'CB', 'S', 'SS', 'FS'),
+}
+
+# Roster keys that never hold a weekly starter
+NON_STARTING_KEYS = {'BN', 'BENCH', 'IR'}
+
+# Positions nobody rosters a backup of
+NO_BENCH_POSITIONS = {'K', 'DEF', 'DST'}
+
+
+@dataclass(frozen=True)
+class RosterSlot:
+    name: str
+    count: int                  # slots of this type per team
+    eligible: Tuple[str, ...]
+    starter: bool = True
+
+
+def roster_slots(cfg, include_bench: bool = False) -> List[RosterSlot]:
+    """
+    Build the slot list from a ScoringConfig.
+
+    Roster keys are looked up in SLOT_ELIGIBILITY; custom slots can be declared in
+    the YAML `slot_eligibility` section (e.g. {'WRT': ['WR', 'TE']}). Unknown keys are
+    treated as a dedicated slot for the position of the same name.
+
+    Bench slots (YAML `bench`, or a `BN` roster key) are appended when include_bench
+    is True and accept every starting position except K/DEF.
+    """
+    roster = cfg.roster or {}
+    flex_positions = tuple(cfg.flex_positions or ['RB', 'WR', 'TE'])
+    custom = getattr(cfg, 'slot_eligibility', None) or {}
+
+    slots = []
+    for name, count in roster.items():
+        key = str(name).upper()
+        if key in NON_STARTING_KEYS or not count:
+            continue
+        if key in custom:
+            eligible = tuple(p.upper() for p in custom[key])
+        elif key == 'FLEX':
+            eligible = flex_positions
+        else:
+            eligible = SLOT_ELIGIBILITY.get(key, (key,))
+        slots.append(RosterSlot(key, int(count), eligible))
+
+    if include_bench:
+        bench = getattr(cfg, 'bench', 0) or 0
+        bench += sum(int(v) for k, v in roster.items() if str(k).upper() in ('BN', 'BENCH'))
+        if bench:
+            bench_pos = []
+            for slot in slots:
+                for pos in slot.eligible:
+                    if pos not in NO_BENCH_POSITIONS and pos not in bench_pos:
+                        bench_pos.append(pos)
+            slots.append(RosterSlot('BN', int(bench), tuple(bench_pos), starter=False))
+    return slots
+
+
+def _allocate(points_by_pos: Dict[str, np.ndarray], slots: List[RosterSlot], teams: int):
+    taken = {pos: 0 for pos in points_by_pos}
+    used = [0] * len(slots)
+    total = 0.0
+    ordered = sorted(range(len(slots)), key=lambda i: (len(slots[i].eligible), i))
+    for i in ordered:
+        slot = slots[i]
+        need = slot.count * teams
+        heap = []
+        for pos in slot.eligible:
+            pts = points_by_pos.get(pos)
+            if pts is not None and taken[pos] < len(pts):
+                heap.append((-float(pts[taken[pos]]), pos))
+        heapq.heapify(heap)
+        while need > 0 and heap:
+            neg_pts, pos = heapq.heappop(heap)
+            total -= neg_pts
+            taken[pos] += 1
+            used[i] += 1
+            need -= 1
+            pts = points_by_pos[pos]
+            if taken[pos] < len(pts):
+                heapq.heappush(heap, (-float(pts[taken[pos]]), pos))
+    return taken, total, used
+
+
+def fill_slots(points_by_pos: Dict[str, np.ndarray], slots: Iterable[RosterSlot],
+               teams: int = 1) -> Tuple[Dict[str, int], float]:
+    """
+    Greedily fill `teams` copies of every slot from per-position point arrays.
+
+    Args:
+        points_by_pos: Position -> points sorted descending
+        slots: Slots to fill (see roster_slots)
+        teams: Number of teams sharing the pool
+
+    Returns:
+        (players taken per position, total points of the players taken)
+
+    Slots are processed from the narrowest eligibility set to the widest, which is
+    optimal when eligibility sets nest (QB ⊂ SUPERFLEX, RB ⊂ FLEX ⊂ BN, ...).
+    Within a slot type a heap over the next-best player of each eligible position
+    picks the best remaining player in O(log positions).
+    """
+    taken, total, _ = _allocate(points_by_pos, list(slots), teams)
+    return taken, total
+
+
+def open_slots(points_by_pos: Dict[str, np.ndarray], slots: Iterable[RosterSlot]) -> List[RosterSlot]:
+    """Slots one team still has to fill after placing the players it already rosters."""
+    slots = list(slots)
+    _, _, used = _allocate(points_by_pos, slots, 1)
+    return [RosterSlot(s.name, s.count - u, s.eligible, s.starter) for s, u in zip(slots, used)]
+
+
+def replacement_counts(points_by_pos: Dict[str, np.ndarray], cfg,
+                       include_bench: bool = False) -> Dict[str, int]:
+    """Number of players per position rostered league-wide under cfg's roster settings."""
+    taken, _ = fill_slots(points_by_pos, roster_slots(cfg, include_bench), cfg.teams)
+    return taken
@@ -0,0 +1,32 @@
+"""
+Snake-draft pick order helpers.
+"""
+from __future__ import annotations
+from typing import List
+import numpy as np
+
+
+def snake_team_order(teams: int, rounds: int) -> np.ndarray:
+    """0-based team index on the clock for every overall pick (length teams * rounds)."""
+    forward = np.arange(teams)
+    order = [forward if r % 2 == 0 else forward[::-1] for r in range(rounds)]
+    return np.concatenate(order) if order else np.zeros(0, dtype=int)
+
+
+def snake_pick_numbers(teams: int, slot: int, rounds: int) -> List[int]:
+    """1-based overall pick numbers for draft slot `slot` (1..teams)."""
+    if not 1 <= slot <= teams:
+        raise ValueError(f"slot must be between 1 and {teams}, got {slot}")
+    picks = []
+    for r in range(rounds):
+        if r % 2 == 0:
+            picks.append(r * teams + slot)
+        else:
+            picks.append(r * teams + teams - slot + 1)
+    return picks
+
+
+def draft_rounds(cfg, default: int = 16) -> int:
+    """Rounds in the draft: every starting and bench slot gets one pick."""
+    roster_size = sum(int(v) for v in (cfg.roster or {}).values()) + (getattr(cfg, 'bench', 0) or 0)
+    return roster_size or default
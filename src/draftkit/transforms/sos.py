@@ -0,0 +1,117 @@
+"""
+Defense-vs-position strength of schedule: points each defense allowed to each
+position, and the target-year matchup multipliers, sos and sos_rank built on it.
+"""
+from __future__ import annotations
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..connectors.schedule import OpponentMatrix, opponent_matrix
+from .scoring import OFFENSE_POS
+
+POSITIONS = sorted(OFFENSE_POS)
+
+
+def dvp_table(points: pd.DataFrame, schedule: pd.DataFrame, season_weights: Dict[int, float],
+              positions: Sequence[str] = POSITIONS) -> pd.DataFrame:
+    """
+    Points allowed per game by each defense to each position, as a multiple of the league average.
+
+    Player-weeks are charged to the defense faced by indexing that season's
+    opponent matrix at (team, week), so there is no schedule merge, and one
+    bincount over (defense, position) gives the points allowed. Seasons are
+    blended with the weights and divided by the weighted games.
+
+    Args:
+        points: Weekly rows with season, week, position, recent_team and weekly_points
+        schedule: Regular-season games (season, week, home_team, away_team) for those seasons
+        season_weights: Season -> blend weight
+        positions: Positions to tabulate
+
+    Returns:
+        DataFrame of multipliers, teams x positions
+    """
+    seasons = list(season_weights)
+    teams = sorted(set(schedule['home_team']) | set(schedule['away_team']))
+    matrices = [opponent_matrix(schedule, season, teams) for season in seasons]
+    n_teams, n_pos = len(teams), len(positions)
+    n_weeks = max([m.opponents.shape[1] for m in matrices] + [1])
+    O = np.full((len(seasons), n_teams, n_weeks), -1, dtype=np.int16)
+    for i, m in enumerate(matrices):
+        O[i, :, :m.opponents.shape[1]] = m.opponents
+    W = np.asarray([season_weights[s] for s in seasons], dtype=float)
+
+    s = pd.Index(seasons).get_indexer(points['season'])
+    t = pd.Index(teams).get_indexer(points['recent_team'])
+    p = pd.Index(positions).get_indexer(points['position'])
+    w = points['week'].to_numpy(dtype=int) - 1
+    ok = (s >= 0) & (t >= 0) & (p >= 0) & (w >= 0) & (w < n_weeks)
+    s, t, p, w = s[ok], t[ok], p[ok], w[ok]
+    x = points['weekly_points'].to_numpy(dtype=float)[ok]
+
+    defense = O[s, t, w].astype(int)
+    faced = defense >= 0                        # playoff weeks and unknown games drop out here
+    allowed = np.bincount(defense[faced] * n_pos + p[faced], weights=W[s[faced]] * x[faced],
+                          minlength=n_teams * n_pos).reshape(n_teams, n_pos)
+    games = np.einsum('s,stw->t', W, (O >= 0).astype(float))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        per_game = allowed / games[:, None]
+        league = allowed.sum(axis=0) / games.sum()
+        table = per_game / league[None, :]
+    return pd.DataFrame(table, index=pd.Index(teams, name='team'), columns=list(positions)).fillna(1.0)
+
+
+def matchup_multipliers(matrix: OpponentMatrix, table: pd.DataFrame, teams: Sequence[str],
+                        positions: Sequence[str]) -> np.ndarray:
+    """
+    players x weeks matchup multipliers for the target year: table[opponent[team, week], position].
+
+    0 on byes, and 1 for teams or positions without a table entry.
+
+    Args:
+        matrix: Target-year OpponentMatrix
+        table: dvp_table output
+        teams, positions: Each player's team and position
+    """
+    n_teams, n_weeks = matrix.opponents.shape
+    cols = list(table.columns)
+    # Rows: the team axis, then a bye row of zeros and an unknown-team row of ones;
+    # the last column (ones except on byes) serves positions without a table entry
+    lookup = np.ones((n_teams + 2, len(cols) + 1))
+    lookup[:n_teams, :len(cols)] = table.reindex(index=matrix.teams, columns=cols).fillna(1.0).to_numpy()
+    lookup[n_teams] = 0.0
+
+    t = matrix.team_index(teams)
+    opp = np.full((len(t), n_weeks), n_teams + 1, dtype=int)
+    opp[t >= 0] = matrix.opponents[t[t >= 0]]
+    opp[opp < 0] = n_teams
+    p = pd.Index(cols).get_indexer(list(positions))
+    p[p < 0] = len(cols)
+    return lookup[opp, p[:, None]]
+
+
+def sos_ranks(multipliers: np.ndarray, positions: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+    """(sos, sos_rank): mean multiplier over non-bye weeks and its rank within each position (1 = softest)."""
+    games = (multipliers > 0).sum(axis=1)
+    sos = multipliers.sum(axis=1) / np.maximum(games, 1)
+    pos = np.asarray(positions, dtype=object)
+    rank = np.zeros(len(sos), dtype=int)
+    for p in pd.unique(pos):
+        rows = np.flatnonzero(pos == p)
+        rank[rows] = pd.Series(-sos[rows]).rank(method='min').to_numpy(dtype=int)
+    return sos, rank
+
+
+def add_sos(players: List[Dict], matrix: OpponentMatrix, table: pd.DataFrame) -> List[Dict]:
+    """Set sos and sos_rank on offense players whose team is on the target-year schedule."""
+    codes = matrix.team_index([p.get('tm') for p in players])
+    board = [p for p, c in zip(players, codes) if c >= 0 and p.get('pos') in table.columns]
+    if not board:
+        return players
+    positions = [p['pos'] for p in board]
+    sos, rank = sos_ranks(matchup_multipliers(matrix, table, [p['tm'] for p in board], positions), positions)
+    for p, s, r in zip(board, sos, rank):
+        p['sos'], p['sos_rank'] = round(float(s), 3), int(r)
+    return players
@@ -0,0 +1,146 @@
+"""
+Parameter sweeps: the board's overall ranks under every combination of blend
+weights, min-games, onesie discounts and league size, without rerunning build.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, replace
+from itertools import product
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .scoring import OFFENSE_POS, ScoringConfig
+from .tiers import compute_replacement_and_vorp
+from .tune import season_arrays
+
+
+@dataclass(frozen=True)
+class Variant:
+    """One point of the sweep grid."""
+    blend: Tuple[float, ...]
+    min_games: int
+    onesie: Tuple[Tuple[str, float], ...]
+    teams: int
+
+    @property
+    def label(self) -> str:
+        blend = '/'.join(f"{w:g}" for w in self.blend)
+        onesie = ','.join(f"{pos.lower()}={d:g}" for pos, d in self.onesie) or '-'
+        return f"b={blend} mg={self.min_games} os={onesie} t={self.teams}"
+
+
+def variant_grid(blends: List[List[float]], min_games: List[int], onesies: List[Dict[str, float]],
+                 teams: List[int]) -> List[Variant]:
+    """Every combination of the grids; the first variant (all first values) is the base."""
+    blends = [tuple(w / sum(b) for w in b) for b in blends]
+    onesies = [tuple(sorted(o.items())) for o in onesies]
+    return [Variant(b, int(m), o, int(t)) for b, m, o, t in product(blends, min_games, onesies, teams)]
+
+
+def blended_points(arrays: Dict, variants: List[Variant]) -> Dict[Tuple, np.ndarray]:
+    """
+    Projected season points (17 x blended points per game) for every distinct
+    (blend, min_games) of the grid; NaN where a player has no qualifying season.
+
+    Scoring is linear, so each min-games value is one masked matrix product over
+    the players x seasons arrays of tune.season_arrays.
+    """
+    ppg = arrays['points'] / np.maximum(arrays['games'], 1)
+    blends = sorted({v.blend for v in variants})
+    W = np.asarray(blends, dtype=float)
+    out = {}
+    for min_games in sorted({v.min_games for v in variants}):
+        M = arrays['games'] >= min_games
+        num = (ppg * M) @ W.T
+        den = M.astype(float) @ W.T
+        with np.errstate(invalid='ignore', divide='ignore'):
+            pts = np.where(den > 0, np.round(num / den * 17, 2), np.nan)
+        for j, blend in enumerate(blends):
+            out[(blend, min_games)] = pts[:, j]
+    return out
+
+
+def run_sweep(weekly: pd.DataFrame, rosters: pd.DataFrame, data_years: List[int], cfg: ScoringConfig,
+              variants: List[Variant], fixed: Optional[List[Dict]] = None,
+              include_bench: bool = False) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Overall rank of every player under every variant.
+
+    The weekly data is reduced once; each variant only reruns replacement levels
+    and VORP ranking. `fixed` DST and kicker points are reused by every variant.
+
+    Args:
+        weekly: Weekly offense stats covering data_years
+        rosters: Rosters for names and positions (as in apply_blended_scoring)
+        data_years: Seasons blended, most recent first (matching each variant's blend)
+        cfg: Scoring and roster config; teams is taken from each variant
+        variants: variant_grid() output
+        fixed: Already scored DST/kicker players (name, pos, tm, points, player_id?)
+        include_bench: As in build
+
+    Returns:
+        (players, ranks): players has key, name, pos, tm; ranks is players x
+        variants (columns are variant labels) with NaN for unranked players
+    """
+    arrays = season_arrays(weekly, data_years, cfg)
+    base = rosters[['player_id', 'player_name', 'position', 'team']].drop_duplicates('player_id')
+    base = base[base['position'].isin(OFFENSE_POS)]
+    row = pd.Index(arrays['ids']).get_indexer(base['player_id'])
+    base, row = base[row >= 0], row[row >= 0]
+
+    players = pd.DataFrame({'key': base['player_id'].to_numpy(), 'name': base['player_name'].to_numpy(),
+                            'pos': base['position'].to_numpy(), 'tm': base['team'].to_numpy()})
+    unique = {}
+    for p in fixed or []:
+        unique.setdefault(p.get('player_id') or p['name'], p)  # duplicate kicker rows: keep the first
+    fixed_keys, fixed = list(unique), list(unique.values())
+    players = pd.concat([players, pd.DataFrame({'key': fixed_keys,
+                                                'name': [p['name'] for p in fixed],
+                                                'pos': [p['pos'] for p in fixed],
+                                                'tm': [p.get('tm') for p in fixed]})], ignore_index=True)
+    fixed_points = [float(p['points']) for p in fixed]
+    code = {k: i for i, k in enumerate(players['key'])}
+
+    points = blended_points(arrays, variants)
+    ranks = np.full((len(players), len(variants)), np.nan)
+    for j, variant in enumerate(variants):
+        pts = points[(variant.blend, variant.min_games)][row]
+        board = [{'key': k, 'pos': p, 'points': float(x)}
+                 for k, p, x in zip(players['key'][:len(row)], players['pos'][:len(row)], pts) if not np.isnan(x)]
+        board += [{'key': k, 'pos': p['pos'], 'points': x} for k, p, x in zip(fixed_keys, fixed, fixed_points)]
+        ranked = compute_replacement_and_vorp(board, replace(cfg, teams=variant.teams), dict(variant.onesie),
+                                              include_bench)
+        for p in ranked:
+            ranks[code[p['key']], j] = p['overall_rank']
+    return players, pd.DataFrame(ranks, index=players['key'], columns=[v.label for v in variants])
+
+
+def rank_changes(players: pd.DataFrame, ranks: pd.DataFrame, top: int = 100) -> pd.DataFrame:
+    """
+    One row per variant comparing it with the base variant (first column):
+
+        mean_abs     mean absolute overall-rank change over the base top `top`
+        turnover     players of the base top `top` that drop out of it
+        riser/faller biggest move up/down ("name +k") among players in either top `top`
+
+    Players a variant doesn't rank count as ranked last.
+    """
+    names = players.drop_duplicates('key').set_index('key')['name']
+    last = len(ranks) + 1
+    base = ranks.iloc[:, 0].fillna(last)
+    in_top = base <= top
+    rows = []
+    for label in ranks.columns:
+        r = ranks[label].fillna(last)
+        delta = base - r
+        scope = delta[in_top | (r <= top)]
+        up, down = scope.idxmax(), scope.idxmin()
+        rows.append({
+            'variant': label,
+            'mean_abs': round(float(delta[in_top].abs().mean()), 2),
+            'turnover': int((r[in_top] > top).sum()),
+            'riser': f"{names[up]} {int(scope[up]):+d}" if scope[up] > 0 else '',
+            'faller': f"{names[down]} {int(scope[down]):+d}" if scope[down] < 0 else '',
+        })
+    return pd.DataFrame(rows)
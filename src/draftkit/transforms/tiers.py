@@ -1,9 +1,11 @@
 from __future__ import annotations
 from typing import List, Dict
-import math
 import numpy as np
 
-def compute_replacement_and_vorp(players: List[Dict], cfg, onesie_discounts: Dict[str, float] = None) -> List[Dict]:
+from .slots import replacement_counts
+
+def compute_replacement_and_vorp(players: List[Dict], cfg, onesie_discounts: Dict[str, float] = None,
+                                 include_bench: bool = False) -> List[Dict]:
     """
     Compute replacement levels and VORP for all players.
     
@@ -12,6 +14,7 @@ def compute_replacement_and_vorp(players: List[Dict], cfg, onesie_discounts: Dic
         cfg: ScoringConfig with roster settings
         onesie_discounts: Dict of position -> discount factor (e.g., {'QB': 0.90, 'TE': 1.00})
                          Applied to VORP for positions started in single quantities
+        include_bench: Also fill bench slots before taking the replacement baseline
     """
     if onesie_discounts is None:
         onesie_discounts = {}
@@ -20,55 +23,25 @@ def compute_replacement_and_vorp(players: List[Dict], cfg, onesie_discounts: Dic
     by_pos = {}
     for p in players:
         by_pos.setdefault(p['pos'], []).append(p)
-    # Determine replacement counts from roster settings
-    teams = cfg.teams
-    base_counts = {
-        'QB': cfg.roster.get('QB', 1) * teams,
-        'RB': cfg.roster.get('RB', 2) * teams,
-        'WR': cfg.roster.get('WR', 2) * teams,
-        'TE': cfg.roster.get('TE', 1) * teams,
-        'K': cfg.roster.get('K', 1) * teams,
-        'DST': cfg.roster.get('DEF', 1) * teams,  # DST position mapped from DEF config
-    }
-    # Allocate FLEX across RB/WR/TE by best available
-    flex_slots = cfg.roster.get('FLEX', 0) * teams
-    flex_pool = []
-    for pos in cfg.flex_positions:
-        for p in by_pos.get(pos, []):
-            flex_pool.append(p)
-    flex_pool.sort(key=lambda x: x['points'], reverse=True)
-    # Count how many of the top N flex players belong to each pos
-    flex_take = {'RB':0,'WR':0,'TE':0}
-    for p in flex_pool[:flex_slots]:
-        if p['pos'] in flex_take:
-            flex_take[p['pos']] += 1
-    # Final replacement counts
-    repl_counts = {
-        'QB': base_counts['QB'],
-        'RB': base_counts['RB'] + flex_take['RB'],
-        'WR': base_counts['WR'] + flex_take['WR'],
-        'TE': base_counts['TE'] + flex_take['TE'],
-        'K': base_counts['K'],
-        'DST': base_counts['DST'],
-    }
+    for plist in by_pos.values():
+        plist.sort(key=lambda x: x['points'], reverse=True)
+
+    # Replacement counts: fill every roster slot (incl. FLEX/SUPERFLEX/IDP) league-wide
+    points_by_pos = {pos: np.array([p['points'] for p in plist], dtype=float) for pos, plist in by_pos.items()}
+    repl_counts = replacement_counts(points_by_pos, cfg, include_bench)
+
     # Compute replacement baselines and VORP
     for pos, plist in by_pos.items():
-        plist.sort(key=lambda x: x['points'], reverse=True)
         n = repl_counts.get(pos, 0)
         idx = min(max(n-1, 0), len(plist)-1) if len(plist)>0 else 0
         baseline = plist[idx]['points'] if plist else 0.0
         
-        # Calculate base VORP
-        for p in plist:
+        # Apply onesie discount if specified for this position
+        discount_factor = onesie_discounts.get(pos, 1.0)
+        for rank, p in enumerate(plist, start=1):
             p['repl_pts'] = baseline
-            base_vorp = p['points'] - baseline
-            
-            # Apply onesie discount if specified for this position
-            discount_factor = onesie_discounts.get(pos, 1.0)
-            discounted_vorp = base_vorp * discount_factor
-            
-            p['vorp'] = round(discounted_vorp, 2)
-            p['pos_rank'] = 1 + plist.index(p)
+            p['vorp'] = round((p['points'] - baseline) * discount_factor, 2)
+            p['pos_rank'] = rank
     # Overall rank by VORP (after onesie discounts)
     allp = [p for plist in by_pos.values() for p in plist]
     allp.sort(key=lambda x: x['vorp'], reverse=True)
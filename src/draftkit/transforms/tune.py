@@ -0,0 +1,228 @@
+"""
+Fit blend weights and min-games thresholds to historical projection error
+(RMSE of regular-season points per game), per position.
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import yaml
+from scipy.optimize import nnls
+
+from .backtest import regular_season_mask
+from .scoring import (OFFENSE_POS, ScoringConfig, _stat_matrix, blend_stat_lines, decay_weights,
+                      stat_weights)
+
+DEFAULT = 'default'
+_SUM_TO_ONE = 1e3  # weight of the sum(w) = 1 row in the NNLS fit
+
+
+def season_arrays(weekly: pd.DataFrame, years: List[int], cfg: ScoringConfig) -> Dict:
+    """
+    players x years fantasy points and games, for all weeks (what build blends)
+    and for the regular season only (what a season is judged on; weeks <= 17
+    before 2021, <= 18 since).
+
+    Scoring is linear, so per-game points are totals @ weights / games and the
+    weekly data only has to be reduced once.
+
+    Returns:
+        dict with ids, pos (latest position), points, games, reg_points, reg_games
+    """
+    year_idx = pd.Index(years).get_indexer(weekly['season'])
+    data = weekly[year_idx >= 0]
+    year_idx = year_idx[year_idx >= 0]
+    codes, ids = pd.factorize(data['player_id'])
+    n = len(ids) * len(years)
+    cell = codes * len(years) + year_idx
+    pts = _stat_matrix(data) @ stat_weights(cfg).to_numpy()
+    regular = regular_season_mask(data)
+
+    def accumulate(mask):
+        points = np.bincount(cell[mask], weights=pts[mask], minlength=n).reshape(len(ids), len(years))
+        games = np.bincount(cell[mask], minlength=n).reshape(len(ids), len(years))
+        return points, games
+
+    points, games = accumulate(np.ones(len(data), dtype=bool))
+    reg_points, reg_games = accumulate(regular)
+    pos = data.assign(_code=codes).sort_values('season').groupby('_code')['position'].last()
+    return {'ids': ids, 'pos': pos.reindex(range(len(ids))).to_numpy(dtype=object),
+            'points': points, 'games': games, 'reg_points': reg_points, 'reg_games': reg_games}
+
+
+def history_rows(arrays: Dict, years: List[int], seasons: List[int], lookback: int,
+                 eval_games: int) -> Dict[str, np.ndarray]:
+    """
+    Stack (player, target season) rows: ppg and games over the lookback seasons
+    (most recent first) and the target's regular-season ppg.
+
+    Targets need at least `eval_games` regular-season games. A blended projection
+    of a row is then
+
+        pred = sum_s w_s m_s x_s / sum_s w_s m_s      m_s = games_s >= min_games
+    """
+    ppg = arrays['points'] / np.maximum(arrays['games'], 1)
+    target_ppg = arrays['reg_points'] / np.maximum(arrays['reg_games'], 1)
+    hist, games, target, pos = [], [], [], []
+    for season in seasons:
+        j = years.index(season)
+        cols = list(range(j - 1, j - 1 - lookback, -1))
+        keep = arrays['reg_games'][:, j] >= eval_games
+        hist.append(ppg[keep][:, cols])
+        games.append(arrays['games'][keep][:, cols])
+        target.append(target_ppg[keep, j])
+        pos.append(arrays['pos'][keep])
+    return {'hist': np.concatenate(hist), 'games': np.concatenate(games),
+            'target': np.concatenate(target), 'pos': np.concatenate(pos)}
+
+
+def simplex_lstsq(H: np.ndarray, y: np.ndarray) -> Optional[np.ndarray]:
+    """Least-squares weights with w >= 0 and sum(w) = 1 (None if underdetermined)."""
+    if len(y) <= H.shape[1]:
+        return None
+    A = np.vstack([H, np.full(H.shape[1], _SUM_TO_ONE)])
+    b = np.append(y, _SUM_TO_ONE)
+    w, _ = nnls(A, b)
+    return w / w.sum() if w.sum() > 0 else None
+
+
+def predict(H: np.ndarray, M: np.ndarray, W: np.ndarray) -> np.ndarray:
+    """
+    Blended projections for every candidate at once: rows x candidates.
+
+    A row whose qualifying seasons all weigh zero is not projected (0), as it
+    would be missing from the board.
+    """
+    num = (H * M) @ W.T
+    den = M.astype(float) @ W.T
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(den > 0, num / den, 0.0)
+
+
+def fit_group(H: np.ndarray, G: np.ndarray, y: np.ndarray, lookback: int,
+              min_games_grid: List[int], decays: List[float]) -> Dict:
+    """
+    Best season weights and min-games threshold for one group of rows.
+
+    Per min-games candidate, the weights are fitted by simplex-constrained least
+    squares on rows with a full qualifying history and compared with the decay
+    grid. Every candidate is scored with one matrix product on the same rows
+    (those every candidate can project); the lowest RMSE wins.
+
+    Returns:
+        dict with blend, min_games, method ('lsq' or 'decay=<d>'), rmse, mae, n
+    """
+    rows = (G >= max(min_games_grid)).any(axis=1)
+    H, G, y = H[rows], G[rows], y[rows]
+    best = None
+    for min_games in min_games_grid:
+        M = G >= min_games
+        candidates = [decay_weights(lookback, d) for d in decays]
+        methods = [f'decay={d:g}' for d in decays]
+        full = M.all(axis=1)
+        fitted = simplex_lstsq(H[full], y[full])
+        if fitted is not None:
+            candidates.append(list(fitted))
+            methods.append('lsq')
+        W = np.asarray(candidates, dtype=float)
+        err = predict(H, M, W) - y[:, None]
+        rmse = np.sqrt((err ** 2).mean(axis=0))
+        i = int(np.argmin(rmse))
+        if best is None or rmse[i] < best['rmse']:
+            best = {'blend': [round(float(w), 4) for w in W[i]], 'min_games': int(min_games),
+                    'method': methods[i], 'rmse': round(float(rmse[i]), 4),
+                    'mae': round(float(np.abs(err[:, i]).mean()), 4), 'n': int(len(y))}
+    return best
+
+
+def score_params(H: np.ndarray, G: np.ndarray, y: np.ndarray, blend: List[float], min_games: int,
+                 floor_games: int) -> float:
+    """RMSE of fixed weights on the rows fit_group compares (for baselines)."""
+    rows = (G >= floor_games).any(axis=1)
+    err = predict(H[rows], G[rows] >= min_games, np.asarray([blend], dtype=float))[:, 0] - y[rows]
+    return float(np.sqrt((err ** 2).mean()))
+
+
+def tune_blend(weekly: pd.DataFrame, seasons: List[int], lookback: int, cfg: ScoringConfig,
+               min_games_grid: List[int], decays: List[float], eval_games: int = 8,
+               baseline: Optional[Dict] = None) -> Dict:
+    """
+    Fit per-position (and pooled 'default') blend weights and min-games.
+
+    Args:
+        weekly: Weekly stats covering seasons[0] - lookback .. seasons[-1]
+        seasons: Target seasons used as ground truth
+        lookback: Seasons blended per projection
+        cfg: Scoring config (errors are in these fantasy points per game)
+        min_games_grid: Candidate min-games thresholds
+        decays: Candidate decay rates (alongside the least-squares fit)
+        eval_games: Regular-season games a target season needs to count
+        baseline: Optional {'blend': [...], 'min_games': n} scored for comparison
+
+    Returns:
+        dict ready for write_tuned: lookback, seasons, default and positions
+    """
+    years = list(range(seasons[0] - lookback, seasons[-1] + 1))
+    rows = history_rows(season_arrays(weekly, years, cfg), years, seasons, lookback, eval_games)
+    groups = {DEFAULT: np.isin(rows['pos'], list(OFFENSE_POS))}
+    groups.update({pos: rows['pos'] == pos for pos in sorted(OFFENSE_POS)})
+
+    fitted = {}
+    for name, mask in groups.items():
+        H, G, y = rows['hist'][mask], rows['games'][mask], rows['target'][mask]
+        fitted[name] = fit_group(H, G, y, lookback, min_games_grid, decays)
+        if baseline and fitted[name]:
+            fitted[name]['baseline_rmse'] = round(score_params(H, G, y, baseline['blend'], baseline['min_games'],
+                                                               max(min_games_grid)), 4)
+    return {'lookback': lookback, 'seasons': [seasons[0], seasons[-1]],
+            DEFAULT: fitted.pop(DEFAULT), 'positions': fitted}
+
+
+def write_tuned(tuned: Dict, path: Path) -> Path:
+    """Write the fitted parameters as YAML (consumed by build --tuned)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open('w') as f:
+        f.write(f"# Blend weights fitted by draftkit tune on {tuned['seasons'][0]}-{tuned['seasons'][1]}\n")
+        f.write("# Use with: python -m draftkit build --tuned <this file>\n")
+        yaml.safe_dump(tuned, f, sort_keys=False, default_flow_style=None)
+    return path
+
+
+def load_tuned(path: Path) -> Dict:
+    """Read a tune YAML, checking each entry's weights against its lookback."""
+    with open(path) as f:
+        tuned = yaml.safe_load(f) or {}
+    lookback = int(tuned.get('lookback', 0))
+    entries = {DEFAULT: tuned.get(DEFAULT), **(tuned.get('positions') or {})}
+    if not entries[DEFAULT]:
+        raise ValueError(f"{path} has no '{DEFAULT}' entry")
+    for name, entry in entries.items():
+        if entry and len(entry.get('blend', [])) != lookback:
+            raise ValueError(f"{path}: {name} blend has {len(entry.get('blend', []))} weights, lookback is {lookback}")
+    return tuned
+
+
+def tuned_stat_lines(weekly: pd.DataFrame, data_years: List[int], tuned: Dict,
+                     positions: pd.Series) -> pd.DataFrame:
+    """
+    blend_stat_lines with each position's own weights and min-games (weekly or summary rows).
+
+    Args:
+        positions: player_id -> position (players without one use the default entry)
+    """
+    default = tuned[DEFAULT]
+    per_pos = tuned.get('positions') or {}
+    pos = positions[~positions.index.duplicated()].reindex(weekly['player_id']).to_numpy()
+    frames = []
+    for name, entry in [(DEFAULT, default)] + list(per_pos.items()):
+        if name == DEFAULT:
+            mask = ~np.isin(pos, list(per_pos))
+        else:
+            mask = pos == name
+        if mask.any():
+            frames.append(blend_stat_lines(weekly[mask], data_years, entry['blend'], int(entry['min_games'])))
+    return pd.concat(frames).sort_index() if frames else blend_stat_lines(weekly, data_years, default['blend'],
+                                                                          int(default['min_games']))
@@ -0,0 +1,97 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from draftkit.connectors.adp import load_adp, read_adp_file, snapshot_key
+from draftkit.transforms.adp import add_adp
+from draftkit.transforms.names import NameIndex
+
+
+def _board():
+    return [
+        {'player_id': '00-1', 'name': "Ja'Marr Chase", 'pos': 'WR', 'tm': 'CIN', 'overall_rank': 1},
+        {'player_id': '00-2', 'name': 'Bijan Robinson', 'pos': 'RB', 'tm': 'ATL', 'overall_rank': 2},
+        {'player_id': 'DEF-BUF', 'name': 'BUF D/ST', 'pos': 'DEF', 'tm': 'BUF', 'overall_rank': 3},
+        {'name': 'Brandon Aubrey', 'pos': 'K', 'tm': 'DAL', 'overall_rank': 4},
+        {'player_id': '00-5', 'name': 'Deep Sleeper', 'pos': 'TE', 'tm': 'NYJ', 'overall_rank': 5},
+    ]
+
+
+def _index():
+    return NameIndex(pd.DataFrame([
+        {'player_id': '00-1', 'name': "Ja'Marr Chase", 'pos': 'WR', 'tm': 'CIN'},
+        {'player_id': '00-2', 'name': 'Bijan Robinson', 'pos': 'RB', 'tm': 'ATL'},
+        {'player_id': '00-9', 'name': 'Brandon Aubrey', 'pos': 'K', 'tm': 'DAL'},
+    ]))
+
+
+class TestReadAdp:
+    """Test cases for reading local ADP dumps."""
+
+    def test_csv_aliases_and_json_shapes(self, tmp_path):
+        """Site column names map to ours; JSON lists, wrappers and id maps all load."""
+        csv = tmp_path / "ffc_2025-08-01.csv"
+        csv.write_text("Name,Position,Team,ADP,Stdev,High,Low\nJamarr Chase,WR,CIN,1.4,0.6,1,3\nBills,DST,BUF,90,,,\n")
+        df = read_adp_file(csv)
+        assert list(df['name']) == ['Jamarr Chase', 'Bills']
+        assert list(df['pos']) == ['WR', 'DEF']
+        assert df['adp_std'].iloc[0] == 0.6 and df['adp_low'].iloc[0] == 3
+
+        wrapped = tmp_path / "sleeper.json"
+        wrapped.write_text(json.dumps({'players': [{'id': '00-2', 'full_name': 'Bijan Robinson', 'adp': 2.5}]}))
+        by_id = tmp_path / "ud.json"
+        by_id.write_text(json.dumps({'00-2': {'name': 'Bijan Robinson', 'adp': 3.0}}))
+        assert read_adp_file(wrapped)['player_id'].tolist() == ['00-2']
+        assert read_adp_file(by_id)['adp'].tolist() == [3.0]
+
+        bad = tmp_path / "bad.csv"
+        bad.write_text("name,rank\nX,1\n")
+        with pytest.raises(ValueError):
+            read_adp_file(bad)
+
+    def test_snapshot_key_and_cache(self, tmp_path):
+        """Snapshots are cached by source and date with names resolved to ids."""
+        csv = tmp_path / "ffc_2025-08-01.csv"
+        csv.write_text("name,pos,tm,adp\nJa'Marr Chase,WR,CIN,1.4\nBills,DST,BUF,90\nNobody,QB,,120\n")
+        assert snapshot_key(csv) == ('ffc', '2025-08-01')
+
+        df = load_adp(csv, tmp_path / "cache", _index())
+        cached = tmp_path / "cache" / "adp_ffc_2025-08-01.parquet"
+        assert cached.exists()
+        assert list(df['player_id'][:2]) == ['00-1', 'DEF-BUF']
+        assert list(df['match_status']) == ['exact', 'exact', 'missing']
+
+        # A cached snapshot is reused until the dump is newer than the cache
+        os.utime(csv, (0, 0))
+        csv.write_text("name,pos,tm,adp\nJa'Marr Chase,WR,CIN,9.9\n")
+        os.utime(csv, (0, 0))
+        assert len(load_adp(csv, tmp_path / "cache", _index())) == 3
+
+
+class TestAddAdp:
+    """Test cases for the board join."""
+
+    def test_gap_spread_and_std(self):
+        """Sources are averaged; spread spans high/low; gap is adp minus our rank."""
+        adp = pd.DataFrame([
+            {'player_id': '00-1', 'name': '', 'pos': 'WR', 'tm': 'CIN', 'adp': 2.0, 'adp_std': None,
+             'adp_high': 1, 'adp_low': 4, 'source': 'a'},
+            {'player_id': '00-1', 'name': '', 'pos': 'WR', 'tm': 'CIN', 'adp': 4.0, 'adp_std': None,
+             'adp_high': None, 'adp_low': None, 'source': 'b'},
+            {'player_id': '00-2', 'name': '', 'pos': 'RB', 'tm': 'ATL', 'adp': 1.0, 'adp_std': 0.5,
+             'adp_high': None, 'adp_low': None, 'source': 'a'},
+            {'player_id': '00-9', 'name': 'Brandon Aubrey', 'pos': 'K', 'tm': 'DAL', 'adp': 110.0,
+             'adp_std': None, 'adp_high': None, 'adp_low': None, 'source': 'a'},
+        ])
+        players = add_adp(_board(), adp)
+
+        assert (players[0]['adp'], players[0]['adp_std'], players[0]['adp_spread'], players[0]['adp_gap']) == \
+            (3.0, 1.0, 3.0, 2.0)
+        assert (players[1]['adp'], players[1]['adp_std'], players[1]['adp_gap']) == (1.0, 0.5, -1.0)
+        # One source without high/low: spread unknown, not zero
+        assert players[1]['adp_spread'] is None and players[3]['adp_spread'] is None
+        # Kickers are exported without ids and match by name
+        assert players[3]['adp'] == 110.0 and players[3]['adp_gap'] == 106.0
+        assert players[4]['adp'] is None and players[4]['adp_gap'] is None
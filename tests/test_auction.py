@@ -0,0 +1,78 @@
+import pytest
+import numpy as np
+
+from draftkit.transforms.auction import auction_values, add_auction_values, AuctionTracker
+from draftkit.transforms.scoring import ScoringConfig
+
+
+def _league():
+    cfg = ScoringConfig(teams=2, roster={'QB': 1, 'RB': 1}, flex_positions=['RB'], bench=1)
+    players = ([{'player_id': f'QB{i}', 'pos': 'QB', 'points': 300 - 10 * i} for i in range(4)] +
+               [{'player_id': f'RB{i}', 'pos': 'RB', 'points': 250 - 40 * i} for i in range(4)])
+    return cfg, players
+
+
+class TestAuctionValues:
+    """Test cases for vectorized dollar values."""
+
+    def test_budget_is_spent(self):
+        """Rostered players' values add up to the league's money."""
+        cfg, players = _league()
+        add_auction_values(players, cfg, budget=100, min_bid=1)
+
+        values = np.array([p['auction_value'] for p in players])
+        assert values.sum() == pytest.approx(2 * 100, abs=0.5)
+        assert (values > 0).sum() == 2 * 3  # teams * (starters + bench)
+
+    def test_surplus_drives_value(self):
+        """Steeper positions are worth more; replacement-level starters cost the minimum."""
+        cfg, players = _league()
+        values = auction_values([p['points'] for p in players], [p['pos'] for p in players],
+                                cfg, budget=100, min_bid=1)
+
+        assert values[4] > values[0]        # RB0 is 40 pts above RB replacement, QB0 only 10
+        assert values[1] == pytest.approx(1.0)  # QB1 is the QB replacement level
+        assert values[3] == pytest.approx(1.0)  # bench QB still costs the minimum
+        assert values[6] == 0.0             # RB2 goes unrostered
+
+
+class TestAuctionTracker:
+    """Test cases for live inflation."""
+
+    def test_bargain_raises_inflation(self):
+        """Buying below value leaves more money chasing the remaining surplus."""
+        cfg, players = _league()
+        tracker = AuctionTracker(players, cfg, budget=100)
+        assert tracker.inflation == pytest.approx(1.0)
+
+        value = tracker.nominate('RB0')['value']
+        tracker.sell('RB0', 0, value / 2)
+
+        assert tracker.inflation > 1.0
+        assert tracker.nominate('QB0')['inflated_value'] > tracker.values[tracker.index['QB0']]
+
+    def test_undo_and_limits(self):
+        """Undo restores totals; bids beyond a team's max are rejected."""
+        cfg, players = _league()
+        tracker = AuctionTracker(players, cfg, budget=100)
+        start = (tracker.money_left, tracker.surplus_left, tracker.spots_left)
+
+        tracker.sell('QB0', 1, 20)
+        with pytest.raises(ValueError):
+            tracker.sell('QB0', 0, 5)
+        with pytest.raises(ValueError):
+            tracker.sell('RB0', 1, tracker.max_bid(1) + 1)
+        tracker.undo()
+
+        assert (tracker.money_left, tracker.surplus_left, tracker.spots_left) == start
+
+    def test_out_of_range_team(self):
+        """Bad team indexes raise ValueError and record nothing."""
+        cfg, players = _league()
+        tracker = AuctionTracker(players, cfg, budget=100)
+        for team in (cfg.teams, -1, '0'):
+            with pytest.raises(ValueError):
+                tracker.sell('QB0', team, 5)
+            with pytest.raises(ValueError):
+                tracker.max_bid(team)
+        assert tracker.history == [] and tracker.sold == {}
@@ -0,0 +1,87 @@
+import pytest
+import numpy as np
+
+from draftkit.transforms.availability import adp_parameters, availability_matrix, add_availability
+from draftkit.cli import add_snake_draft_helpers
+
+
+def _board(n=40):
+    return [{'player_id': f'P{i}', 'name': f'Player {i}', 'pos': ['RB', 'WR'][i % 2],
+             'overall_rank': i + 1, 'tier': 1 + i // 10} for i in range(n)]
+
+
+class TestAdpParameters:
+    """Test cases for ADP mean/spread estimation."""
+
+    def test_falls_back_to_rank_and_tier(self):
+        """Without ADP the mean is overall_rank and the spread grows with tier width."""
+        players = _board()
+        mean, sd = adp_parameters(players)
+
+        assert mean.tolist() == list(range(1, 41))
+        assert np.all(sd >= 1.5)
+        assert sd[-1] > sd[0]
+
+    def test_uses_board_adp(self):
+        """Board adp/adp_std win over rank-based estimates."""
+        players = _board()
+        players[0]['adp'] = 7.5
+        players[0]['adp_std'] = 2.0
+        mean, sd = adp_parameters(players)
+
+        assert mean[0] == 7.5
+        assert sd[0] == 2.0
+
+
+class TestAvailabilityMatrix:
+    """Test cases for the vectorized survival model."""
+
+    @pytest.mark.parametrize('method', ['normal', 'logit'])
+    def test_monotone_and_centered(self, method):
+        """Availability falls with pick number and is ~50% at the mean."""
+        mean = np.array([10.0, 30.0])
+        sd = np.array([3.0, 3.0])
+        probs = availability_matrix(mean, sd, [1, 10.5, 20, 60], method)
+
+        assert probs.shape == (2, 4)
+        assert np.all(np.diff(probs, axis=1) <= 0)
+        assert probs[0, 1] == pytest.approx(0.5, abs=1e-6)
+        assert probs[1, 0] > 0.99
+        assert probs[0, 3] < 0.01
+
+    def test_conditional_on_current_pick(self):
+        """Conditioning on survival raises later availability."""
+        mean = np.array([10.0])
+        sd = np.array([4.0])
+        pre = availability_matrix(mean, sd, [12, 20])
+        live = availability_matrix(mean, sd, [12, 20], after_pick=10)
+
+        assert np.all(live >= pre)
+        assert live[0, 0] <= 1.0
+
+    def test_unknown_method(self):
+        """Unknown CDF names raise."""
+        with pytest.raises(ValueError):
+            availability_matrix(np.array([1.0]), np.array([1.0]), [1], method='probit')
+
+
+class TestAddAvailability:
+    """Test cases for board enrichment."""
+
+    def test_fields_added(self):
+        """Each player gets avail per pick and a latest_pick."""
+        players = add_availability(_board(), teams=4, slot=2, rounds=5)
+
+        assert len(players[0]['avail']) == 5
+        assert players[0]['latest_pick'] is None
+        assert players[9]['latest_pick'] == 10
+        assert players[-1]['latest_pick'] == 18
+
+    def test_snake_helpers_with_slot(self):
+        """add_snake_draft_helpers adds availability only when a slot is given."""
+        plain = add_snake_draft_helpers(_board(), teams=4)
+        with_slot = add_snake_draft_helpers(_board(), teams=4, slot=1, rounds=3)
+
+        assert 'avail' not in plain[0]
+        assert plain[4]['round_est'] == 2
+        assert len(with_slot[0]['avail']) == 3
@@ -0,0 +1,80 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from draftkit.transforms.backtest import position_metrics, regular_season_weeks, run_backtest, season_games, summarize
+from draftkit.transforms.scoring import ScoringConfig
+
+
+def _weekly(seasons, players=60, seed=0):
+    """Stable players: each has the same per-game line every season, plus noise."""
+    rng = np.random.default_rng(seed)
+    base = rng.uniform(20, 120, players)
+    rows = []
+    for season in seasons:
+        for i in range(players):
+            pos = ['QB', 'RB', 'WR', 'TE'][i % 4]
+            for week in range(1, 18):
+                rows.append({'season': season, 'week': week, 'player_id': f'P{i}', 'position': pos,
+                             'rushing_yards': base[i] + rng.normal(0, 5), 'rushing_tds': 0.0})
+    return pd.DataFrame(rows)
+
+
+class TestPositionMetrics:
+    """Test cases for the per-position scores."""
+
+    def test_perfect_and_reversed(self):
+        """Exact projections score perfectly; reversed ones miss the top N."""
+        frame = pd.DataFrame({'proj': [10.0, 8, 6, 4], 'actual': [10.0, 8, 6, 4]}, index=list('abcd'))
+        assert position_metrics(frame, 3) == {'n': 3, 'mae': 0.0, 'spearman': 1.0, 'hit_rate': 1.0}
+
+        reversed_ = frame.assign(actual=[4.0, 6, 8, 10])
+        assert position_metrics(reversed_, 2)['hit_rate'] == 0.0
+        assert position_metrics(reversed_, 3)['spearman'] == pytest.approx(-1.0)
+
+
+class TestRunBacktest:
+    """Test cases for the season-parallel harness."""
+
+    def test_fifteen_seasons_parallel_matches_serial(self):
+        """A 15-season backtest is fast and does not depend on the worker count."""
+        weekly = _weekly(range(2006, 2025))
+        seasons = list(range(2010, 2025))
+        args = (weekly, seasons, 3, [0.6, 0.3, 0.1], 8, ScoringConfig())
+
+        start = time.perf_counter()
+        parallel = run_backtest(*args, top=6, workers=2)
+        assert time.perf_counter() - start < 60
+        serial = run_backtest(*args, top=6, workers=1)
+
+        pd.testing.assert_frame_equal(parallel, serial)
+        assert sorted(parallel['season'].unique()) == seasons
+        summary = summarize(parallel)
+        assert list(summary.index) == ['QB', 'RB', 'TE', 'WR', 'ALL']
+        assert (summary['spearman'] > 0.8).all()
+        assert summary.loc['ALL', 'mae'] < 20
+
+
+class TestSeasonLength:
+    """Test cases for the per-season regular-season length."""
+
+    def test_regular_season_by_year(self):
+        """17 weeks / 16 games before 2021, 18 weeks / 17 games since."""
+        assert (regular_season_weeks(2020), season_games(2020)) == (17, 16)
+        assert (regular_season_weeks(2021), season_games(2021)) == (18, 17)
+
+    def test_pre_2021_season(self):
+        """A 16-game season is projected over 16 games and its week-18 playoff game is not counted."""
+        rows = []
+        for season in (2018, 2019):
+            for i, pos in enumerate(['QB', 'RB', 'WR', 'TE']):
+                for week in range(1, 17):  # 16 games, week 17 off
+                    rows.append({'season': season, 'week': week, 'player_id': f'P{i}', 'position': pos,
+                                 'rushing_yards': 50.0 + 10 * i, 'rushing_tds': 0.0})
+        rows.append({'season': 2019, 'week': 18, 'player_id': 'P0', 'position': 'QB',
+                     'rushing_yards': 500.0, 'rushing_tds': 0.0})
+
+        results = run_backtest(pd.DataFrame(rows), [2019], 1, [1.0], 0, ScoringConfig(), top=1)
+        assert results['mae'].tolist() == pytest.approx([0.0] * 5)
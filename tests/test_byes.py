@@ -0,0 +1,52 @@
+import numpy as np
+
+from draftkit.transforms.byes import (bye_masks, coverage_gains, fill_weeks, popcount, position_codes,
+                                      starter_slot_weeks)
+from draftkit.transforms.slots import RosterSlot
+
+
+SLOTS = [RosterSlot('QB', 1, ('QB',)), RosterSlot('RB', 1, ('RB',)), RosterSlot('WR', 1, ('WR',)),
+         RosterSlot('FLEX', 1, ('RB', 'WR')), RosterSlot('BN', 5, ('QB', 'RB', 'WR'), starter=False)]
+POSITIONS = ['QB', 'RB', 'WR']
+
+
+class TestByeMasks:
+    """Test cases for bye bitmasks and popcount."""
+
+    def test_masks_and_popcount(self):
+        """Bit w - 1 marks a week-w bye; unknown byes have no bits."""
+        masks = bye_masks([1, 14, None, '?'])
+        assert masks.tolist() == [1, 1 << 13, 0, 0]
+        assert masks.dtype == np.uint32
+        assert popcount(np.array([0, 7, 0xFFFFFFFF], dtype=np.uint32)).tolist() == [0, 3, 32]
+
+
+class TestCoverage:
+    """Test cases for slot-week coverage and marginal gains."""
+
+    def test_fill_and_open_weeks(self):
+        """Byes open a week; FLEX takes the second RB outside its bye."""
+        masks = bye_masks([5, 6, 6])
+        codes = position_codes(['QB', 'RB', 'RB'], POSITIONS)
+        coverage, open_masks = fill_weeks(masks, codes, POSITIONS, SLOTS, weeks=8)
+
+        # QB 7/8; the RBs share bye 6, so RB and FLEX are 7/8 each; WR 0/8
+        assert coverage == 7 + 7 + 7 + 0
+        assert open_masks[0] == 1 << 4
+        assert open_masks[1] == 1 << 5                  # only week 6 has an RB-eligible hole
+        assert open_masks[2] == 0xFF
+        assert starter_slot_weeks(SLOTS, weeks=8) == 32
+
+    def test_gains_match_refilling(self):
+        """Bitwise gains equal coverage(roster + player) - coverage(roster) for every player."""
+        rng = np.random.default_rng(3)
+        byes = rng.integers(1, 9, 40).tolist()
+        pos = rng.choice(POSITIONS + ['K'], 40).tolist()
+        masks, codes = bye_masks(byes), position_codes(pos, POSITIONS)
+        roster = np.arange(4)
+        base, open_masks = fill_weeks(masks[roster], codes[roster], POSITIONS, SLOTS, weeks=8)
+        gains = coverage_gains(open_masks, masks, codes, weeks=8)
+
+        for i in range(4, 40):
+            with_i = np.append(roster, i)
+            assert fill_weeks(masks[with_i], codes[with_i], POSITIONS, SLOTS, weeks=8)[0] - base == gains[i]
@@ -5,7 +5,8 @@ from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from typer.testing import CliRunner
 
-from draftkit.cli import app, print_diagnostics
+from draftkit.cli import (app, print_diagnostics, changed_files, file_mtimes, parse_source_weights,
+                          resolve_blend_weights, load_with_cache, add_draft_position_fields)
 from draftkit.transforms.scoring import ScoringConfig
 
 
@@ -91,7 +92,7 @@ class TestCLI:
 
     @patch('draftkit.cli.load_weekly')
     @patch('draftkit.cli.load_rosters')
-    @patch('draftkit.cli.load_bye_weeks')
+    @patch('draftkit.cli.get_bye_weeks')
     @patch('draftkit.cli.apply_scoring')
     @patch('draftkit.cli.compute_replacement_and_vorp')
     @patch('draftkit.cli.add_tiers_kmeans')
@@ -116,7 +117,9 @@ class TestCLI:
         runner = CliRunner()
         with tempfile.TemporaryDirectory() as temp_dir:
             result = runner.invoke(app, [
+                "build",
                 "--year", "2024",
+                "--actual",
                 "--config", str(mock_config_file),
                 "--outdir", temp_dir
             ])
@@ -131,7 +134,7 @@ class TestCLI:
 
     @patch('draftkit.cli.load_weekly')  
     @patch('draftkit.cli.load_rosters')
-    @patch('draftkit.cli.get_2025_bye_weeks')
+    @patch('draftkit.cli.get_bye_weeks')
     @patch('draftkit.cli.apply_blended_scoring')
     @patch('draftkit.cli.compute_replacement_and_vorp')
     @patch('draftkit.cli.add_tiers_kmeans')
@@ -157,6 +160,7 @@ class TestCLI:
         runner = CliRunner()
         with tempfile.TemporaryDirectory() as temp_dir:
             result = runner.invoke(app, [
+                "build",
                 "--year", "2025",
                 "--config", str(mock_config_file),
                 "--outdir", temp_dir,
@@ -184,6 +188,7 @@ class TestCLI:
         """Test error handling when blend weights don't match lookback."""
         runner = CliRunner()
         result = runner.invoke(app, [
+            "build",
             "--year", "2025",
             "--config", str(mock_config_file),
             "--lookback", "3",
@@ -220,3 +225,124 @@ class TestCLI:
         yield
         if mock_config_file.exists():
             mock_config_file.unlink()
+
+
+class TestWatchHelpers:
+    """Test cases for --watch change detection."""
+
+    def test_changed_files(self, tmp_path):
+        """Edits, creations and deletions are all reported once."""
+        cfg = tmp_path / "league.yml"
+        ov = tmp_path / "overrides.csv"
+        cfg.write_text("teams: 12\n")
+        mtimes = file_mtimes([cfg, ov])
+
+        assert changed_files([cfg, ov], mtimes)[0] == []
+        ov.write_text("player_id,points\n")
+        changed, mtimes = changed_files([cfg, ov], mtimes)
+        assert changed == [ov]
+        assert changed_files([cfg, ov], mtimes)[0] == []
+        cfg.unlink()
+        assert changed_files([cfg, ov], mtimes)[0] == [cfg]
+
+
+class TestSummaryCache:
+    """Test cases for the cached player-season summary."""
+
+    def test_warm_load_skips_weekly_rows(self, tmp_path):
+        """The summary is written next to the weekly cache and read on its own afterwards."""
+        import pandas as pd
+        weekly = pd.DataFrame({'season': 2024, 'week': [1, 2, 3], 'player_id': 'RB1', 'player_name': 'Back',
+                               'position': 'RB', 'recent_team': 'KC', 'rushing_yards': [50.0, 70.0, 90.0]})
+        weekly.to_parquet(tmp_path / "weekly_2024.parquet")
+        for name in ('rosters', 'dst_weekly', 'dst_rosters', 'kicker_weekly', 'kicker_rosters'):
+            pd.DataFrame({'season': [2024]}).to_parquet(tmp_path / f"{name}_2024.parquet")
+
+        summary = load_with_cache([2024], tmp_path, summary=True)[0]
+        assert (tmp_path / "summary_2024.parquet").exists()
+        (tmp_path / "weekly_2024.parquet").unlink()
+        warm = load_with_cache([2024], tmp_path, summary=True)[0]
+
+        pd.testing.assert_frame_equal(warm, summary)
+        assert warm.loc[0, 'games'] == 3 and warm.loc[0, 'rushing_yards'] == 210
+
+
+class TestParseSourceWeights:
+    """Test cases for --projection-weights parsing."""
+
+    def test_source_and_position_weights(self):
+        """Plain keys set the source weight; source:pos keys set a position weight."""
+        assert parse_source_weights("nflverse=1, fp=0.5,fp:qb=0.8") == {
+            'nflverse': {'*': 1.0}, 'fp': {'*': 0.5, 'QB': 0.8}}
+        assert parse_source_weights("") == {}
+
+
+class TestResolveBlendWeights:
+    """Test cases for --blend/--decay season weights."""
+
+    def test_blend_decay_and_defaults(self):
+        """Explicit weights are normalized; decay and defaults cover any lookback."""
+        assert resolve_blend_weights("3,1", None, 2) == [0.75, 0.25]
+        assert resolve_blend_weights(None, 0.5, 2) == pytest.approx([2 / 3, 1 / 3])
+        assert resolve_blend_weights(None, None, 3) == pytest.approx([0.6, 0.3, 0.1])
+        assert len(resolve_blend_weights(None, None, 10)) == 10
+        with pytest.raises(ValueError):
+            resolve_blend_weights("1,1", None, 3)
+        with pytest.raises(ValueError):
+            resolve_blend_weights(None, 1.5, 3)
+
+
+class TestSimulateCommand:
+    """Test cases for the simulate command's draft length."""
+
+    def _board(self, tmp_path):
+        players = [{'player_id': f'P{i}', 'name': f'P {i}', 'pos': 'WR', 'points': 300.0 - i,
+                    'overall_rank': i + 1} for i in range(200)]
+        path = tmp_path / "players.json"
+        path.write_text(json.dumps(players))
+        return path
+
+    def test_rounds_option_overrides_config(self, tmp_path, mock_config_file):
+        """--rounds wins over the config's roster size; without it the config decides."""
+        board = self._board(tmp_path)
+        runner = CliRunner()
+        for extra, expected in ((['--rounds', '3'], 3), ([], 9)):
+            out = tmp_path / f"avail_{expected}.json"
+            result = runner.invoke(app, ['simulate', '--slot', '2', '--players', str(board), '-c', mock_config_file,
+                                         '--sims', '20', '-o', str(out), *extra])
+            assert result.exit_code == 0, result.output
+            assert len(json.loads(out.read_text())['picks']) == expected
+
+    def test_out_of_range_slot(self, tmp_path, mock_config_file):
+        """A --slot outside 1..teams is reported as an error before anything is simulated."""
+        board = self._board(tmp_path)
+        out = tmp_path / "avail.json"
+        for slot in ('0', '13'):
+            result = CliRunner().invoke(app, ['simulate', '--slot', slot, '--players', str(board),
+                                              '-c', mock_config_file, '-o', str(out)])
+            assert result.exit_code == 0, result.output
+            assert "--slot must be from 1 to 12" in result.output
+        assert not out.exists()
+
+
+class TestDraftPositionFields:
+    """Test cases for joining ADP before the availability helpers."""
+
+    def test_availability_follows_adp(self):
+        """A player the market drafts later than our rank is more likely to last to our pick."""
+        import pandas as pd
+        cfg = ScoringConfig(teams=12, roster={'QB': 1, 'RB': 2, 'WR': 2, 'TE': 1, 'FLEX': 1, 'K': 1, 'DEF': 1},
+                            bench=6)
+        board = lambda: [{'player_id': f'P{i}', 'name': f'P {i}', 'pos': 'WR', 'overall_rank': i + 1, 'tier': 1}
+                         for i in range(60)]
+        adp = pd.DataFrame([{'player_id': 'P2', 'name': 'P 2', 'pos': 'WR', 'tm': None, 'adp': 12.6, 'adp_std': 2.0,
+                             'adp_high': None, 'adp_low': None, 'source': 'ffc'}])
+
+        by_rank = add_draft_position_fields(board(), cfg, slot=3)
+        by_adp = add_draft_position_fields(board(), cfg, slot=3, adp_data=adp)
+
+        assert by_adp[2]['adp'] == 12.6
+        # Ranked 3rd, our pick 3 is a coin flip; at ADP 12.6 the player is nearly sure to be there
+        assert by_rank[2]['avail'][0] < 0.6
+        assert by_adp[2]['avail'][0] > 0.99
+        assert by_adp[3]['avail'] == by_rank[3]['avail']
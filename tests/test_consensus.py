@@ -0,0 +1,83 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from draftkit.transforms.consensus import apply_consensus, consensus_projections, load_projection_file
+from draftkit.transforms.scoring import OFFENSE_STATS, ScoringConfig, score_stats
+
+
+def _lines(rows):
+    return pd.DataFrame(rows).set_index('player_id')
+
+
+class TestConsensusProjections:
+    """Test cases for the weighted stat-level consensus."""
+
+    def test_weighted_mean_and_disagreement(self):
+        """Stats are averaged per stat over the sources that project them."""
+        a = _lines([{'player_id': 'wr', 'receptions': 100, 'receiving_yards': 1200, 'receiving_tds': 8}])
+        b = _lines([{'player_id': 'wr', 'receptions': 80, 'receiving_yards': 1000}])
+        pos = pd.Series({'wr': 'WR'})
+        cfg = ScoringConfig(rec=1.0)
+
+        out = consensus_projections({'a': a, 'b': b}, pos, cfg, {'a': {'*': 3.0}})
+
+        row = out.loc['wr']
+        assert row['receptions'] == pytest.approx(95)
+        assert row['receiving_yards'] == pytest.approx(1150)
+        # Only source a projects TDs, so it alone sets the consensus
+        assert row['receiving_tds'] == pytest.approx(8)
+        assert row['points'] == pytest.approx(95 + 115 + 48)
+        # Points per source with gaps filled: a = 268, b = 80 + 100 + 48 = 228
+        assert row['stdev'] == pytest.approx(np.sqrt(0.75 * 10 ** 2 + 0.25 * 30 ** 2), abs=0.01)
+        assert row['n_sources'] == 2
+
+    def test_position_weights(self):
+        """A zero weight for one position removes that source for those players only."""
+        a = _lines([{'player_id': 'qb', 'passing_yards': 4000}, {'player_id': 'rb', 'rushing_yards': 1000}])
+        b = _lines([{'player_id': 'qb', 'passing_yards': 3000}, {'player_id': 'rb', 'rushing_yards': 800}])
+        out = consensus_projections({'a': a, 'b': b}, pd.Series({'qb': 'QB', 'rb': 'RB'}), ScoringConfig(),
+                                    {'b': {'QB': 0.0}})
+
+        assert out.loc['qb', 'passing_yards'] == 4000
+        assert out.loc['qb', 'n_sources'] == 1
+        assert out.loc['rb', 'rushing_yards'] == 900
+
+    def test_many_sources_fast(self):
+        """Tens of sources times thousands of players aggregate in well under a second."""
+        rng = np.random.default_rng(0)
+        ids = [f'p{i}' for i in range(3000)]
+        sources = {f's{k}': pd.DataFrame(rng.uniform(0, 100, (3000, len(OFFENSE_STATS))), index=ids,
+                                         columns=OFFENSE_STATS).sample(frac=0.9, random_state=k)
+                   for k in range(30)}
+        pos = pd.Series(rng.choice(['QB', 'RB', 'WR', 'TE'], 3000), index=ids)
+
+        start = time.perf_counter()
+        out = consensus_projections(sources, pos, ScoringConfig())
+        assert time.perf_counter() - start < 1.0
+        assert len(out) == 3000 and out['points'].notna().all()
+
+
+class TestApplyConsensus:
+    """Test cases for merging the consensus into the board."""
+
+    def test_board_points_and_new_players(self, tmp_path):
+        """Board points become the consensus; external-only players are appended."""
+        path = tmp_path / "fp.csv"
+        path.write_text("player_id,Player,Pos,Team,rec,rec_yds,rec_td\n00-1,Vet WR,WR,CIN,90,1100,7\n"
+                        "R-1,Rookie WR,WR,LV,60,700,4\n")
+        projections = {'fp': load_projection_file(path)}
+        nflverse = _lines([{'player_id': '00-1', 'receptions': 110 / 17, 'receiving_yards': 1300 / 17,
+                            'receiving_tds': 9 / 17}])
+        players = [{'player_id': '00-1', 'name': 'Vet WR', 'pos': 'WR', 'tm': 'CIN', 'points': 0.0, 'bye': 10}]
+        cfg = ScoringConfig(rec=1.0)
+
+        players = apply_consensus(players, nflverse, projections, cfg, bye_weeks={'LV': 8})
+
+        expected = score_stats(pd.DataFrame([{'receptions': 100, 'receiving_yards': 1200, 'receiving_tds': 8}]), cfg)[0]
+        assert players[0]['points'] == pytest.approx(expected)
+        assert players[0]['consensus_sources'] == 2
+        assert players[1]['name'] == 'Rookie WR' and players[1]['bye'] == 8
+        assert players[1]['consensus_sources'] == 1
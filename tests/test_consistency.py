@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from draftkit.transforms.consistency import CONSISTENCY_FIELDS, add_consistency, consistency_metrics
+from draftkit.transforms.scoring import ScoringConfig, add_weekly_points
+
+
+def _points(season_points):
+    """{(player_id, season): [weekly points]} -> scored weekly rows."""
+    rows = [{'season': season, 'week': w + 1, 'player_id': pid, 'weekly_points': x}
+            for (pid, season), xs in season_points.items() for w, x in enumerate(xs)]
+    return pd.DataFrame(rows)
+
+
+class TestConsistencyMetrics:
+    """Test cases for the grouped consistency reduction."""
+
+    def test_single_season_matches_manual(self):
+        """One season: plain games, mean, population stdev and threshold shares."""
+        weeks = [4.0, 10.0, 12.5, 15.0, 22.0, 30.0]
+        metrics = consistency_metrics(_points({('WR1', 2024): weeks}), [2024], [1.0])
+
+        row = metrics.loc['WR1']
+        assert list(metrics.columns) == list(CONSISTENCY_FIELDS)
+        assert row['gp'] == 6
+        assert row['ppg'] == pytest.approx(np.mean(weeks), abs=0.01)
+        assert row['stdev'] == pytest.approx(np.std(weeks), abs=0.01)
+        assert (row['p10_share'], row['p15_share'], row['p20_share']) == pytest.approx((5 / 6, 0.5, 2 / 6), abs=1e-3)
+
+    def test_blend_is_weighted_mixture(self):
+        """Seasons blend with the projection weights; short seasons drop out and the rest renormalize."""
+        points = _points({('RB1', 2024): [20.0] * 10, ('RB1', 2023): [10.0] * 10, ('RB1', 2022): [0.0] * 3})
+        metrics = consistency_metrics(points, [2024, 2023, 2022], [0.5, 0.3, 0.2], min_games=8)
+
+        row = metrics.loc['RB1']
+        assert row['gp'] == 10
+        assert row['ppg'] == pytest.approx(0.625 * 20 + 0.375 * 10)
+        assert row['stdev'] == pytest.approx(np.sqrt(0.625 * 0.375) * 10, abs=0.01)
+        assert row['p20_share'] == pytest.approx(0.625)
+        assert row['p10_share'] == 1.0
+
+    def test_playoff_weeks_are_dropped(self):
+        """Only each season's regular-season weeks count (17 before 2021, 18 since)."""
+        points = _points({('RB1', 2020): [10.0] * 20, ('RB1', 2021): [10.0] * 20})
+        points.loc[points['week'] > 17, 'weekly_points'] = 40.0
+
+        assert consistency_metrics(points, [2020], [1.0]).loc['RB1', 'gp'] == 17
+        row = consistency_metrics(points, [2021], [1.0]).loc['RB1']
+        assert row['gp'] == 18
+        assert row['ppg'] == pytest.approx((17 * 10 + 40) / 18, abs=0.01)
+
+    def test_weekly_points_kernel_and_export(self):
+        """Weekly points come from the scoring kernel; players without metrics are left alone."""
+        weekly = pd.DataFrame({'season': 2024, 'week': [1, 2], 'player_id': 'QB1',
+                               'passing_yards': [250.0, 300.0], 'passing_tds': [2, 3]})
+        points = add_weekly_points(weekly, ScoringConfig())
+        assert points['weekly_points'].tolist() == [18.0, 24.0]
+
+        players = add_consistency([{'player_id': 'QB1'}, {'player_id': None, 'name': 'Kicker'}],
+                                  consistency_metrics(points, [2024], [1.0]))
+        assert players[0]['ppg'] == 21.0 and players[0]['gp'] == 2.0
+        assert 'ppg' not in players[1]
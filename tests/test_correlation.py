@@ -0,0 +1,72 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from draftkit.transforms.correlation import team_season_correlations, teammate_pairs, write_correlations
+
+
+def _points(weeks):
+    """{(player_id, season, team): {week: points}} -> scored weekly rows."""
+    rows = [{'season': season, 'week': w, 'player_id': pid, 'recent_team': team, 'weekly_points': x}
+            for (pid, season, team), xs in weeks.items() for w, x in xs.items()]
+    return pd.DataFrame(rows)
+
+
+class TestTeamSeasonCorrelations:
+    """Test cases for the masked same-team correlation kernel."""
+
+    def test_matches_pandas_on_shared_weeks(self):
+        """Each pair uses only the weeks both played, like a pairwise-complete Pearson."""
+        rng = np.random.default_rng(0)
+        qb = dict(zip(range(1, 18), rng.normal(20, 6, 17)))
+        wr = {w: x for w, x in zip(range(1, 18), rng.normal(14, 5, 17)) if w not in (3, 4, 9)}
+        pairs = team_season_correlations(_points({('QB', 2024, 'CIN'): qb, ('WR', 2024, 'CIN'): wr}))
+
+        expected = pd.DataFrame({'qb': pd.Series(qb), 'wr': pd.Series(wr)}).corr().loc['qb', 'wr']
+        row = pairs[(pairs['player_id'] == 'QB') & (pairs['other_id'] == 'WR')].iloc[0]
+        assert row['weeks'] == 14
+        assert row['corr'] == pytest.approx(expected)
+        assert len(pairs) == 2  # both directions, no self pairs
+
+    def test_only_same_team_season_pairs(self):
+        """Players on different teams, or teammates too few weeks, are not paired."""
+        weeks = {w: float(w) for w in range(1, 11)}
+        pairs = team_season_correlations(_points({
+            ('A', 2024, 'BUF'): weeks, ('B', 2024, 'MIA'): weeks,
+            ('C', 2024, 'BUF'): {w: 2.0 * w for w in range(1, 5)},
+        }))
+        assert pairs.empty
+
+    def test_playoff_weeks_are_dropped(self):
+        """Only each season's regular-season weeks are correlated (17 before 2021, 18 since)."""
+        weeks = {w: float(w % 5) for w in range(1, 18)}
+        playoff = {19: 0.0, 20: 40.0}
+        pairs = team_season_correlations(_points({
+            ('A', 2020, 'BUF'): {**weeks, 18: 1.0, **playoff}, ('B', 2020, 'BUF'): {**weeks, 18: 30.0, **playoff},
+        }))
+
+        assert pairs['weeks'].tolist() == [17, 17]
+        assert pairs['corr'].tolist() == pytest.approx([1.0, 1.0])
+
+
+class TestTeammatePairs:
+    """Test cases for pooling seasons and filtering to board teammates."""
+
+    def test_pools_and_filters_by_board_team(self, tmp_path):
+        """Seasons are weighted by co-played weeks and only current teammates are kept."""
+        pairs = pd.DataFrame({
+            'season': [2023, 2024, 2024], 'team': ['CIN'] * 3,
+            'player_id': ['QB', 'QB', 'QB'], 'other_id': ['WR', 'WR', 'TE'],
+            'weeks': [10, 30, 12], 'corr': [0.2, 0.6, 0.4],
+        })
+        players = [{'player_id': 'QB', 'name': 'Q', 'pos': 'QB', 'tm': 'CIN'},
+                   {'player_id': 'WR', 'name': 'W', 'pos': 'WR', 'tm': 'CIN'},
+                   {'player_id': 'TE', 'name': 'T', 'pos': 'TE', 'tm': 'PIT'}]
+        out = teammate_pairs(pairs, players)
+
+        assert list(out) == ['QB']
+        assert out['QB'] == [{'player_id': 'WR', 'name': 'W', 'pos': 'WR', 'corr': 0.5, 'weeks': 40}]
+        path = write_correlations(out, tmp_path / 'correlations.json')
+        assert json.loads(path.read_text()) == out
@@ -0,0 +1,191 @@
+import time
+
+import numpy as np
+import pytest
+
+from draftkit.live.board import LiveBoard
+from draftkit.live.log import DraftLog, read_events
+from draftkit.live.terminal import handle_command
+from draftkit.transforms.scoring import ScoringConfig
+
+
+def _league(teams=12, bench=6):
+    cfg = ScoringConfig(teams=teams, roster={'QB': 1, 'RB': 2, 'WR': 2, 'TE': 1, 'FLEX': 1, 'K': 1, 'DEF': 1},
+                        flex_positions=['RB', 'WR', 'TE'], bench=bench)
+    rng = np.random.default_rng(1)
+    sizes = {'QB': 50, 'RB': 120, 'WR': 150, 'TE': 50, 'K': 32, 'DEF': 32}
+    base = {'QB': 380, 'RB': 300, 'WR': 300, 'TE': 220, 'K': 160, 'DEF': 150}
+    players = []
+    for pos, n in sizes.items():
+        pts = np.sort(base[pos] - np.cumsum(rng.uniform(0.5, 4, n)))[::-1]
+        for i, p in enumerate(pts):
+            players.append({'player_id': f'{pos}{i}', 'name': f'{pos} Player {i}', 'pos': pos, 'tm': 'FA',
+                            'points': float(p), 'tier': i // 8 + 1, 'bye': 5 + i % 9})
+    players.sort(key=lambda p: -p['points'])
+    for rank, p in enumerate(players, start=1):
+        p['overall_rank'] = rank
+    return cfg, players
+
+
+class TestDraftLog:
+    """Test cases for the append-only event log."""
+
+    def test_events_persist_and_recover(self, tmp_path):
+        """Reopening the log rebuilds the same board."""
+        cfg, players = _league()
+        path = tmp_path / "draft.jsonl"
+        log = DraftLog(path, LiveBoard(players, cfg, slot=4))
+        log.keeper('QB3', 5)
+        log.pick('RB0')
+        log.pick('WR0', team=7)
+        log.trade(picks={20: 1}, players={'RB0': 2})
+        expected = log.board.snapshot()
+
+        recovered = DraftLog(path, LiveBoard(players, cfg, slot=4))
+
+        assert len(read_events(path)) == 4
+        assert recovered.board.snapshot() == expected
+        assert recovered.board.owner[recovered.board.index['RB0']] == 2
+        assert recovered.board.pick_owner == {20: 1}
+
+    def test_truncated_line_is_dropped(self, tmp_path):
+        """A crash mid-write leaves a partial line that recovery ignores."""
+        cfg, players = _league()
+        path = tmp_path / "draft.jsonl"
+        log = DraftLog(path, LiveBoard(players, cfg))
+        log.pick('RB0')
+        with path.open('a') as f:
+            f.write('{"seq": 2, "type": "pi')
+
+        recovered = DraftLog(path, LiveBoard(players, cfg))
+        recovered.pick('RB1')
+
+        events = read_events(path)
+        assert [e['player_id'] for e in events] == ['RB0', 'RB1']
+        assert len(recovered.board.history) == 2
+
+    def test_corrupt_middle_line_raises(self, tmp_path):
+        """Only a bad last line is ignored; a bad line before other events is an error."""
+        cfg, players = _league()
+        path = tmp_path / "draft.jsonl"
+        log = DraftLog(path, LiveBoard(players, cfg))
+        log.pick('RB0')
+        with path.open('a') as f:
+            f.write('garbage\n{"seq": 2, "type": "pick", "player_id": "RB1", "team": 1}\n')
+
+        with pytest.raises(ValueError, match=":2:"):
+            read_events(path)
+
+    def test_bad_last_line_is_rewritten(self, tmp_path):
+        """A bad complete last line is dropped from the file, so the next append stays readable."""
+        cfg, players = _league()
+        path = tmp_path / "draft.jsonl"
+        DraftLog(path, LiveBoard(players, cfg)).pick('RB0')
+        with path.open('a') as f:
+            f.write('garbage\n')
+
+        DraftLog(path, LiveBoard(players, cfg)).pick('RB1')
+
+        assert [e['player_id'] for e in read_events(path)] == ['RB0', 'RB1']
+
+    def test_bad_trade_leaves_board_untouched(self, tmp_path):
+        """A trade with any bad team or player fails before anything moves and is not logged."""
+        cfg, players = _league()
+        path = tmp_path / "draft.jsonl"
+        log = DraftLog(path, LiveBoard(players, cfg))
+        log.pick('RB0')
+        before = log.board.snapshot()
+
+        with pytest.raises(ValueError):
+            log.append({'type': 'trade', 'picks': {'50': 3, '51': 99}})
+        with pytest.raises(ValueError):
+            log.trade(picks={50: 3}, players={'RB0': -1})
+        with pytest.raises(KeyError):
+            log.trade(picks={50: 3}, players={'RB0': 2, 'nobody': 2})
+
+        assert log.board.pick_owner == {}
+        assert log.board.snapshot() == before
+        assert [e['type'] for e in read_events(path)] == ['pick']
+
+    def test_undo_is_logged(self, tmp_path):
+        """Undo pops in memory and survives a replay; invalid events never hit disk."""
+        cfg, players = _league()
+        path = tmp_path / "draft.jsonl"
+        log = DraftLog(path, LiveBoard(players, cfg))
+        before = log.board.snapshot()
+        log.pick('RB0')
+        log.keeper('WR5', 3)
+        log.undo()
+        log.undo()
+        with pytest.raises(ValueError):
+            log.undo()
+        with pytest.raises(KeyError):
+            log.pick('nobody')
+
+        assert log.board.snapshot() == before
+        assert [e['type'] for e in read_events(path)] == ['pick', 'keeper', 'undo', 'undo']
+        assert DraftLog(path, LiveBoard(players, cfg)).board.snapshot() == before
+
+    def test_replay_to_pick(self, tmp_path):
+        """Replay to pick n matches the board as it stood after n picks."""
+        cfg, players = _league()
+        log = DraftLog(tmp_path / "draft.jsonl", LiveBoard(players, cfg, slot=2))
+        snapshots = []
+        for p in players[:10]:
+            log.pick(p['player_id'])
+            snapshots.append(log.board.snapshot())
+
+        assert log.replay(4).snapshot() == snapshots[3]
+        assert log.replay().snapshot() == snapshots[-1]
+
+    def test_full_20_round_14_team_draft(self, tmp_path):
+        """Logging and recovering every pick of a 20-round, 14-team draft stays fast."""
+        cfg, players = _league(teams=14, bench=11)
+        path = tmp_path / "draft.jsonl"
+        log = DraftLog(path, LiveBoard(players, cfg))
+        assert log.board.rounds == 20
+
+        latencies = []
+        for p in players[:14 * 20]:
+            start = time.perf_counter()
+            log.pick(p['player_id'])
+            latencies.append(time.perf_counter() - start)
+        assert log.board.team_on_clock() is None
+        assert np.percentile(latencies, 99) < 0.05
+
+        start = time.perf_counter()
+        recovered = DraftLog(path, LiveBoard(players, cfg))
+        assert time.perf_counter() - start < 1.0
+        assert recovered.board.snapshot() == log.board.snapshot()
+
+        start = time.perf_counter()
+        log.undo()
+        assert time.perf_counter() - start < 0.05
+
+
+class TestTerminalCommands:
+    """Test cases for terminal command parsing."""
+
+    def test_pick_by_name_and_ambiguity(self):
+        """Unique name fragments pick; ambiguous ones list candidates."""
+        cfg, players = _league()
+        log = DraftLog(None, LiveBoard(players, cfg))
+
+        assert 'ambiguous' in handle_command(log, 'Player 1')
+        message = handle_command(log, 'p rb player 0')
+        assert 'RB Player 0' in message
+        assert log.board.owner[log.board.index['RB0']] == 0
+
+    def test_keeper_trade_undo_quit(self):
+        """Keeper/trade commands use 1-based teams; q returns None."""
+        cfg, players = _league()
+        log = DraftLog(None, LiveBoard(players, cfg))
+
+        handle_command(log, 'k 3 QB Player 0')
+        assert log.board.keepers == {log.board.index['QB0']: 2}
+        handle_command(log, 'tr 5 QB Player 0')
+        assert log.board.owner[log.board.index['QB0']] == 4
+        handle_command(log, 'u')
+        assert log.board.owner[log.board.index['QB0']] == 2
+        assert 'Team must be' in handle_command(log, 'tp 40 99')
+        assert handle_command(log, 'q') is None
@@ -0,0 +1,40 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from draftkit.exports.explain import contribution_table, write_explain
+from draftkit.transforms.scoring import ScoringConfig
+
+
+def _lines():
+    return pd.DataFrame({'rushing_yards': [60.0, 5.0], 'rushing_tds': [0.5, 0.0],
+                         'receptions': [2.0, 5.0], 'receiving_yards': [15.0, 70.0]},
+                        index=pd.Index(['RB1', 'WR1'], name='player_id'))
+
+
+class TestContributionTable:
+    """Test cases for the explain side file."""
+
+    def test_board_order_and_games(self):
+        """Rows follow the board; per-game lines are scaled to the season."""
+        players = [{'player_id': 'WR1', 'points': 0}, {'name': 'Some K'}, {'player_id': 'RB1', 'points': 0},
+                   {'player_id': 'DEF-BUF'}]
+        table = contribution_table(_lines(), players, ScoringConfig(rec=1.0), games=17)
+
+        assert list(table['player_id']) == ['WR1', 'RB1']
+        assert table.loc[1, 'rushing_tds'] == pytest.approx(0.5 * 6 * 17)
+        assert table.loc[0, 'total'] == pytest.approx((0.5 + 5 + 7) * 17)
+        assert table['receptions'].dtype == np.float32
+
+    def test_parquet_and_columnar_json(self, tmp_path):
+        """Both formats round-trip keyed by player id."""
+        table = contribution_table(_lines(), [{'player_id': 'RB1'}, {'player_id': 'WR1'}], ScoringConfig())
+
+        parquet = write_explain(table, tmp_path / "explain.parquet")
+        assert list(pd.read_parquet(parquet)['player_id']) == ['RB1', 'WR1']
+
+        data = json.loads(write_explain(table, tmp_path / "explain.json").read_text())
+        assert data['player_id'] == ['RB1', 'WR1']
+        assert data['rushing_yards'] == [6.0, 0.5]
@@ -0,0 +1,72 @@
+import time
+
+import pandas as pd
+
+from draftkit.transforms.names import NameIndex, normalize_name
+
+
+def _rosters():
+    return pd.DataFrame([
+        {'player_id': '00-1', 'player_name': "Ja'Marr Chase", 'position': 'WR', 'team': 'CIN'},
+        {'player_id': '00-2', 'player_name': 'Marvin Harrison Jr.', 'position': 'WR', 'team': 'ARI'},
+        {'player_id': '00-3', 'player_name': 'Kenneth Walker III', 'position': 'RB', 'team': 'SEA'},
+        {'player_id': '00-4', 'player_name': 'Mike Williams', 'position': 'WR', 'team': 'PIT'},
+        {'player_id': '00-5', 'player_name': 'Mike Williams', 'position': 'LB', 'team': 'NYG'},
+        {'player_id': '00-6', 'player_name': 'Josh Allen', 'position': 'QB', 'team': 'BUF'},
+        {'player_id': '00-7', 'player_name': 'Josh Allen', 'position': 'LB', 'team': 'JAX'},
+        {'player_id': '00-8', 'player_name': 'Christian McCaffrey', 'position': 'RB', 'team': 'SF'},
+    ])
+
+
+class TestNormalizeName:
+    """Test cases for name normalization."""
+
+    def test_suffixes_punctuation_accents(self):
+        """Case, punctuation, accents and generational suffixes are dropped."""
+        assert normalize_name("Ja'Marr Chase") == 'jamarr chase'
+        assert normalize_name('Marvin Harrison Jr.') == 'marvin harrison'
+        assert normalize_name('D.J. Moore') == 'dj moore'
+        assert normalize_name('Kenneth Walker III') == 'kenneth walker'
+        assert normalize_name('Amon-Ra St. Brown') == 'amon ra st brown'
+        assert normalize_name('Tomás Pérez') == 'tomas perez'
+        assert normalize_name(None) == ''
+
+
+class TestNameIndex:
+    """Test cases for roster name resolution."""
+
+    def test_exact_and_tie_breakers(self):
+        """Exact names resolve; duplicates are split by position, then team."""
+        index = NameIndex.from_rosters(_rosters())
+
+        assert index.resolve('Marvin Harrison').player_id == '00-2'
+        assert index.resolve('JaMarr Chase').status == 'exact'
+        assert index.resolve('Josh Allen', pos='QB').player_id == '00-6'
+        assert index.resolve('Mike Williams', team='NYG').player_id == '00-5'
+
+        match = index.resolve('Josh Allen')
+        assert match.status == 'ambiguous'
+        assert {c[0] for c in match.candidates} == {'00-6', '00-7'}
+
+    def test_fuzzy_and_missing(self):
+        """Typos resolve through trigrams; unrelated names are reported missing."""
+        index = NameIndex.from_rosters(_rosters())
+
+        match = index.resolve('Christian McCafrey')
+        assert (match.status, match.player_id) == ('fuzzy', '00-8')
+        assert 0.6 <= match.score < 1
+        assert index.resolve('Hollywood Brown').status == 'missing'
+
+    def test_resolve_frame_is_fast(self):
+        """Thousands of name-only rows resolve in well under a second."""
+        index = NameIndex.from_rosters(_rosters())
+        rows = pd.DataFrame({'name': ['Kenneth Walker', 'Josh Allen', 'Nobody Here', 'Mike Williams'] * 1000,
+                             'pos': ['RB', None, 'WR', 'WR'] * 1000})
+
+        start = time.perf_counter()
+        out = index.resolve_frame(rows)
+        assert time.perf_counter() - start < 0.5
+
+        assert list(out['match_status'][:4]) == ['exact', 'ambiguous', 'missing', 'exact']
+        assert list(out['resolved_id'][:4]) == ['00-3', None, None, '00-4']
+        assert '00-6:Josh Allen' in out['match_candidates'][1]
@@ -2,7 +2,8 @@ import pytest
 import pandas as pd
 from unittest.mock import Mock, patch
 
-from draftkit.connectors.nflverse import load_weekly, load_rosters
+from draftkit.connectors.nflverse import load_weekly, load_rosters, summarize_weekly
+from draftkit.transforms.scoring import ScoringConfig, blend_stat_lines, score_stats, summary_points
 
 
 class TestNFLVerseConnector:
@@ -197,3 +198,42 @@ class TestNFLVerseConnector:
         
         mock_nfl.import_seasonal_rosters.assert_called_once_with([2024, 2023])
         assert len(result) == 2
+
+
+def _weekly():
+    rows = []
+    for season, games in ((2023, 10), (2024, 6)):
+        for week in range(1, games + 1):
+            rows.append({'season': season, 'week': week, 'player_id': 'WR1', 'player_name': 'A. Receiver',
+                         'position': 'WR', 'recent_team': 'KC' if week < games else 'BUF',
+                         'receptions': week % 4 + 2, 'receiving_yards': 12.5 * week, 'receiving_tds': week % 3 == 0,
+                         'fumbles_lost': week == 2})
+    return pd.DataFrame(rows)
+
+
+class TestSummarizeWeekly:
+    """Test cases for the cached player-season summary table."""
+
+    def test_sums_games_and_latest_team(self):
+        """One row per player-season with stat sums, games and the last week's team."""
+        weekly = _weekly()
+        summary = summarize_weekly(weekly).set_index('season')
+
+        assert list(summary.index) == [2023, 2024]
+        assert summary.loc[2023, 'games'] == 10
+        assert summary.loc[2024, 'recent_team'] == 'BUF'
+        assert summary.loc[2023, 'receiving_yards'] == weekly.loc[weekly['season'] == 2023, 'receiving_yards'].sum()
+
+    def test_blend_and_moments_match_weekly_rows(self):
+        """Blending and weekly points mean/stdev come out the same without the weekly rows."""
+        weekly = _weekly()
+        summary = summarize_weekly(weekly)
+        pd.testing.assert_frame_equal(blend_stat_lines(summary, [2024, 2023], [0.7, 0.3], 4),
+                                      blend_stat_lines(weekly, [2024, 2023], [0.7, 0.3], 4))
+
+        cfg = ScoringConfig(rec=0.5, rec_td=4)
+        moments = summary_points(summary, cfg).set_index(summary['season'])
+        weekly_pts = pd.Series(score_stats(weekly, cfg)).groupby(weekly['season'])
+        assert moments['ppg'].tolist() == pytest.approx(weekly_pts.mean().round(2).tolist())
+        assert moments['stdev'].tolist() == pytest.approx(weekly_pts.std(ddof=0).tolist(), abs=0.01)
+
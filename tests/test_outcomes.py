@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from draftkit.connectors.tensor import build_tensor
+from draftkit.transforms.outcomes import add_outcomes, outcome_table, simulate_seasons, weekly_pools
+
+
+def _history(n_players=6, seed=0):
+    """players x 2 seasons x 22 weeks: player i scores about 5 + 3i with some spread."""
+    rng = np.random.default_rng(seed)
+    points = (5 + 3 * np.arange(n_players))[:, None, None] + rng.normal(0, 2, (n_players, 2, 22))
+    played = np.zeros((n_players, 2, 22), dtype=bool)
+    played[:, :, :17] = True
+    return points, played
+
+
+class TestWeeklyPools:
+    """Test cases for the resampling pools."""
+
+    def test_season_weights_and_play_rate(self):
+        """Weeks are drawn with season weight / games; short seasons drop out below min_games."""
+        points = np.zeros((1, 2, 4))
+        played = np.array([[[True, True, False, False], [True, True, True, True]]])
+        pool, cdf, rate = weekly_pools(points, played, [0.75, 0.25], min_games=0)
+        assert np.diff(np.concatenate([[0], cdf[0]])).tolist() == pytest.approx(
+            [0.375, 0.375, 0, 0, 0.0625, 0.0625, 0.0625, 0.0625])
+        assert rate[0] == pytest.approx((0.75 * 2 + 0.25 * 4) / 17)
+
+        _, cdf, _ = weekly_pools(points, played, [0.75, 0.25], min_games=3)
+        assert cdf[0, :2].tolist() == [0, 0] and cdf[0, -1] == 1.0
+
+
+    def test_playoff_weeks_are_dropped(self):
+        """Masked to the regular season, playoff games neither enter the pool nor raise the play rate."""
+        weeks = [w for w in range(1, 18) if w not in (4, 5, 6)] + [19, 20, 21]  # 3 missed, 3 playoff games
+        weekly = pd.DataFrame({'season': 2024, 'week': weeks, 'player_id': 'RB1', 'position': 'RB',
+                               'rushing_yards': [100.0 if w <= 18 else 400.0 for w in weeks]})
+        tensor = build_tensor(weekly)
+        played = tensor.played & tensor.regular_season([2024])[None]
+
+        pool, cdf, rate = weekly_pools(tensor.stat('rushing_yards'), played, [1.0])
+        assert rate[0] == pytest.approx(14 / 17)
+        assert set(pool[0][np.diff(cdf[0], prepend=0) > 0]) == {100.0}
+        assert tensor.regular_season([2020, 2021]).sum(axis=1).tolist() == [17, 18]
+
+
+class TestSimulateSeasons:
+    """Test cases for the bootstrap simulator."""
+
+    def test_constant_weeks_and_worker_independence(self):
+        """Constant weekly scores give 17 x score; results don't depend on the worker count."""
+        points = np.full((3, 1, 22), 10.0)
+        played = np.zeros((3, 1, 22), dtype=bool)
+        played[:2, 0, :17] = True
+        sims = simulate_seasons(points, played, [1.0], n_sims=200, chunk_size=1)
+        assert np.all(sims[:2] == 170) and np.isnan(sims[2]).all()
+
+        points, played = _history(n_players=8)
+        serial = simulate_seasons(points, played, [0.6, 0.4], n_sims=300, chunk_size=3)
+        parallel = simulate_seasons(points, played, [0.6, 0.4], n_sims=300, chunk_size=3, workers=2)
+        np.testing.assert_array_equal(serial, parallel)
+
+    def test_outcome_table(self):
+        """Percentiles are ordered and the best player usually ranks first at the position."""
+        points, played = _history()
+        sims = simulate_seasons(points, played, [0.6, 0.4], n_sims=500)
+        ids = [f'P{i}' for i in range(6)]
+        table = outcome_table(sims, ids, ['RB', 'WR'] * 3)
+
+        assert (table['sim_p10'] <= table['sim_p50']).all() and (table['sim_p50'] <= table['sim_p90']).all()
+        assert table.loc['P5', 'sim_rank_p50'] == 1 and table.loc['P0', 'sim_rank_p50'] == 3
+        assert table.loc['P5', 'sim_p50'] == pytest.approx(17 * 20, rel=0.05)
+
+        players = add_outcomes([{'player_id': 'P5'}, {'player_id': 'DEF-KC'}], table)
+        assert isinstance(players[0]['sim_rank_p90'], int) and 'sim_p50' not in players[1]
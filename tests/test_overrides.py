@@ -0,0 +1,102 @@
+import pytest
+import pandas as pd
+from pathlib import Path
+
+from draftkit.transforms.overrides import apply_overrides, load_overrides, override_points
+from draftkit.transforms.scoring import ScoringConfig, score_stats, _score_row
+
+
+def _players():
+    return [
+        {'player_id': '00-1', 'name': 'Vet WR', 'pos': 'WR', 'tm': 'CIN', 'points': 250.0, 'bye': 10},
+        {'player_id': '00-2', 'name': 'Vet RB', 'pos': 'RB', 'tm': 'PHI', 'points': 280.0, 'bye': 5},
+        {'player_id': None, 'name': 'Some K', 'pos': 'K', 'tm': 'TB', 'points': 150.0, 'bye': 11},
+    ]
+
+
+class TestScoreStats:
+    """Test cases for the vectorized scoring kernel."""
+
+    def test_matches_row_scoring(self):
+        """Matrix scoring equals the row-wise scorer."""
+        stats = pd.DataFrame([
+            {'passing_yards': 4200, 'passing_tds': 30, 'interceptions': 10, 'rushing_yards': 400},
+            {'receptions': 95, 'receiving_yards': 1250, 'receiving_tds': 9, 'fumbles_lost': 1},
+        ])
+        cfg = ScoringConfig(rec=0.5)
+        expected = [_score_row(row.fillna(0), cfg) for _, row in stats.iterrows()]
+
+        assert list(score_stats(stats, cfg)) == pytest.approx(expected)
+
+
+class TestApplyOverrides:
+    """Test cases for the keyed override merge."""
+
+    def _write(self, tmp_path, text):
+        path = tmp_path / "overrides.csv"
+        path.write_text(text)
+        return path
+
+    def test_points_and_stat_lines(self, tmp_path):
+        """Point overrides replace points; stat lines go through the scoring kernel."""
+        path = self._write(tmp_path,
+                           "player_id,name,pos,tm,points,receptions,receiving_yards,receiving_tds,note\n"
+                           "00-1,Vet WR,WR,CIN,,100,1300,9,new role\n"
+                           "00-2,Vet RB,RB,PHI,200,,,,injury\n")
+        players = apply_overrides(_players(), path, ScoringConfig())
+
+        assert players[0]['points'] == pytest.approx(100 + 130 + 54)
+        assert players[0]['source'] == 'override'
+        assert players[0]['override_note'] == 'new role'
+        assert players[1]['points'] == 200
+        assert players[2]['source'] == 'blend'
+        assert players[2]['override_note'] == ''
+
+    def test_rookies_are_added(self, tmp_path):
+        """Override rows for players missing from the board are appended."""
+        path = self._write(tmp_path, "player_id,name,pos,tm,points,note\nR-1,Rookie RB,RB,LV,230,rookie\n")
+        players = apply_overrides(_players(), path, bye_weeks={'LV': 8})
+
+        assert len(players) == 4
+        assert players[-1] == {'player_id': 'R-1', 'name': 'Rookie RB', 'pos': 'RB', 'tm': 'LV',
+                               'points': 230.0, 'bye': 8, 'source': 'override', 'override_note': 'rookie'}
+
+    def test_no_file(self):
+        """Without overrides every player is marked as blended."""
+        players = apply_overrides(_players())
+        assert {p['source'] for p in players} == {'blend'}
+
+    def test_last_row_wins_and_bad_files(self, tmp_path):
+        """Duplicate ids keep the last row; files without values are rejected."""
+        path = self._write(tmp_path, "player_id,points\n00-1,100\n00-1,120\n")
+        assert apply_overrides(_players(), path)[0]['points'] == 120
+
+        bad = self._write(tmp_path, "player_id,name\n00-1,Vet WR\n")
+        assert load_overrides(bad).empty
+        assert load_overrides(Path(tmp_path / "missing.csv")).empty
+
+    def test_override_points_mixed(self):
+        """Stat rows are scored, point-only rows pass through."""
+        ov = pd.DataFrame({'points': [150.0, None], 'rushing_yards': [None, 1000.0], 'rushing_tds': [None, 10.0]})
+        assert list(override_points(ov, ScoringConfig())) == [150.0, 160.0]
+
+    def test_name_only_rows_resolve(self, tmp_path):
+        """Rows without ids resolve by name; ambiguous names are skipped and reported."""
+        from draftkit.transforms.names import NameIndex
+        from draftkit.transforms.overrides import validate_overrides
+
+        index = NameIndex(pd.DataFrame([
+            {'player_id': '00-1', 'name': 'Vet WR', 'pos': 'WR', 'tm': 'CIN'},
+            {'player_id': '00-2', 'name': 'Vet RB', 'pos': 'RB', 'tm': 'PHI'},
+            {'player_id': '00-3', 'name': 'Twin', 'pos': 'TE', 'tm': 'KC'},
+            {'player_id': '00-4', 'name': 'Twin', 'pos': 'TE', 'tm': 'LV'},
+        ]))
+        path = self._write(tmp_path, "name,pos,tm,points\nVet W.R.,WR,,111\nTwin,TE,,90\nNew Guy,RB,LV,150\n")
+
+        players = apply_overrides(_players(), path, index=index)
+        report = validate_overrides(path, _players(), index)
+
+        assert players[0]['points'] == 111
+        assert players[0]['source'] == 'override'
+        assert [p['name'] for p in players[3:]] == ['New Guy']
+        assert any('ambiguous' in w and '00-3:Twin' in w for w in report['warnings'])
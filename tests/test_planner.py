@@ -0,0 +1,66 @@
+import pytest
+import numpy as np
+
+from draftkit.transforms.planner import expected_pick_values, plan_draft
+from draftkit.transforms.scoring import ScoringConfig
+
+
+class TestExpectedPickValues:
+    """Test cases for expected order-statistic values."""
+
+    def test_certain_availability(self):
+        """With everyone available, the j-th pick value is the j-th best player."""
+        players = [{'pos': 'RB', 'points': v} for v in (300, 250, 200)]
+        probs = np.ones((3, 2))
+        values = expected_pick_values(players, probs, ['RB'], {'RB': 3})
+
+        np.testing.assert_allclose(values['RB'][:, 0], [300, 250, 200])
+
+    def test_partial_availability(self):
+        """Best player gone half the time -> expected value mixes in the next one."""
+        players = [{'pos': 'WR', 'points': 300}, {'pos': 'WR', 'points': 200}]
+        probs = np.array([[0.5], [1.0]])
+        values = expected_pick_values(players, probs, ['WR'], {'WR': 2})
+
+        assert values['WR'][0, 0] == pytest.approx(0.5 * 300 + 0.5 * 200)
+        assert values['WR'][1, 0] == pytest.approx(0.5 * 200)
+
+    def test_missing_position(self):
+        """Positions absent from the board get zero value."""
+        values = expected_pick_values([{'pos': 'QB', 'points': 1}], np.ones((1, 3)), ['TE'], {'TE': 2})
+        assert values['TE'].shape == (2, 3)
+        assert not values['TE'].any()
+
+
+class TestPlanDraft:
+    """Test cases for the plan search."""
+
+    def _setup(self):
+        cfg = ScoringConfig(teams=2, roster={'QB': 1, 'RB': 1}, flex_positions=['RB'])
+        players = ([{'pos': 'QB', 'points': 300 - i, 'repl_pts': 0} for i in range(6)] +
+                   [{'pos': 'RB', 'points': 250 - 40 * i, 'repl_pts': 0} for i in range(6)])
+        return cfg, players
+
+    def test_scarce_position_first(self):
+        """RBs fall off fast while QBs stay flat, so take RB first."""
+        cfg, players = self._setup()
+        probs = np.ones((len(players), 2))
+        probs[6, 1] = 0.0  # top RB gone by our second pick
+
+        plans = plan_draft(players, probs, cfg, caps={'QB': 1, 'RB': 1})
+
+        assert plans[0]['plan'] == ['RB', 'QB']
+        assert plans[0]['expected_points'] == pytest.approx(250 + 300)
+
+    def test_plans_sorted_and_capped(self):
+        """Plans respect position caps and are sorted best first."""
+        cfg, players = self._setup()
+        probs = np.ones((len(players), 3))
+
+        plans = plan_draft(players, probs, cfg, top_n=3, caps={'QB': 2, 'RB': 2})
+
+        scores = [p['expected_points'] for p in plans]
+        assert scores == sorted(scores, reverse=True)
+        for result in plans:
+            assert result['plan'].count('QB') <= 2
+            assert len(result['plan']) == len(result['pick_values']) == 3
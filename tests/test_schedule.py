@@ -71,3 +71,41 @@ class TestScheduleConnector:
         
         # Should be empty since no teams have byes
         assert bye_weeks == {}
+
+    @patch('draftkit.connectors.schedule.nfl')
+    def test_load_bye_weeks_matches_matrix(self, mock_nfl):
+        """A team with two gameless weeks gets the same (first) bye from both sources."""
+        from draftkit.connectors.schedule import opponent_matrix
+        mock_schedule_data = pd.DataFrame([
+            {'season': 2024, 'game_type': 'REG', 'week': 1, 'home_team': 'KC', 'away_team': 'BAL'},
+            {'season': 2024, 'game_type': 'REG', 'week': 2, 'home_team': 'BUF', 'away_team': 'KC'},
+            {'season': 2024, 'game_type': 'REG', 'week': 3, 'home_team': 'BUF', 'away_team': 'KC'},
+            {'season': 2024, 'game_type': 'REG', 'week': 4, 'home_team': 'BAL', 'away_team': 'BUF'},
+        ])
+        mock_nfl.import_schedules.return_value = mock_schedule_data
+
+        bye_weeks = load_bye_weeks(2024)
+
+        assert bye_weeks == {'BAL': 2, 'BUF': 1, 'KC': 4}
+        assert bye_weeks == opponent_matrix(mock_schedule_data, 2024).bye_weeks()
+
+
+class TestOpponentMatrix:
+    """Test cases for the dense team x week opponent matrix."""
+
+    def test_opponents_and_byes(self):
+        """Both teams of a game see each other; byes are -1 and feed bye_weeks."""
+        from draftkit.connectors.schedule import opponent_matrix
+        schedule = pd.DataFrame([
+            {'season': 2024, 'week': 1, 'home_team': 'KC', 'away_team': 'BAL'},
+            {'season': 2024, 'week': 2, 'home_team': 'BUF', 'away_team': 'KC'},
+            {'season': 2023, 'week': 1, 'home_team': 'BUF', 'away_team': 'BAL'},
+        ])
+        matrix = opponent_matrix(schedule, 2024)
+
+        assert list(matrix.teams) == ['BAL', 'BUF', 'KC']
+        kc, bal, buf = matrix.team_index(['KC', 'BAL', 'BUF'])
+        assert matrix.opponents[kc].tolist() == [bal, buf]
+        assert matrix.opponents[bal].tolist() == [kc, -1]
+        assert matrix.bye_weeks() == {'BAL': 2, 'BUF': 1}
+        assert matrix.team_index(['FA'])[0] == -1
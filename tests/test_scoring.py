@@ -4,7 +4,8 @@ import tempfile
 from pathlib import Path
 
 from draftkit.transforms.scoring import (
-    ScoringConfig, _score_row, apply_scoring, apply_blended_scoring
+    ScoringConfig, _score_row, apply_scoring, apply_blended_scoring,
+    blend_stat_lines, score_stats, changed_scoring_groups, stat_contributions, decay_weights
 )
 
 
@@ -328,3 +329,67 @@ class TestApplyBlendedScoring:
         assert len(players) == 1
         player = players[0]
         assert player['bye'] == 6
+
+
+class TestBlendStatLines:
+    """Test cases for the scoring-independent stat-line blend."""
+
+    def test_blend_matches_points_blend(self):
+        """Scoring the blended stat line equals blending per-season points per game."""
+        weekly = pd.DataFrame(
+            [{'season': 2024, 'week': i, 'player_id': 'WR1', 'receptions': 6, 'receiving_yards': 80,
+              'receiving_tds': 1} for i in range(1, 11)] +
+            [{'season': 2023, 'week': i, 'player_id': 'WR1', 'receptions': 4, 'receiving_yards': 60,
+              'receiving_tds': 0} for i in range(1, 9)] +
+            [{'season': 2023, 'week': 1, 'player_id': 'WR2', 'receptions': 9, 'receiving_yards': 150,
+              'receiving_tds': 2}]
+        )
+        lines = blend_stat_lines(weekly, [2024, 2023], [0.75, 0.25], min_games=8)
+
+        assert list(lines.index) == ['WR1']  # WR2 below min games
+        cfg = ScoringConfig()
+        ppg = score_stats(lines, cfg)[0]
+        assert ppg == pytest.approx(0.75 * (6 + 8 + 6) + 0.25 * (4 + 6))
+
+    def test_changed_scoring_groups(self):
+        """Only scorers whose weights changed are reported."""
+        base = ScoringConfig()
+        assert changed_scoring_groups(base, ScoringConfig(rec=0.5)) == {'offense'}
+        assert changed_scoring_groups(base, ScoringConfig(dst_sack=2, k_xp=2)) == {'dst', 'kicker'}
+        assert changed_scoring_groups(base, ScoringConfig(teams=10, bench=4)) == set()
+
+    def test_stat_contributions_sum_to_score(self):
+        """The per-stat breakdown uses the kernel's weights and sums to the score."""
+        stats = pd.DataFrame({'passing_yards': [4000.0, 0.0], 'passing_tds': [30, 0], 'interceptions': [12, 0],
+                              'receptions': [0, 90], 'receiving_yards': [0, 1100]}, index=['QB1', 'WR1'])
+        cfg = ScoringConfig(rec=0.5)
+        contrib = stat_contributions(stats, cfg)
+
+        assert list(contrib.index) == ['QB1', 'WR1']
+        assert contrib.loc['QB1', 'interceptions'] == -24
+        assert contrib.loc['WR1', 'receptions'] == 45
+        assert list(contrib.sum(axis=1).round(2)) == list(score_stats(stats, cfg))
+
+    def test_decay_weights(self):
+        """Decay weights halve each season back and sum to one."""
+        assert decay_weights(3, 0.5) == pytest.approx([4 / 7, 2 / 7, 1 / 7])
+        assert decay_weights(10, 1.0) == pytest.approx([0.1] * 10)
+
+    def test_long_lookback_matches_per_season_blend(self):
+        """A 12-season blend equals the weighted mean of each season's per-game line."""
+        rows = []
+        for k, season in enumerate(range(2024, 2012, -1)):
+            games = 8 + k % 5
+            rows += [{'season': season, 'week': w, 'player_id': 'RB1', 'rushing_yards': 50 + 10 * k,
+                      'rushing_tds': k % 2} for w in range(1, games + 1)]
+        weekly = pd.DataFrame(rows)
+        years = list(range(2024, 2012, -1))
+        weights = decay_weights(12, 0.8)
+
+        lines = blend_stat_lines(weekly, years, weights, min_games=9)
+
+        kept = [(w, 50 + 10 * k, k % 2) for k, w in enumerate(weights) if 8 + k % 5 >= 9]
+        total = sum(w for w, _, _ in kept)
+        assert lines.loc['RB1', 'rushing_yards'] == pytest.approx(sum(w * y for w, y, _ in kept) / total)
+        assert lines.loc['RB1', 'rushing_tds'] == pytest.approx(sum(w * t for w, _, t in kept) / total)
+        assert lines.loc['RB1', 'receptions'] == 0
@@ -0,0 +1,205 @@
+import json
+import threading
+import time
+import urllib.request
+import urllib.error
+
+import numpy as np
+import pytest
+
+from draftkit.live.board import LiveBoard
+from draftkit.live.server import create_server
+from draftkit.transforms.scoring import ScoringConfig
+
+
+def _league():
+    cfg = ScoringConfig(teams=12, roster={'QB': 1, 'RB': 2, 'WR': 2, 'TE': 1, 'FLEX': 1, 'K': 1, 'DEF': 1},
+                        flex_positions=['RB', 'WR', 'TE'], bench=6)
+    rng = np.random.default_rng(0)
+    sizes = {'QB': 40, 'RB': 90, 'WR': 110, 'TE': 40, 'K': 32, 'DEF': 32}
+    base = {'QB': 380, 'RB': 300, 'WR': 300, 'TE': 220, 'K': 160, 'DEF': 150}
+    players = []
+    for pos, n in sizes.items():
+        pts = np.sort(base[pos] - np.cumsum(rng.uniform(1, 6, n)))[::-1]
+        for i, p in enumerate(pts):
+            players.append({'player_id': f'{pos}{i}', 'name': f'{pos} {i}', 'pos': pos, 'tm': 'FA',
+                            'points': float(p), 'tier': i // 8 + 1, 'bye': 5 + i % 9})
+    players.sort(key=lambda p: -p['points'])
+    for rank, p in enumerate(players, start=1):
+        p['overall_rank'] = rank
+    return cfg, players
+
+
+class TestLiveBoard:
+    """Test cases for incremental live-draft updates."""
+
+    def test_pick_follows_snake_and_updates_tiers(self):
+        """Picks go to the team on the clock and decrement tier counts."""
+        cfg, players = _league()
+        board = LiveBoard(players, cfg, slot=3)
+        rb = next(p for p in players if p['pos'] == 'RB')
+        before = board.snapshot()['players'][board.index[rb['player_id']]]['tier_left']
+
+        delta = board.pick(rb['player_id'])
+
+        assert delta['pick']['team'] == 0
+        assert delta['on_clock'] == 1
+        row = board.snapshot()['players'][board.index[rb['player_id']]]
+        assert row['drafted_by'] == 0
+        assert row['tier_left'] == before - 1
+        assert any(c['player_id'] == rb['player_id'] for c in delta['changed'])
+
+    def test_filled_starters_lower_replacement(self):
+        """Once the league's QB slots are spoken for, QB replacement climbs down the pool."""
+        cfg, players = _league()
+        board = LiveBoard(players, cfg)
+        qb_idx = board.by_pos['QB']
+        start_repl = board.repl[qb_idx[0]]
+
+        for i in qb_idx[:12]:
+            board.pick(board.ids[i])
+
+        assert board.repl[qb_idx[-1]] <= start_repl
+        assert board.vorp[qb_idx[12]] >= 0
+
+    def test_undo_restores_state(self):
+        """Undo returns every live field to its pre-pick value."""
+        cfg, players = _league()
+        board = LiveBoard(players, cfg, slot=5)
+        before = board.snapshot()
+
+        board.pick(players[0]['player_id'])
+        board.pick(players[1]['player_id'])
+        board.undo()
+        board.undo()
+
+        assert board.snapshot() == before
+
+    def test_recommendations_carry_bye_gain(self):
+        """A second QB covers the starter's bye week only if their byes differ."""
+        cfg, players = _league()
+        board = LiveBoard(players, cfg, slot=1)
+        qbs = board.by_pos['QB']
+        board.pick(board.ids[qbs[0]], team=0)
+
+        _, gains = board.bye_coverage(0)
+        same = [i for i in qbs[1:] if board.players[i]['bye'] == board.players[qbs[0]]['bye']]
+        other = [i for i in qbs[1:] if board.players[i]['bye'] != board.players[qbs[0]]['bye']]
+        assert gains[same].max() == 0 and gains[other].min() == 1
+        assert board.coverage(0) == {'team': 0, 'coverage': 16, 'max_coverage': 9 * 17}
+        assert all('bye_gain' in r for r in board.recommendations(5))
+
+    def test_errors(self):
+        """Unknown and duplicate picks are rejected; empty undo too."""
+        cfg, players = _league()
+        board = LiveBoard(players, cfg)
+        with pytest.raises(KeyError):
+            board.pick('nobody')
+        board.pick(players[0]['player_id'])
+        with pytest.raises(ValueError):
+            board.pick(players[0]['player_id'])
+        board.undo()
+        with pytest.raises(ValueError):
+            board.undo()
+
+    def test_out_of_range_team_leaves_board_untouched(self):
+        """Bad team indexes raise ValueError before any state changes."""
+        cfg, players = _league()
+        board = LiveBoard(players, cfg)
+        before = board.snapshot()
+        pid = players[0]['player_id']
+        for team in (cfg.teams, -1, 1.5, '2'):
+            with pytest.raises(ValueError):
+                board.pick(pid, team=team)
+            with pytest.raises(ValueError):
+                board.keep(pid, team)
+        board.pick(pid, team=0)
+        with pytest.raises(ValueError):
+            board.move_player(pid, cfg.teams)
+        assert board.owner[0] == 0 and board.rosters[0] == [0]
+        board.undo()
+        assert board.snapshot() == before
+
+
+class TestDraftServer:
+    """Load test: replay a full 12-team draft over HTTP."""
+
+    def _post(self, base, path, payload=None):
+        data = json.dumps(payload or {}).encode()
+        req = urllib.request.Request(base + path, data=data, headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(req, timeout=5) as resp:
+            return json.loads(resp.read())
+
+    def _status(self, request):
+        try:
+            with urllib.request.urlopen(request, timeout=5) as resp:
+                return resp.status
+        except urllib.error.HTTPError as err:
+            return err.code
+
+    def test_bad_input_is_400(self):
+        """Out-of-range or non-numeric teams and query params answer 400 and change nothing."""
+        cfg, players = _league()
+        board = LiveBoard(players, cfg, slot=2)
+        server = create_server(board, port=0, auction_budget=200)
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        def post(path, payload):
+            data = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+            return self._status(urllib.request.Request(base + path, data=data,
+                                                       headers={'Content-Type': 'application/json'}))
+
+        try:
+            pid = players[0]['player_id']
+            for team in (cfg.teams, -1, 'x', 1.5, True):
+                assert post('/pick', {'player_id': pid, 'team': team}) == 400
+                assert post('/sale', {'player_id': pid, 'team': team, 'price': 10}) == 400
+            assert post('/sale', {'player_id': pid, 'team': 0, 'price': 'cheap'}) == 400
+            assert post('/pick', b'{not json') == 400
+            assert post('/pick', [pid]) == 400
+            for query in ('/recommendations?n=x', '/recommendations?n=-1', '/recommendations?team=x',
+                          f'/recommendations?team={cfg.teams}', '/coverage?team=-1', '/coverage?team=abc'):
+                assert self._status(base + query) == 400, query
+            assert self._status(base + '/recommendations?n=3&team=1') == 200
+            assert board.pick_number == 1 and (board.owner < 0).all()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_full_draft_latency(self):
+        """Every pick of a 12-team, 15-round draft answers with p99 under 50ms."""
+        cfg, players = _league()
+        board = LiveBoard(players, cfg, slot=7)
+        server = create_server(board, port=0)
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            with urllib.request.urlopen(base + '/board', timeout=5) as resp:
+                assert len(json.loads(resp.read())['players']) == len(players)
+
+            latencies = []
+            total = cfg.teams * board.rounds
+            for p in players[:total]:
+                start = time.perf_counter()
+                delta = self._post(base, '/pick', {'player_id': p['player_id']})
+                latencies.append((time.perf_counter() - start) * 1000)
+                assert delta['pick']['player_id'] == p['player_id']
+
+            assert board.team_on_clock() is None
+            assert np.percentile(latencies, 99) < 50
+
+            self._post(base, '/undo')
+            assert board.pick_number == total
+
+            with urllib.request.urlopen(base + '/coverage?team=6', timeout=5) as resp:
+                assert json.loads(resp.read())['coverage'] == board.coverage(6)['coverage']
+
+            with pytest.raises(urllib.error.HTTPError) as err:
+                self._post(base, '/pick', {'player_id': players[0]['player_id']})
+            assert err.value.code == 409
+        finally:
+            server.shutdown()
+            server.server_close()
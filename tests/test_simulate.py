@@ -0,0 +1,89 @@
+import pytest
+import numpy as np
+
+from draftkit.transforms.snake import snake_team_order, snake_pick_numbers
+from draftkit.transforms.simulate import simulate_availability, position_caps, starter_needs
+from draftkit.transforms.scoring import ScoringConfig
+
+
+def _board(n=60):
+    """Simple board cycling through positions, ranked 1..n."""
+    positions = ['RB', 'WR', 'WR', 'RB', 'QB', 'TE', 'K', 'DEF']
+    return [{'player_id': f'P{i}', 'name': f'Player {i}', 'pos': positions[i % len(positions)],
+             'overall_rank': i + 1} for i in range(n)]
+
+
+class TestSnake:
+    """Test cases for snake order helpers."""
+
+    def test_team_order(self):
+        """Snake order reverses every other round."""
+        order = snake_team_order(3, 3)
+        assert order.tolist() == [0, 1, 2, 2, 1, 0, 0, 1, 2]
+
+    def test_pick_numbers(self):
+        """Pick numbers for a middle slot in a 12-team league."""
+        assert snake_pick_numbers(12, 5, 4) == [5, 20, 29, 44]
+        assert snake_pick_numbers(12, 12, 2) == [12, 13]
+
+    def test_invalid_slot(self):
+        """Slot outside 1..teams raises."""
+        with pytest.raises(ValueError):
+            snake_pick_numbers(12, 13, 2)
+
+
+class TestSimulateAvailability:
+    """Test cases for the Monte Carlo simulator."""
+
+    def test_shape_and_bounds(self):
+        """Output is players x picks probabilities."""
+        players = _board()
+        probs = simulate_availability(players, teams=4, slot=2, rounds=5, n_sims=200, chunk_size=50)
+
+        assert probs.shape == (60, 5)
+        assert np.all((probs >= 0) & (probs <= 1))
+
+    def test_first_pick_everyone_available(self):
+        """Slot 1 sees the full board at its first pick."""
+        probs = simulate_availability(_board(), teams=4, slot=1, rounds=3, n_sims=100)
+        assert np.all(probs[:, 0] == 1.0)
+
+    def test_availability_decreases_over_picks(self):
+        """A player can only disappear as the draft goes on."""
+        probs = simulate_availability(_board(), teams=4, slot=3, rounds=5, n_sims=300)
+        assert np.all(np.diff(probs, axis=1) <= 1e-12)
+        # Top player is basically never there at the second pick
+        assert probs[0, 1] < 0.05
+
+    def test_adp_overrides_rank(self):
+        """A player with a late ADP survives longer than his board rank suggests."""
+        players = _board()
+        adp = {'P0': 40.0}
+        probs = simulate_availability(players, teams=4, slot=4, rounds=4, n_sims=300, adp=adp)
+        assert probs[0, 0] > 0.9
+
+    def test_deterministic_across_workers(self):
+        """Per-chunk seeds make results independent of the worker count."""
+        players = _board()
+        a = simulate_availability(players, teams=4, slot=2, rounds=4, n_sims=200, chunk_size=50, workers=1)
+        b = simulate_availability(players, teams=4, slot=2, rounds=4, n_sims=200, chunk_size=50, workers=2)
+        np.testing.assert_array_equal(a, b)
+
+    def test_empty_board(self):
+        """Empty board returns an empty matrix."""
+        assert simulate_availability([], teams=4, slot=1, rounds=3).shape == (0, 3)
+
+
+class TestRosterConstraints:
+    """Test cases for caps and needs derived from league settings."""
+
+    def test_caps_and_needs(self):
+        """Caps include flex/bench room; needs are dedicated starters."""
+        cfg = ScoringConfig(roster={'QB': 1, 'RB': 2, 'WR': 2, 'TE': 1, 'FLEX': 1, 'K': 1, 'DEF': 1},
+                            flex_positions=['RB', 'WR', 'TE'], bench=6)
+        caps = position_caps(cfg)
+        needs = starter_needs(cfg)
+
+        assert caps['RB'] == 2 + 1 + 3
+        assert caps['K'] == 1
+        assert needs == {'QB': 1, 'RB': 2, 'WR': 2, 'TE': 1, 'K': 1, 'DEF': 1, 'DST': 1}
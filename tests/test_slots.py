@@ -0,0 +1,108 @@
+import numpy as np
+
+from draftkit.transforms.slots import roster_slots, fill_slots, replacement_counts
+from draftkit.transforms.scoring import ScoringConfig
+from draftkit.transforms.tiers import compute_replacement_and_vorp
+
+
+def _pool(**counts):
+    """Descending point arrays per position, e.g. _pool(RB=30) -> RB: 300, 299, ..."""
+    return {pos: np.arange(300, 300 - n, -1, dtype=float) for pos, n in counts.items()}
+
+
+class TestRosterSlots:
+    """Test cases for roster slot parsing."""
+
+    def test_standard_roster(self):
+        """Test slot eligibility for a standard 1QB/FLEX roster."""
+        cfg = ScoringConfig(roster={'QB': 1, 'RB': 2, 'WR': 2, 'TE': 1, 'FLEX': 1, 'K': 1, 'DEF': 1},
+                            flex_positions=['RB', 'WR', 'TE'])
+        slots = {s.name: s for s in roster_slots(cfg)}
+
+        assert slots['FLEX'].eligible == ('RB', 'WR', 'TE')
+        assert slots['DEF'].eligible == ('DEF', 'DST')
+        assert slots['RB'].count == 2
+        assert 'BN' not in slots
+
+    def test_bench_and_custom_slots(self):
+        """Test bench slots and custom eligibility from YAML."""
+        cfg = ScoringConfig(roster={'QB': 1, 'WRT': 1, 'K': 1}, bench=5,
+                            slot_eligibility={'WRT': ['wr', 'te']})
+        slots = {s.name: s for s in roster_slots(cfg, include_bench=True)}
+
+        assert slots['WRT'].eligible == ('WR', 'TE')
+        assert slots['BN'].count == 5
+        assert not slots['BN'].starter
+        assert 'K' not in slots['BN'].eligible
+
+
+class TestFillSlots:
+    """Test cases for the greedy slot allocator."""
+
+    def test_flex_takes_best_remaining(self):
+        """FLEX should go to the best player left after dedicated slots."""
+        pool = {'RB': np.array([100.0, 90.0, 80.0]), 'WR': np.array([95.0, 50.0])}
+        cfg = ScoringConfig(roster={'RB': 1, 'WR': 1, 'FLEX': 1}, flex_positions=['RB', 'WR'])
+
+        taken, total = fill_slots(pool, roster_slots(cfg), teams=1)
+
+        assert taken == {'RB': 2, 'WR': 1}
+        assert total == 100 + 95 + 90
+
+    def test_superflex_counts(self):
+        """Superflex leagues should roster more QBs than 1QB leagues."""
+        pool = _pool(QB=40, RB=80, WR=80, TE=40)
+        base = ScoringConfig(teams=12, roster={'QB': 1, 'RB': 2, 'WR': 2, 'TE': 1, 'FLEX': 1})
+        sflex = ScoringConfig(teams=12, roster={'QB': 1, 'RB': 2, 'WR': 2, 'TE': 1, 'FLEX': 1, 'SUPERFLEX': 1})
+
+        assert replacement_counts(pool, base)['QB'] == 12
+        assert replacement_counts(pool, sflex)['QB'] > 12
+        assert sum(replacement_counts(pool, sflex).values()) == 12 * 8
+
+    def test_idp_slots(self):
+        """IDP slots fill from defensive positions only."""
+        pool = _pool(QB=20, DL=30, LB=30, DB=30)
+        cfg = ScoringConfig(teams=10, roster={'QB': 1, 'DL': 1, 'LB': 1, 'DB': 1, 'IDP': 2})
+
+        counts = replacement_counts(pool, cfg)
+
+        assert counts['QB'] == 10
+        assert counts['DL'] + counts['LB'] + counts['DB'] == 50
+
+    def test_short_pool(self):
+        """Allocator stops cleanly when the pool runs dry."""
+        pool = {'QB': np.array([300.0, 200.0])}
+        cfg = ScoringConfig(teams=12, roster={'QB': 1})
+
+        taken, total = fill_slots(pool, roster_slots(cfg), cfg.teams)
+
+        assert taken == {'QB': 2}
+        assert total == 500.0
+
+
+class TestReplacementWithSlots:
+    """Test VORP baselines driven by the allocator."""
+
+    def test_def_baseline_uses_def_slot(self):
+        """DEF players (pos 'DEF') get a real replacement level, not the top DEF."""
+        cfg = ScoringConfig(teams=2, roster={'DEF': 1})
+        players = [{'player_id': f'D{i}', 'name': f'D{i}', 'pos': 'DEF', 'points': 150 - i * 10}
+                   for i in range(5)]
+
+        result = compute_replacement_and_vorp(players, cfg)
+
+        top = [p for p in result if p['pos_rank'] == 1][0]
+        assert top['repl_pts'] == 140
+        assert top['vorp'] == 10
+
+    def test_include_bench_lowers_baseline(self):
+        """Bench depth pushes replacement deeper into the pool."""
+        cfg = ScoringConfig(teams=2, roster={'RB': 1}, bench=2)
+        players = [{'player_id': f'R{i}', 'name': f'R{i}', 'pos': 'RB', 'points': 200 - i * 10}
+                   for i in range(10)]
+
+        starters = compute_replacement_and_vorp([dict(p) for p in players], cfg)
+        bench = compute_replacement_and_vorp([dict(p) for p in players], cfg, include_bench=True)
+
+        assert starters[0]['repl_pts'] == 190
+        assert bench[0]['repl_pts'] == 150
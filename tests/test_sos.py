@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from draftkit.connectors.schedule import opponent_matrix
+from draftkit.transforms.sos import add_sos, dvp_table, matchup_multipliers, sos_ranks
+
+
+def _schedule():
+    """Two-week 2024 season for four teams (A-B, C-D then A-C, B-D)."""
+    return pd.DataFrame([
+        {'season': 2024, 'week': 1, 'home_team': 'A', 'away_team': 'B'},
+        {'season': 2024, 'week': 1, 'home_team': 'C', 'away_team': 'D'},
+        {'season': 2024, 'week': 2, 'home_team': 'A', 'away_team': 'C'},
+        {'season': 2024, 'week': 2, 'home_team': 'B', 'away_team': 'D'},
+    ])
+
+
+class TestDvpTable:
+    """Test cases for the defense-vs-position allowance table."""
+
+    def test_charges_points_to_the_opponent(self):
+        """Player-weeks are charged to the defense faced that week, relative to the league mean."""
+        points = pd.DataFrame([
+            # RB on A: 30 vs B (week 1), 10 vs C (week 2); RB on D: 20 vs C, 20 vs B
+            {'season': 2024, 'week': 1, 'position': 'RB', 'recent_team': 'A', 'weekly_points': 30.0},
+            {'season': 2024, 'week': 2, 'position': 'RB', 'recent_team': 'A', 'weekly_points': 10.0},
+            {'season': 2024, 'week': 1, 'position': 'RB', 'recent_team': 'D', 'weekly_points': 20.0},
+            {'season': 2024, 'week': 2, 'position': 'RB', 'recent_team': 'D', 'weekly_points': 20.0},
+            {'season': 2024, 'week': 19, 'position': 'RB', 'recent_team': 'A', 'weekly_points': 99.0},
+        ])
+        table = dvp_table(points, _schedule(), {2024: 1.0})
+
+        # RB points allowed per game: A 0, B 25, C 15, D 0; league 80 / 8 games = 10
+        assert table['RB'].tolist() == pytest.approx([0.0, 2.5, 1.5, 0.0])
+        assert table['QB'].tolist() == [1.0] * 4  # nothing scored: neutral
+
+
+class TestMatchups:
+    """Test cases for target-year matchup multipliers and sos ranks."""
+
+    def test_multipliers_byes_and_ranks(self):
+        """Multipliers index the opponent's row; byes are 0 and unknown teams neutral."""
+        schedule = pd.DataFrame([
+            {'season': 2025, 'week': 1, 'home_team': 'A', 'away_team': 'B'},
+            {'season': 2025, 'week': 2, 'home_team': 'A', 'away_team': 'C'},
+            {'season': 2025, 'week': 2, 'home_team': 'B', 'away_team': 'D'},
+        ])
+        matrix = opponent_matrix(schedule, 2025)
+        table = pd.DataFrame({'RB': [0.5, 2.0, 1.5, 0.8]}, index=['A', 'B', 'C', 'D'])
+
+        mult = matchup_multipliers(matrix, table, ['A', 'D', 'FA', 'A'], ['RB', 'RB', 'RB', 'K'])
+        np.testing.assert_allclose(mult, [[2.0, 1.5], [0.0, 2.0], [1.0, 1.0], [1.0, 1.0]])
+
+        sos, rank = sos_ranks(mult[:2], ['RB', 'RB'])
+        assert sos.tolist() == pytest.approx([1.75, 2.0])
+        assert rank.tolist() == [2, 1]
+
+    def test_add_sos_sets_offense_players(self):
+        """Only offense players on a scheduled team get sos fields."""
+        matrix = opponent_matrix(_schedule(), 2024)
+        table = pd.DataFrame({'RB': [1.0, 1.2, 0.8, 1.0]}, index=['A', 'B', 'C', 'D'])
+        players = [{'pos': 'RB', 'tm': 'A'}, {'pos': 'RB', 'tm': 'FA'}, {'pos': 'K', 'tm': 'A'}]
+        add_sos(players, matrix, table)
+
+        assert players[0] == {'pos': 'RB', 'tm': 'A', 'sos': 1.0, 'sos_rank': 1}
+        assert 'sos' not in players[1] and 'sos' not in players[2]
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from draftkit.transforms.scoring import ScoringConfig, apply_blended_scoring
+from draftkit.transforms.sweep import Variant, rank_changes, run_sweep, variant_grid
+from draftkit.transforms.tiers import compute_replacement_and_vorp
+
+
+def _data(players=48, seasons=(2022, 2023, 2024), seed=0):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for season in seasons:
+        for i in range(players):
+            pos = ['QB', 'RB', 'WR', 'TE'][i % 4]
+            games = int(rng.integers(3, 18))
+            for week in range(1, games + 1):
+                rows.append({'season': season, 'week': week, 'player_id': f'P{i}', 'position': pos,
+                             'receptions': rng.poisson(4), 'receiving_yards': rng.normal(50, 20),
+                             'passing_yards': rng.normal(230, 40) if pos == 'QB' else 0.0})
+    weekly = pd.DataFrame(rows)
+    rosters = pd.DataFrame({'player_id': [f'P{i}' for i in range(players)],
+                            'player_name': [f'Player {i}' for i in range(players)],
+                            'position': [['QB', 'RB', 'WR', 'TE'][i % 4] for i in range(players)],
+                            'team': 'KC'})
+    return weekly, rosters
+
+
+class TestVariantGrid:
+    """Test cases for the sweep grid."""
+
+    def test_product_with_base_first(self):
+        """Every combination is present and the first values form the base variant."""
+        grid = variant_grid([[0.6, 0.3, 0.1], [1, 1, 2]], [6, 8], [{'QB': 0.9}, {}], [10, 12, 14])
+        assert len(grid) == 24
+        assert grid[0].blend == pytest.approx((0.6, 0.3, 0.1))
+        assert grid[0] == Variant(grid[0].blend, 6, (('QB', 0.9),), 10)
+        assert grid[-1].blend == (0.25, 0.25, 0.5)
+        assert len({v.label for v in grid}) == 24
+
+
+class TestRunSweep:
+    """Test cases for ranking many variants from one dataset."""
+
+    def test_matches_build_ranking(self):
+        """Each variant ranks the board exactly like build's scoring + VORP stages."""
+        weekly, rosters = _data()
+        years = [2024, 2023, 2022]
+        cfg = ScoringConfig(roster={'QB': 1, 'RB': 2, 'WR': 2, 'TE': 1, 'FLEX': 1}, teams=4)
+        variants = variant_grid([[0.6, 0.3, 0.1], [0.2, 0.3, 0.5]], [4, 10], [{'QB': 0.9}], [2, 4])
+        players, ranks = run_sweep(weekly, rosters, years, cfg, variants)
+        assert ranks.shape == (len(rosters), 8)
+
+        for variant in variants:
+            board = apply_blended_scoring(weekly, rosters, cfg, years, list(variant.blend), variant.min_games)
+            cfg.teams = variant.teams
+            expected = {p['player_id']: p['overall_rank']
+                        for p in compute_replacement_and_vorp(board, cfg, dict(variant.onesie))}
+            got = ranks[variant.label].dropna()
+            assert got.to_dict() == expected
+
+    def test_rank_changes(self):
+        """The base row is all zeros; a reordered variant reports its movers."""
+        players = pd.DataFrame({'key': list('abcd'), 'name': ['A', 'B', 'C', 'D']})
+        ranks = pd.DataFrame({'base': [1.0, 2, 3, 4], 'swap': [3.0, 2, 1, np.nan]}, index=list('abcd'))
+        changes = rank_changes(players, ranks, top=2).set_index('variant')
+        assert changes.loc['base'].tolist() == [0.0, 0, '', '']
+        assert changes.loc['swap', 'turnover'] == 1
+        assert changes.loc['swap', 'riser'] == 'C +2'
+        assert changes.loc['swap', 'faller'] == 'A -2'
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from draftkit.connectors.tensor import build_tensor, load_tensor, load_tensor_with_cache, save_tensor
+from draftkit.transforms.scoring import ScoringConfig, score_stats
+
+
+def _weekly():
+    rows = []
+    for season in (2023, 2024):
+        for pid, pos, weeks in (('QB1', 'QB', range(1, 18)), ('WR1', 'WR', range(3, 12))):
+            for week in weeks:
+                rows.append({'season': season, 'week': week, 'player_id': pid, 'position': pos,
+                             'passing_yards': 250.0 + week if pos == 'QB' else 0.0,
+                             'receptions': 0 if pos == 'QB' else week % 5,
+                             'receiving_yards': 0.0 if pos == 'QB' else 9.5 * week})
+    return pd.DataFrame(rows)
+
+
+class TestWeeklyTensor:
+    """Test cases for the dense weekly tensor."""
+
+    def test_layout_and_accessors(self):
+        """Rows land at [player, season, week - 1]; the mask marks played weeks."""
+        weekly = _weekly()
+        tensor = build_tensor(weekly)
+
+        assert tensor.values.dtype == np.float32
+        assert tensor.values.shape == (2, 2, 22, 10)
+        assert tensor.games().tolist() == [[17, 17], [9, 9]]
+        wr = tensor.player('WR1', 2024)
+        assert wr[2, tensor.stats.index('receiving_yards')] == pytest.approx(28.5)
+        assert not tensor.played[tensor.codes(['WR1'])[0], 1, 0]
+
+        values, played = tensor.select(['WR1', 'QB1'], [2024])
+        assert values.shape == (2, 1, 22, 10) and played[0, 0].sum() == 9
+        with pytest.raises(KeyError):
+            tensor.select(['XX'], [2024])
+
+    def test_scoring_runs_on_tensor(self):
+        """Scoring the tensor matches scoring the weekly rows."""
+        weekly = _weekly()
+        cfg = ScoringConfig()
+        tensor = build_tensor(weekly)
+        points = tensor.points(cfg)
+
+        expected = pd.Series(score_stats(weekly, cfg)).groupby([weekly['player_id'], weekly['season']]).sum()
+        for (pid, season), total in expected.items():
+            code, s = tensor.codes([pid])[0], tensor.season_index([season])[0]
+            assert points[code, s].sum() == pytest.approx(total, rel=1e-5)
+
+    def test_memmap_round_trip_and_cache(self, tmp_path):
+        """Saved tensors reload memory-mapped; the cache is reused until the weekly file changes."""
+        weekly = _weekly()
+        tensor = build_tensor(weekly)
+        save_tensor(tensor, tmp_path, 'demo')
+        loaded = load_tensor(tmp_path, 'demo')
+        assert isinstance(loaded.values, np.memmap)
+        np.testing.assert_array_equal(loaded.values, tensor.values)
+        assert list(loaded.positions) == ['QB', 'WR']
+
+        calls = []
+
+        def loader(years, cache_dir):
+            calls.append(years)
+            return weekly
+
+        load_tensor_with_cache([2023, 2024], tmp_path, loader)
+        cached = load_tensor_with_cache([2024, 2023], tmp_path, loader)
+        assert calls == [[2023, 2024]]
+        np.testing.assert_array_equal(cached.played, tensor.played)
@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from draftkit.transforms.scoring import ScoringConfig, blend_stat_lines
+from draftkit.transforms.tune import (load_tuned, season_arrays, simplex_lstsq, tune_blend,
+                                      tuned_stat_lines, write_tuned)
+
+
+def _weekly(seasons, weights, players=80, games=16, seed=0):
+    """Per-game points follow sum_s weights[s] * ppg(season - 1 - s) exactly (1 pt per 10 rush yards)."""
+    rng = np.random.default_rng(seed)
+    lookback = len(weights)
+    ppg = {s: rng.uniform(5, 20, players) for s in seasons[:lookback]}
+    for s in seasons[lookback:]:
+        ppg[s] = sum(w * ppg[s - 1 - k] for k, w in enumerate(weights))
+    rows = []
+    for season in seasons:
+        for i in range(players):
+            pos = ['QB', 'RB', 'WR', 'TE'][i % 4]
+            for week in range(1, games + 1):
+                rows.append({'season': season, 'week': week, 'player_id': f'P{i}', 'position': pos,
+                             'rushing_yards': ppg[season][i] * 10})
+    return pd.DataFrame(rows)
+
+
+class TestSeasonArrays:
+    """Test cases for the players x seasons reduction."""
+
+    def test_regular_season_follows_the_season(self):
+        """Week 18 is a playoff game before 2021 and a regular-season game since."""
+        weekly = pd.DataFrame([{'season': season, 'week': week, 'player_id': 'P0', 'position': 'RB',
+                                'rushing_yards': 100.0}
+                               for season in (2020, 2021) for week in (1, 17, 18, 19)])
+        arrays = season_arrays(weekly, [2020, 2021], ScoringConfig())
+
+        assert arrays['games'].tolist() == [[4, 4]]
+        assert arrays['reg_games'].tolist() == [[2, 3]]
+        np.testing.assert_allclose(arrays['reg_points'], [[20.0, 30.0]])
+
+
+class TestSimplexLstsq:
+    """Test cases for the constrained least-squares fit."""
+
+    def test_recovers_weights_on_simplex(self):
+        """Exact data gives back the true weights; the result is non-negative and sums to one."""
+        rng = np.random.default_rng(1)
+        H = rng.uniform(0, 20, (200, 3))
+        w = simplex_lstsq(H, H @ np.array([0.5, 0.3, 0.2]))
+        np.testing.assert_allclose(w, [0.5, 0.3, 0.2], atol=1e-4)
+
+        w = simplex_lstsq(H, -H[:, 0])
+        assert (w >= 0).all() and w.sum() == pytest.approx(1.0)
+        assert simplex_lstsq(H[:3], H[:3, 0]) is None
+
+
+class TestTuneBlend:
+    """Test cases for the per-position optimizer."""
+
+    def test_fits_generating_weights(self):
+        """Weights used to generate the data are found for every position."""
+        weekly = _weekly(list(range(2010, 2021)), [0.7, 0.3])
+        tuned = tune_blend(weekly, list(range(2014, 2021)), 2, ScoringConfig(), [4, 8], [0.5, 1.0],
+                           baseline={'blend': [0.5, 0.5], 'min_games': 8})
+        assert tuned['lookback'] == 2 and tuned['seasons'] == [2014, 2020]
+        for entry in [tuned['default'], *tuned['positions'].values()]:
+            assert entry['method'] == 'lsq'
+            np.testing.assert_allclose(entry['blend'], [0.7, 0.3], atol=1e-3)
+            assert entry['rmse'] < 1e-2 < entry['baseline_rmse']
+        assert sorted(tuned['positions']) == ['QB', 'RB', 'TE', 'WR']
+
+
+class TestTunedFile:
+    """Test cases for the YAML round trip and build-side blending."""
+
+    def test_round_trip_and_per_position_lines(self, tmp_path):
+        """build reads the file back and blends each position with its own weights."""
+        weekly = _weekly(list(range(2018, 2021)), [0.5, 0.5], players=8)
+        tuned = {'lookback': 2, 'seasons': [2015, 2020],
+                 'default': {'blend': [0.5, 0.5], 'min_games': 8},
+                 'positions': {'QB': {'blend': [1.0, 0.0], 'min_games': 8}}}
+        loaded = load_tuned(write_tuned(tuned, tmp_path / 'tuned.yml'))
+        assert loaded == tuned
+
+        positions = weekly.drop_duplicates('player_id').set_index('player_id')['position']
+        lines = tuned_stat_lines(weekly, [2020, 2019], loaded, positions)
+        qbs = positions[positions == 'QB'].index
+        only_last = blend_stat_lines(weekly, [2020, 2019], [1.0, 0.0], 8)
+        even = blend_stat_lines(weekly, [2020, 2019], [0.5, 0.5], 8)
+        pd.testing.assert_frame_equal(lines.loc[qbs], only_last.loc[qbs])
+        others = positions.index.difference(qbs)
+        pd.testing.assert_frame_equal(lines.loc[others], even.loc[others])
+
+    def test_rejects_wrong_length(self, tmp_path):
+        """Weights that don't match the lookback are an error."""
+        path = tmp_path / 'bad.yml'
+        path.write_text("lookback: 3\ndefault: {blend: [0.5, 0.5], min_games: 8}\n")
+        with pytest.raises(ValueError):
+            load_tuned(path)
@@ -0,0 +1,56 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from draftkit.connectors.schedule import opponent_matrix
+from draftkit.exports.weekly import weekly_projection_table, write_weekly
+
+
+def _matrix():
+    """Three-week season: A plays B then C, byes in week 3; B is off in week 2."""
+    schedule = pd.DataFrame([
+        {'season': 2025, 'week': 1, 'home_team': 'A', 'away_team': 'B'},
+        {'season': 2025, 'week': 2, 'home_team': 'C', 'away_team': 'A'},
+        {'season': 2025, 'week': 3, 'home_team': 'B', 'away_team': 'C'},
+    ])
+    return opponent_matrix(schedule, 2025)
+
+
+def _players():
+    return [{'player_id': 'RB1', 'name': 'Back', 'pos': 'RB', 'tm': 'A', 'points': 170.0},
+            {'name': 'Some K', 'pos': 'K', 'tm': 'B', 'points': 34.0},
+            {'player_id': 'WR9', 'name': 'Free', 'pos': 'WR', 'tm': 'FA', 'points': 17.0}]
+
+
+class TestWeeklyProjectionTable:
+    """Test cases for the players x weeks projection side file."""
+
+    def test_points_per_game_and_byes(self):
+        """Every week is points / 17, zeroed on the team's bye; unscheduled teams play every week."""
+        table = weekly_projection_table(_players(), _matrix())
+
+        assert list(table.columns) == ['player_id', 'name', 'pos', 'tm', 'w1', 'w2', 'w3']
+        np.testing.assert_allclose(table[['w1', 'w2', 'w3']].to_numpy(),
+                                   [[10.0, 10.0, 0.0], [2.0, 0.0, 2.0], [1.0, 1.0, 1.0]], rtol=1e-6)
+        assert table['w1'].dtype == np.float32
+
+    def test_matchup_multipliers(self):
+        """A dvp table scales weeks by the opponent's allowance at the position."""
+        dvp = pd.DataFrame({'RB': [1.0, 1.2, 0.8]}, index=['A', 'B', 'C'])
+        table = weekly_projection_table(_players(), _matrix(), dvp)
+
+        assert table.loc[0, ['w1', 'w2', 'w3']].tolist() == pytest.approx([12.0, 8.0, 0.0])
+        assert table.loc[1, ['w1', 'w2', 'w3']].tolist() == pytest.approx([2.0, 0.0, 2.0])  # K: byes only
+
+    def test_parquet_and_columnar_json(self, tmp_path):
+        """Both formats keep ids and board order."""
+        table = weekly_projection_table(_players(), _matrix())
+
+        parquet = write_weekly(table, tmp_path / "weekly.parquet")
+        assert list(pd.read_parquet(parquet)['name']) == ['Back', 'Some K', 'Free']
+
+        data = json.loads(write_weekly(table, tmp_path / "weekly.json").read_text())
+        assert data['player_id'] == ['RB1', None, 'WR9']
+        assert data['w2'] == [10.0, 0.0, 1.0]